@@ -7,20 +7,42 @@ exibe a janela principal.
 
 import sys
 import os
-
-from dotenv import load_dotenv
-
-# Carregar variáveis de ambiente
-load_dotenv()
+from typing import TYPE_CHECKING
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 
-from src.presentation.main_window import MainWindow
 from src.presentation.tema import Tema
+from src.infrastructure.config.env import carregar_env
+
+if TYPE_CHECKING:
+    from src.presentation.main_window import MainWindow
+
+
+def bootstrap() -> "MainWindow":
+    """
+    Cria e exibe a janela principal.
+
+    Deve ser chamada depois que o ``QApplication`` existe:
+    a janela (e, com ela, PDF, gateways de IA e relatórios)
+    só é importada aqui, para que o custo de importação não
+    atrase a criação do app.
+
+    Returns:
+        Janela principal exibida
+    """
+    from src.presentation.main_window import MainWindow
+
+    window = MainWindow()
+    window.show()
+    return window
+
 
 def main() -> None:
     """Ponto de entrada principal da aplicação."""
+    # Carregar variáveis de ambiente
+    carregar_env()
+
     # Habilitar High DPI
     os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
 
@@ -35,8 +57,7 @@ def main() -> None:
     app.setStyleSheet(Tema.stylesheet())
 
     # Criar e exibir janela principal
-    window = MainWindow()
-    window.show()
+    window = bootstrap()  # noqa: F841 - manter referência
 
     sys.exit(app.exec())
 
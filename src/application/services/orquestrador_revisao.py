@@ -5,6 +5,7 @@ Serviço de alto nível que expõe operações
 simplificadas para a camada de apresentação.
 """
 
+import asyncio
 from typing import Callable, Optional, Dict, Any, List
 
 from ...core.interfaces.services.i_pdf_processor import (
@@ -44,6 +45,7 @@ class OrquestradorRevisao:
 
     Attributes:
         _logger: Sistema de logging
+        _use_case: Pipeline reutilizado entre chamadas
     """
 
     def __init__(
@@ -73,16 +75,15 @@ class OrquestradorRevisao:
             logger: Sistema de logging
         """
         self._logger = logger
-        self._pdf_processor = pdf_processor
-        self._agentes_revisores = agentes_revisores
-        self._agente_validador = agente_validador
-        self._agente_consistencia = (
-            agente_consistencia
-        )
-        self._texto_repo = texto_repo
-        self._config_repo = config_repo
-        self._geradores_relatorio = (
-            geradores_relatorio
+        self._use_case = ProcessarTextoUseCase(
+            pdf_processor=pdf_processor,
+            agentes_revisores=agentes_revisores,
+            agente_validador=agente_validador,
+            agente_consistencia=agente_consistencia,
+            texto_repo=texto_repo,
+            config_repo=config_repo,
+            geradores_relatorio=geradores_relatorio,
+            logger=logger,
         )
 
     async def processar_texto(
@@ -93,6 +94,10 @@ class OrquestradorRevisao:
             Callable[[ProgressoDTO], None]
         ] = None,
         check_cancel: Optional[Callable[[], None]] = None,
+        fila_progresso: Optional[
+            "asyncio.Queue[ProgressoDTO]"
+        ] = None,
+        evento_cancelamento: Optional[asyncio.Event] = None,
     ) -> ProcessarTextoOutputDTO:
         """
         Processa um texto estruturado completo.
@@ -104,6 +109,8 @@ class OrquestradorRevisao:
             formatos: Formatos de relatório desejados
             callback_progresso: Callback para progresso
             check_cancel: Callback para verificar cancelamento
+            fila_progresso: Fila limitada para progresso
+            evento_cancelamento: Evento de cancelamento
 
         Returns:
             DTO com resultado do processamento
@@ -111,26 +118,15 @@ class OrquestradorRevisao:
         if formatos is None:
             formatos = ["markdown"]
 
-        use_case = ProcessarTextoUseCase(
-            pdf_processor=self._pdf_processor,
-            agentes_revisores=self._agentes_revisores,
-            agente_validador=self._agente_validador,
-            agente_consistencia=(
-                self._agente_consistencia
-            ),
-            texto_repo=self._texto_repo,
-            config_repo=self._config_repo,
-            geradores_relatorio=(
-                self._geradores_relatorio
-            ),
-            logger=self._logger,
-            callback_progresso=callback_progresso,
-            check_cancel=check_cancel,
-        )
-
         input_dto = ProcessarTextoInputDTO(
             caminho_arquivo=caminho_arquivo,
             formatos_relatorio=formatos,
         )
 
-        return await use_case.executar(input_dto)
+        return await self._use_case.executar(
+            input_dto,
+            callback_progresso=callback_progresso,
+            check_cancel=check_cancel,
+            fila_progresso=fila_progresso,
+            evento_cancelamento=evento_cancelamento,
+        )
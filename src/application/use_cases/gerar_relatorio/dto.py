@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GerarRelatorioInputDTO:
     """
     DTO de entrada para geração de relatório.
@@ -27,7 +27,7 @@ class GerarRelatorioInputDTO:
     incluir_metricas: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GerarRelatorioOutputDTO:
     """
     DTO de saída da geração de relatório.
@@ -5,8 +5,9 @@ Orquestra a geração de relatórios de revisão
 em diferentes formatos de saída.
 """
 
+import asyncio
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from ....core.entities.texto_estruturado import TextoEstruturado
 from ....core.entities.relatorio import Relatorio
@@ -24,6 +25,12 @@ from .dto import (
     GerarRelatorioOutputDTO,
 )
 
+# Posição de cada formato conhecido na tabela de geradores
+_INDICE_FORMATO: Dict[str, int] = {
+    formato.value: indice
+    for indice, formato in enumerate(FormatoRelatorio)
+}
+
 
 class GerarRelatorioUseCase:
     """
@@ -34,6 +41,7 @@ class GerarRelatorioUseCase:
 
     Attributes:
         _geradores: Mapa de geradores por formato
+        _tabela: Geradores na ordem de FormatoRelatorio
         _logger: Sistema de logging
     """
 
@@ -50,8 +58,26 @@ class GerarRelatorioUseCase:
             logger: Sistema de logging
         """
         self._geradores = geradores
+        self._tabela: tuple = tuple(
+            geradores.get(formato.value)
+            for formato in FormatoRelatorio
+        )
         self._logger = logger
 
+    def _obter_gerador(
+        self, formato: str
+    ) -> Optional[IReportGenerator]:
+        """
+        Resolve o gerador de um formato.
+
+        Formatos de ``FormatoRelatorio`` usam a tabela
+        pré-calculada; chaves extras caem no dicionário.
+        """
+        indice = _INDICE_FORMATO.get(formato)
+        if indice is not None:
+            return self._tabela[indice]
+        return self._geradores.get(formato)
+
     async def executar(
         self,
         texto: TextoEstruturado,
@@ -77,8 +103,8 @@ class GerarRelatorioUseCase:
             f"'{texto.nome_arquivo}'"
         )
 
-        gerador = self._geradores.get(formato)
-        if not gerador:
+        gerador = self._obter_gerador(formato)
+        if gerador is None:
             formatos = list(self._geradores.keys())
             raise ValueError(
                 f"Formato '{formato}' não suportado. "
@@ -90,6 +116,90 @@ class GerarRelatorioUseCase:
             parents=True, exist_ok=True
         )
 
+        return self._gerar_e_salvar(
+            gerador, texto, diretorio_saida
+        )
+
+    async def executar_multi(
+        self,
+        texto: TextoEstruturado,
+        formatos: List[str],
+        diretorio_saida: str = "./output",
+    ) -> Dict[str, str]:
+        """
+        Gera relatórios em vários formatos em paralelo.
+
+        Cada gerador roda em thread própria; formatos
+        não suportados são registrados e ignorados.
+
+        Args:
+            texto: Texto processado
+            formatos: Formatos desejados
+            diretorio_saida: Diretório de saída
+
+        Returns:
+            Mapa formato -> caminho do arquivo gerado
+        """
+        selecionados = []
+        for formato in dict.fromkeys(formatos):
+            gerador = self._obter_gerador(formato)
+            if gerador is not None:
+                selecionados.append((formato, gerador))
+            else:
+                self._logger.warning(
+                    f"Formato ignorado: '{formato}' não "
+                    f"suportado. Disponíveis: "
+                    f"{list(self._geradores.keys())}"
+                )
+        if not selecionados:
+            return {}
+
+        self._logger.info(
+            f"Gerando relatórios "
+            f"{[formato for formato, _ in selecionados]} "
+            f"para '{texto.nome_arquivo}'"
+        )
+
+        # Garantir que diretório existe (uma única vez)
+        Path(diretorio_saida).mkdir(
+            parents=True, exist_ok=True
+        )
+
+        caminhos = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._gerar_e_salvar,
+                    gerador,
+                    texto,
+                    diretorio_saida,
+                )
+                for _, gerador in selecionados
+            )
+        )
+        return {
+            formato: caminho
+            for (formato, _), caminho in zip(
+                selecionados, caminhos
+            )
+        }
+
+    def _gerar_e_salvar(
+        self,
+        gerador: IReportGenerator,
+        texto: TextoEstruturado,
+        diretorio_saida: str,
+    ) -> str:
+        """
+        Gera e grava um relatório (bloqueante).
+
+        Args:
+            gerador: Gerador do formato
+            texto: Texto processado
+            diretorio_saida: Diretório já existente
+
+        Returns:
+            Caminho do arquivo gerado
+        """
         # Gerar relatório
         relatorio = gerador.gerar(texto)
 
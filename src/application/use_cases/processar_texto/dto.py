@@ -6,12 +6,16 @@ saída e progresso do processamento de textos.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import Callable, List, Optional, Dict, Any, Mapping
 
 from ....core.entities.texto_estruturado import TextoEstruturado
 
+# Sentinela imutável compartilhada por ProgressoDTO sem detalhes
+_DETALHES_VAZIOS: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ProcessarTextoInputDTO:
     """
     DTO de entrada para processamento de texto.
@@ -31,31 +35,49 @@ class ProcessarTextoInputDTO:
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessarTextoOutputDTO:
     """
     DTO de saída do processamento de texto.
 
+    As métricas são calculadas só no primeiro acesso a
+    ``metricas``; quem não as consulta não paga o custo.
+
     Attributes:
         texto: Texto processado
         relatorios: Caminhos dos relatórios gerados
-        metricas: Métricas do processamento
         sucesso: Se o processamento foi bem-sucedido
         mensagem: Mensagem de resultado
+        calcular_metricas: Função que produz as métricas
     """
 
     texto: Optional[TextoEstruturado] = None
     relatorios: Dict[str, str] = field(
         default_factory=dict
     )
-    metricas: Dict[str, Any] = field(
-        default_factory=dict
-    )
     sucesso: bool = True
     mensagem: str = ""
+    calcular_metricas: Optional[
+        Callable[[], Dict[str, Any]]
+    ] = field(default=None, repr=False, compare=False)
+    _metricas: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def metricas(self) -> Dict[str, Any]:
+        """Métricas do processamento (calculadas sob demanda)."""
+        if self._metricas is None:
+            metricas = (
+                self.calcular_metricas()
+                if self.calcular_metricas is not None
+                else {}
+            )
+            object.__setattr__(self, "_metricas", metricas)
+        return self._metricas
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProgressoDTO:
     """
     DTO para notificação de progresso.
@@ -64,12 +86,16 @@ class ProgressoDTO:
         etapa: Nome da etapa atual
         percentual: Percentual de conclusão (0-100)
         mensagem: Mensagem descritiva do progresso
-        detalhes: Detalhes adicionais
+        detalhes: Detalhes adicionais (somente leitura;
+            vazio compartilhado quando não informado)
+        somente_log: A mensagem vai só para o log, sem
+            repintar barra e rótulo
     """
 
     etapa: str
     percentual: float
     mensagem: str
-    detalhes: Dict[str, Any] = field(
-        default_factory=dict
+    detalhes: Mapping[str, Any] = field(
+        default_factory=lambda: _DETALHES_VAZIOS
     )
+    somente_log: bool = False
@@ -6,8 +6,24 @@ desde a leitura do arquivo até a geração dos relatórios.
 """
 
 import asyncio
+import functools
+import time
+from collections import deque
 from pathlib import Path
-from typing import Callable, Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ....core.entities.texto_estruturado import TextoEstruturado
 from ....core.entities.secao import Secao
@@ -36,6 +52,9 @@ from ....core.validators.texto_validator import (
 from ....core.exceptions.texto_exceptions import (
     TextoInvalidoException,
 )
+from ....core.exceptions.revisao_exceptions import (
+    ProcessamentoCanceladoException,
+)
 from ..revisar_secao.revisar_secao_use_case import (
     RevisarSecaoUseCase,
 )
@@ -51,6 +70,212 @@ from .dto import (
     ProgressoDTO,
 )
 
+T = TypeVar("T")
+
+# Fase de revisão e seções que ela recebe de uma vez
+_TarefaRevisao = Tuple[RevisarSecaoUseCase, List[Secao]]
+
+# Revisões (agente × seção) simultâneas quando não configurado
+MAX_SECOES_PARALELAS_PADRAO = 3
+
+# Tokens estimados (chars / 4) por lote de seções numa só
+# chamada de revisão; 0 desativa o agrupamento
+TOKENS_LOTE_PADRAO = 2000
+
+# Intervalo mínimo entre atualizações da barra para a mesma
+# etapa e o mesmo percentual (segundos)
+INTERVALO_PROGRESSO_SEG = 0.05
+
+# Prefixo das mensagens de início/fim de etapa, nunca omitidas
+MARCADOR_ETAPA = "━━━"
+
+# Nomes de exibição das fases de revisão
+NOMES_AMIGAVEIS = MappingProxyType({
+    "revisor_revisao_gramatical": "Revisão Gramatical",
+    "revisor_revisao_tecnica": "Revisão Técnica",
+    "revisor_revisao_estrutural": "Revisão Estrutural",
+    "revisor_multiplo": "Revisão Gramatical + Técnica",
+})
+
+
+class _ContextoExecucao:
+    """
+    Estado de uma única execução do pipeline.
+
+    Reúne o que varia por chamada (callbacks, fila de
+    progresso, evento de cancelamento) e o estado da
+    limitação de progresso. Cada ``executar`` cria o seu,
+    então execuções simultâneas na mesma instância do caso
+    de uso não interferem entre si.
+
+    Attributes:
+        ultimo_percentual: Último percentual notificado
+    """
+
+    __slots__ = (
+        "_callback_progresso",
+        "_check_cancel",
+        "_fila_progresso",
+        "_evento_cancelamento",
+        "ultimo_percentual",
+        "_ultima_etapa",
+        "_ultima_notificacao",
+        "_excedentes",
+        "_escoamento",
+    )
+
+    def __init__(
+        self,
+        callback_progresso: Optional[
+            Callable[[ProgressoDTO], None]
+        ] = None,
+        check_cancel: Optional[Callable[[], None]] = None,
+        fila_progresso: Optional[
+            "asyncio.Queue[ProgressoDTO]"
+        ] = None,
+        evento_cancelamento: Optional[asyncio.Event] = None,
+    ) -> None:
+        self._callback_progresso = callback_progresso
+        self._check_cancel = check_cancel
+        self._fila_progresso = fila_progresso
+        self._evento_cancelamento = evento_cancelamento
+        self.ultimo_percentual: float = 0
+        self._ultima_etapa = ""
+        self._ultima_notificacao = 0.0
+        # Notificações que não couberam na fila, em ordem
+        self._excedentes: Deque[ProgressoDTO] = deque()
+        self._escoamento: Optional["asyncio.Future[None]"] = None
+
+    def verificar_cancelamento(self) -> None:
+        """Verifica se cancelamento foi solicitado."""
+        if (
+            self._evento_cancelamento is not None
+            and self._evento_cancelamento.is_set()
+        ):
+            raise ProcessamentoCanceladoException()
+        if self._check_cancel:
+            self._check_cancel()
+
+    async def aguardar(self, coro: Awaitable[T]) -> T:
+        """
+        Aguarda corrotina interrompível por cancelamento.
+
+        Sem evento de cancelamento, equivale a ``await``.
+        Com evento, a tarefa é cancelada assim que ele
+        for sinalizado, sem esperar a resposta da IA.
+
+        Args:
+            coro: Corrotina a aguardar
+
+        Returns:
+            Resultado da corrotina
+
+        Raises:
+            ProcessamentoCanceladoException: Se cancelado
+        """
+        evento = self._evento_cancelamento
+        if evento is None:
+            return await coro
+
+        tarefa = asyncio.ensure_future(coro)
+        espera = asyncio.ensure_future(evento.wait())
+        try:
+            await asyncio.wait(
+                {tarefa, espera},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            espera.cancel()
+            if not tarefa.done():
+                tarefa.cancel()
+                await asyncio.gather(
+                    tarefa, return_exceptions=True
+                )
+
+        if tarefa.cancelled():
+            raise ProcessamentoCanceladoException()
+        return tarefa.result()
+
+    def notificar(
+        self,
+        etapa: str,
+        percentual: float,
+        mensagem: str,
+    ) -> None:
+        """
+        Notifica progresso via fila e/ou callback.
+
+        Com a fila limitada cheia, nada é descartado: a
+        notificação aguarda, em ordem, numa tarefa que a
+        entrega quando houver espaço, e o pipeline nunca
+        espera pela GUI (ver ``concluir``).
+
+        Notificações da mesma etapa que não movem o
+        percentual atualizam a barra no máximo uma vez a
+        cada ``INTERVALO_PROGRESSO_SEG``; as demais seguem
+        como ``somente_log``, para que nenhuma mensagem se
+        perca. Marcadores de início e fim de etapa sempre
+        atualizam a barra.
+        """
+        if (
+            self._callback_progresso is None
+            and self._fila_progresso is None
+        ):
+            self.ultimo_percentual = percentual
+            return
+        agora = time.monotonic()
+        somente_log = (
+            etapa == self._ultima_etapa
+            and abs(percentual - self.ultimo_percentual) < 0.5
+            and agora - self._ultima_notificacao
+            < INTERVALO_PROGRESSO_SEG
+            and not mensagem.startswith(MARCADOR_ETAPA)
+        )
+        if not somente_log:
+            self.ultimo_percentual = percentual
+            self._ultima_etapa = etapa
+            self._ultima_notificacao = agora
+        dto = ProgressoDTO(
+            etapa=etapa,
+            percentual=percentual,
+            mensagem=mensagem,
+            somente_log=somente_log,
+        )
+        if self._fila_progresso is not None:
+            self._enfileirar(dto)
+        if self._callback_progresso:
+            self._callback_progresso(dto)
+
+    def _enfileirar(self, dto: ProgressoDTO) -> None:
+        """Põe na fila, ou atrás dos excedentes se houver."""
+        if not self._excedentes:
+            try:
+                self._fila_progresso.put_nowait(dto)
+                return
+            except asyncio.QueueFull:
+                pass
+        self._excedentes.append(dto)
+        if self._escoamento is None:
+            self._escoamento = asyncio.ensure_future(
+                self._escoar()
+            )
+
+    async def _escoar(self) -> None:
+        """Entrega os excedentes à medida que a fila esvazia."""
+        try:
+            while self._excedentes:
+                await self._fila_progresso.put(
+                    self._excedentes[0]
+                )
+                self._excedentes.popleft()
+        finally:
+            self._escoamento = None
+
+    async def concluir(self) -> None:
+        """Aguarda a entrega das notificações excedentes."""
+        if self._escoamento is not None:
+            await self._escoamento
+
 
 class ProcessarTextoUseCase:
     """
@@ -82,6 +307,10 @@ class ProcessarTextoUseCase:
             Callable[[ProgressoDTO], None]
         ] = None,
         check_cancel: Optional[Callable[[], None]] = None,
+        fila_progresso: Optional[
+            "asyncio.Queue[ProgressoDTO]"
+        ] = None,
+        evento_cancelamento: Optional[asyncio.Event] = None,
     ) -> None:
         self._pdf_processor = pdf_processor
         self._agentes_revisores = agentes_revisores
@@ -95,8 +324,11 @@ class ProcessarTextoUseCase:
             geradores_relatorio
         )
         self._logger = logger
-        self._callback_progresso = callback_progresso
-        self._check_cancel_callback = check_cancel
+        # Padrões; ``executar`` pode sobrepor por chamada
+        self._callback_padrao = callback_progresso
+        self._check_cancel_padrao = check_cancel
+        self._fila_padrao = fila_progresso
+        self._evento_padrao = evento_cancelamento
 
         # Compor sub-use-cases — um por agente revisor
         self._ucs_revisar = []
@@ -125,23 +357,65 @@ class ProcessarTextoUseCase:
         # Validador de negócio
         self._validator = TextoValidator()
 
-    def _check_cancel(self) -> None:
-        """Verifica se cancelamento foi solicitado."""
-        if self._check_cancel_callback:
-            self._check_cancel_callback()
+    def _nova_execucao(
+        self,
+        callback_progresso: Optional[
+            Callable[[ProgressoDTO], None]
+        ] = None,
+        check_cancel: Optional[Callable[[], None]] = None,
+        fila_progresso: Optional[
+            "asyncio.Queue[ProgressoDTO]"
+        ] = None,
+        evento_cancelamento: Optional[asyncio.Event] = None,
+    ) -> _ContextoExecucao:
+        """Cria o contexto de uma execução, com os padrões do construtor."""
+        return _ContextoExecucao(
+            callback_progresso or self._callback_padrao,
+            check_cancel or self._check_cancel_padrao,
+            fila_progresso
+            if fila_progresso is not None
+            else self._fila_padrao,
+            evento_cancelamento
+            if evento_cancelamento is not None
+            else self._evento_padrao,
+        )
 
     async def executar(
-        self, input_dto: ProcessarTextoInputDTO
+        self,
+        input_dto: ProcessarTextoInputDTO,
+        callback_progresso: Optional[
+            Callable[[ProgressoDTO], None]
+        ] = None,
+        check_cancel: Optional[Callable[[], None]] = None,
+        fila_progresso: Optional[
+            "asyncio.Queue[ProgressoDTO]"
+        ] = None,
+        evento_cancelamento: Optional[asyncio.Event] = None,
     ) -> ProcessarTextoOutputDTO:
         """
         Executa o processamento completo do texto.
 
+        A instância pode ser reutilizada entre chamadas,
+        inclusive simultâneas: os callbacks, a fila e o
+        evento informados aqui valem só para esta execução.
+
         Args:
             input_dto: Dados de entrada
+            callback_progresso: Callback para progresso
+            check_cancel: Callback de cancelamento
+            fila_progresso: Fila limitada para progresso
+            evento_cancelamento: Evento que interrompe
+                o pipeline, inclusive chamadas em curso
 
         Returns:
             DTO com resultados do processamento
         """
+        execucao = self._nova_execucao(
+            callback_progresso,
+            check_cancel,
+            fila_progresso,
+            evento_cancelamento,
+        )
         try:
             self._logger.info(
                 f"Iniciando processamento: "
@@ -165,9 +439,11 @@ class ProcessarTextoUseCase:
             # Mantém compatibilidade ou fallback se não houver perfis configurados
             # (ex: config antiga ou execução direta sem perfis)
             if not info_ia["perfis"] and self._agentes_revisores:
-                agente = self._agentes_revisores[0]
-                if hasattr(agente, "_gateway") and agente._gateway:
-                     dados_agente = agente._gateway.obter_info_modelo()
+                gateway = getattr(
+                    self._agentes_revisores[0], "_gateway", None
+                )
+                if gateway:
+                     dados_agente = gateway.obter_info_modelo()
                      info_ia["provedor"] = dados_agente.get("provedor", "Desconhecido")
                      info_ia["modelo"] = dados_agente.get("modelo", "Desconhecido")
                      # Cria um perfil "padrão" fictício para compatibilidade
@@ -186,11 +462,11 @@ class ProcessarTextoUseCase:
                 f"IA: {info_ia['provedor']} ({info_ia['modelo']})"
             )
 
-            self._notificar_progresso("inicio", 0, msg_inicio)
-            self._check_cancel()
+            execucao.notificar("inicio", 0, msg_inicio)
+            execucao.verificar_cancelamento()
 
             # Etapa 1: Carregar e validar documento
-            self._notificar_progresso(
+            execucao.notificar(
                 "carregamento", 5, "Carregando documento..."
             )
             texto = await self._carregar_documento(
@@ -198,163 +474,63 @@ class ProcessarTextoUseCase:
             )
             texto.info_ia = info_ia
 
-            self._check_cancel()
+            execucao.verificar_cancelamento()
 
-            # Etapa 2: Extrair texto
-            self._notificar_progresso(
+            # Etapas 2+3: extração alimenta as revisões em
+            # fluxo; cada seção entra na revisão assim que
+            # é produzida
+            execucao.notificar(
                 "extracao", 10, "Extraindo texto..."
             )
             if modo_proc == "texto_completo":
-                await self._extrair_texto_completo(texto)
-                self._notificar_progresso(
-                    "extracao", 15,
-                    f"Texto extraído: {len(texto.secoes)} bloco(s) | modo: texto completo",
-                )
-            else:
-                await self._extrair_secoes(texto)
-                self._notificar_progresso(
-                    "extracao", 15,
-                    f"Texto extraído: {len(texto.secoes)} seção(ões) | modo: por seção",
-                )
-            self._check_cancel()
-
-            # Etapa 3: Revisões por fase (cada agente revisor)
-            total_fases = len(self._ucs_revisar)
-            for fase_idx, uc_revisar in enumerate(self._ucs_revisar, 1):
-                nome_fase = uc_revisar._agente.obter_nome()
-                # Traduzir nome para exibição
-                nomes_amigaveis = {
-                    "revisor_revisao_gramatical": "Revisão Gramatical",
-                    "revisor_revisao_tecnica": "Revisão Técnica",
-                    "revisor_revisao_estrutural": "Revisão Estrutural",
-                }
-                nome_exibicao = nomes_amigaveis.get(
-                    nome_fase, nome_fase
-                )
-
-                pct_inicio = 15 + int(
-                    ((fase_idx - 1) / total_fases) * 40
-                )
-                self._notificar_progresso(
-                    "revisao",
-                    pct_inicio,
-                    f"━━━ INÍCIO: {nome_exibicao}{mock_label}",
-                )
-
-                total = len(texto.secoes)
-                for i, secao in enumerate(texto.secoes, 1):
-                    pct = pct_inicio + int(
-                        (i / total) * (40 / total_fases)
-                    )
-                    self._notificar_progresso(
-                        "revisao",
-                        pct,
-                        f"  [{nome_exibicao}] Seção {i}/{total}: "
-                        f"{secao.titulo}",
-                    )
-                    self._check_cancel()
-                    await uc_revisar.executar(secao, texto)
-
-                self._notificar_progresso(
-                    "revisao",
-                    pct_inicio + int(40 / total_fases),
-                    f"━━━ FIM: {nome_exibicao}",
-                )
-
-            # Etapa 4: Validação
-            if self._agente_validador:
-                self._notificar_progresso(
-                    "validacao",
-                    60,
-                    f"━━━ INÍCIO: Validação{mock_label}",
-                )
-                self._check_cancel()
-                for i, secao in enumerate(texto.secoes, 1):
-                    self._notificar_progresso(
-                        "validacao",
-                        60 + int((i / len(texto.secoes)) * 10),
-                        f"  [Validação] Seção {i}/{len(texto.secoes)}: "
-                        f"{secao.titulo}",
-                    )
-                    self._check_cancel()
-                    ultima_rev = secao.obter_ultima_revisao()
-                    config_val = {
-                        "texto_original": secao.conteudo_original,
-                        "texto_revisado": (
-                            ultima_rev.texto_saida
-                            if ultima_rev else secao.conteudo_original
-                        ),
-                        "erros_encontrados": [
-                            {
-                                "trecho": e.trecho_original,
-                                "sugestao": e.sugestao_correcao,
-                            }
-                            for e in secao.obter_todos_erros()
-                        ],
-                    }
-                    await self._agente_validador.processar(
-                        secao, config_val
-                    )
-                self._notificar_progresso(
-                    "validacao", 70,
-                    f"━━━ FIM: Validação",
+                fonte = self._extrair_texto_completo(
+                    texto, execucao
                 )
             else:
-                 self._logger.info("Fase de validação desativada.")
-
-            # Etapa 5: Consistência
-            if self._uc_consistencia:
-                self._notificar_progresso(
-                    "consistencia",
-                    72,
-                    f"━━━ INÍCIO: Consistência{mock_label}",
-                )
-                self._check_cancel()
-                resultado_consistencia = await self._uc_consistencia.executar(texto)
-                # O UC retorna um dict, pegamos o texto 'resultado'
-                texto.analise_consistencia = resultado_consistencia.get("resultado")
-                
-                self._notificar_progresso(
-                    "consistencia", 78,
-                    f"━━━ FIM: Consistência",
-                )
-            else:
-                self._logger.info("Fase de consistência desativada.")
+                fonte = self._extrair_secoes(texto, execucao)
+            # Etapas 3+4+5: cada seção é validada assim que
+            # sua última fase de revisão termina; a consistência
+            # aguarda todas as revisões
+            await self._revisar_e_validar(
+                texto, config, mock_label, fonte, execucao
+            )
 
             # Etapa 6: Síntese
-            self._notificar_progresso(
+            execucao.notificar(
                 "sintese",
                 80,
                 f"━━━ INÍCIO: Síntese{mock_label}",
             )
-            self._check_cancel()
+            execucao.verificar_cancelamento()
             contexto_sintese = {
                 "total_secoes": len(texto.secoes),
                 "secoes": [
                     {
                         "titulo": s.titulo,
-                        "erros": len(s.obter_todos_erros()),
+                        "erros": s.contar_erros(),
                         "iteracoes": s.total_iteracoes,
                     }
                     for s in texto.secoes
                 ],
             }
-            text_sintese = await self._agentes_revisores[0].gerar_sintese(
-                contexto_sintese
+            text_sintese = await execucao.aguardar(
+                self._agentes_revisores[0].gerar_sintese(
+                    contexto_sintese
+                )
             )
             texto.sintese_geral = text_sintese
-            self._notificar_progresso(
+            execucao.notificar(
                 "sintese", 85,
                 f"━━━ FIM: Síntese",
             )
 
             # Etapa 7: Gerar relatórios
-            self._notificar_progresso(
+            execucao.notificar(
                 "relatorio",
                 87,
                 "Gerando relatórios...",
             )
-            self._check_cancel()
+            execucao.verificar_cancelamento()
             relatorios = await self._gerar_relatorios(
                 texto, input_dto
             )
@@ -363,9 +539,10 @@ class ProcessarTextoUseCase:
             texto.atualizar_status(
                 StatusTexto.CONCLUIDO
             )
-            self._texto_repo.salvar(texto)
+            # Serialização e escrita em disco fora do loop
+            await asyncio.to_thread(self._texto_repo.salvar, texto)
 
-            self._notificar_progresso(
+            execucao.notificar(
                 "concluido",
                 100,
                 "Processamento concluído!",
@@ -374,9 +551,11 @@ class ProcessarTextoUseCase:
             return ProcessarTextoOutputDTO(
                 texto=texto,
                 relatorios=relatorios,
-                metricas=self._coletar_metricas(texto),
                 sucesso=True,
                 mensagem="Processamento concluído",
+                calcular_metricas=functools.partial(
+                    self._coletar_metricas, texto
+                ),
             )
 
         except Exception as e:
@@ -387,6 +566,9 @@ class ProcessarTextoUseCase:
                 sucesso=False,
                 mensagem=str(e),
             )
+        finally:
+            # Toda notificação chega à fila antes do retorno
+            await execucao.concluir()
 
     async def _carregar_documento(
         self, caminho: str
@@ -405,41 +587,33 @@ class ProcessarTextoUseCase:
         Raises:
             TextoInvalidoException: Se inválido
         """
-        # Validar documento (usa interface existente por ora)
-        valido = await self._pdf_processor.validar_pdf(
-            caminho
+        # Validação, metadados e hash são independentes e
+        # rodam juntos: o hash lê o arquivo enquanto o
+        # processador o analisa. A validação continua tendo
+        # precedência sobre falhas das demais
+        valido, metadados, texto = await asyncio.gather(
+            self._pdf_processor.validar_pdf(caminho),
+            self._pdf_processor.extrair_metadados(caminho),
+            asyncio.to_thread(self._criar_texto, caminho),
+            return_exceptions=True,
         )
+        if isinstance(valido, BaseException):
+            raise valido
         if not valido:
             raise TextoInvalidoException(
                 f"Documento inválido ou formato "
                 f"não suportado: {caminho}"
             )
-
-        # Extrair metadados
-        metadados = (
-            await self._pdf_processor.extrair_metadados(
-                caminho
-            )
-        )
-        nome = Path(caminho).name
-        tam = Path(caminho).stat().st_size
-
-        # Criar entidade TextoEstruturado
-        texto = TextoEstruturado(
-            caminho_arquivo=caminho,
-            nome_arquivo=nome,
-            metadados=metadados,
-            tamanho_bytes=tam,
-            numero_paginas=metadados.numero_paginas,
-        )
+        for resultado in (metadados, texto):
+            if isinstance(resultado, BaseException):
+                raise resultado
+        texto.metadados = metadados
+        texto.numero_paginas = metadados.numero_paginas
         
         # Injetar info da IA (populado anteriormente em executar ou vazio)
         # A atribuição principal deve ocorrer no caso de uso para ter acesso à config completa
         pass
 
-        # Hash para integridade
-        texto.calcular_hash()
-
         # Validar regras de negócio
         valido_negocio, erros = (
             self._validator.validar(texto)
@@ -455,18 +629,50 @@ class ProcessarTextoUseCase:
 
         return texto
 
+    @staticmethod
+    def _criar_texto(caminho: str) -> TextoEstruturado:
+        """
+        Cria a entidade do documento já com o hash.
+
+        Roda fora do loop: o hash lê o arquivo inteiro.
+
+        Args:
+            caminho: Caminho do arquivo
+
+        Returns:
+            TextoEstruturado sem metadados
+        """
+        texto = TextoEstruturado(
+            caminho_arquivo=caminho,
+            nome_arquivo=Path(caminho).name,
+            tamanho_bytes=Path(caminho).stat().st_size,
+        )
+        # Hash para integridade
+        texto.calcular_hash()
+        return texto
+
     async def _extrair_texto_completo(
-        self, texto: TextoEstruturado
-    ) -> None:
+        self,
+        texto: TextoEstruturado,
+        execucao: Optional[_ContextoExecucao] = None,
+    ) -> AsyncIterator[Secao]:
         """
         Extrai texto completo do documento como uma seção única.
 
         Args:
             texto: Texto estruturado carregado
+            execucao: Contexto da execução; se omitido, usa
+                os padrões do construtor
+
+        Yields:
+            A seção única, já adicionada ao texto
         """
+        if execucao is None:
+            execucao = self._nova_execucao()
         conteudo = (
             await self._pdf_processor.extrair_texto(
-                texto.caminho_arquivo
+                texto.caminho_arquivo,
+                hash_arquivo=texto.hash_arquivo,
             )
         )
 
@@ -486,40 +692,61 @@ class ProcessarTextoUseCase:
         texto.atualizar_status(
             StatusTexto.REVISANDO
         )
+        execucao.notificar(
+            "extracao", 15,
+            f"Texto extraído: {len(texto.secoes)} bloco(s) | modo: texto completo",
+        )
+        yield secao
 
     async def _extrair_secoes(
-        self, texto: TextoEstruturado
-    ) -> None:
+        self,
+        texto: TextoEstruturado,
+        execucao: Optional[_ContextoExecucao] = None,
+    ) -> AsyncIterator[Secao]:
         """
         Extrai conteúdo e detecta seções no documento.
 
+        As seções são entregues uma a uma, para que a
+        revisão de cada uma comece sem esperar as demais.
+
         Args:
             texto: Texto estruturado carregado
+            execucao: Contexto da execução; se omitido, usa
+                os padrões do construtor
+
+        Yields:
+            Cada seção, já adicionada ao texto
         """
+        if execucao is None:
+            execucao = self._nova_execucao()
         # Extrair texto completo
         conteudo = (
             await self._pdf_processor.extrair_texto(
-                texto.caminho_arquivo
+                texto.caminho_arquivo,
+                hash_arquivo=texto.hash_arquivo,
             )
         )
 
-        # Detectar seções
-        secoes_det = (
-            await self._pdf_processor.detectar_secoes(
-                conteudo, texto.numero_paginas
-            )
-        )
-
-        # Converter para entidades
-        titulos_vistos = set()
-        for sd in secoes_det:
+        # Converter para entidades à medida que as seções
+        # são detectadas
+        titulos_vistos: Set[str] = set()
+        # Próximo sufixo a tentar por título original: evita
+        # sondar " (2)", " (3)"... desde o início a cada repetição
+        proximo_sufixo: Dict[str, int] = {}
+        async for sd in self._pdf_processor.detectar_secoes_stream(
+            conteudo, texto.numero_paginas
+        ):
             titulo = sd.titulo
-            original = titulo
-            contador = 1
-            while titulo in titulos_vistos:
-                contador += 1
-                titulo = f"{original} ({contador})"
-            
+            if titulo in titulos_vistos:
+                contador = proximo_sufixo.get(sd.titulo, 2)
+                titulo = f"{sd.titulo} ({contador})"
+                # Só repete se o documento já tiver um título
+                # literalmente igual ao gerado
+                while titulo in titulos_vistos:
+                    contador += 1
+                    titulo = f"{sd.titulo} ({contador})"
+                proximo_sufixo[sd.titulo] = contador + 1
+
             titulos_vistos.add(titulo)
 
             secao = Secao(
@@ -530,11 +757,439 @@ class ProcessarTextoUseCase:
                 nivel_hierarquico=sd.nivel,
             )
             texto.adicionar_secao(secao)
+            if len(texto.secoes) == 1:
+                texto.atualizar_status(
+                    StatusTexto.REVISANDO
+                )
+            yield secao
 
-        texto.atualizar_status(
-            StatusTexto.REVISANDO
+        if not texto.secoes:
+            texto.atualizar_status(
+                StatusTexto.REVISANDO
+            )
+        execucao.notificar(
+            "extracao", 15,
+            f"Texto extraído: {len(texto.secoes)} seção(ões) | modo: por seção",
+        )
+
+    async def _revisar_secoes(
+        self,
+        texto: TextoEstruturado,
+        config: Dict[str, Any],
+        mock_label: str = "",
+        secoes: Optional[AsyncIterator[Secao]] = None,
+        ao_concluir_secao: Optional[Callable[[Secao], None]] = None,
+        execucao: Optional[_ContextoExecucao] = None,
+    ) -> None:
+        """
+        Revisa todas as seções com todos os agentes revisores.
+
+        Os pares (agente, seção) entram numa fila assim que
+        cada seção chega de ``secoes`` e são consumidos por
+        ``max_secoes_paralelas`` trabalhadores.
+        Agentes com suporte a lote recebem seções agrupadas
+        até ``tokens_lote_revisao`` tokens estimados.
+        Cada fase parte do conteúdo original da seção,
+        portanto as fases são independentes.
+
+        Args:
+            texto: Texto com as seções extraídas
+            config: Configuração global do sistema
+            mock_label: Sufixo exibido em modo mock
+            secoes: Fluxo de seções a revisar; se omitido,
+                usa ``texto.secoes``
+            ao_concluir_secao: Chamado com cada seção assim
+                que todas as suas fases terminam
+            execucao: Contexto da execução; se omitido, usa
+                os padrões do construtor
+        """
+        if execucao is None:
+            execucao = self._nova_execucao()
+        if secoes is None:
+            secoes = self._iterar(texto.secoes)
+        if not self._ucs_revisar:
+            async for secao in secoes:
+                if ao_concluir_secao is not None:
+                    ao_concluir_secao(secao)
+            return
+
+        limite = max(
+            1,
+            int(
+                config.get(
+                    "max_secoes_paralelas",
+                    MAX_SECOES_PARALELAS_PADRAO,
+                )
+            ),
+        )
+        ordem_fases = {
+            uc._agente.obter_nome(): idx
+            for idx, uc in enumerate(self._ucs_revisar)
+        }
+        fases = ", ".join(
+            NOMES_AMIGAVEIS.get(nome, nome)
+            for nome in ordem_fases
+        )
+        # Prefixo das mensagens por seção, montado uma vez
+        # por fase
+        prefixos = {
+            nome: f"  [{NOMES_AMIGAVEIS.get(nome, nome)}] Seção "
+            for nome in ordem_fases
+        }
+
+        execucao.notificar(
+            "revisao",
+            15,
+            f"━━━ INÍCIO: {fases}{mock_label} "
+            f"| até {limite} revisão(ões) simultânea(s)",
+        )
+
+        orcamento_lote = int(
+            config.get(
+                "tokens_lote_revisao", TOKENS_LOTE_PADRAO
+            )
+        )
+
+        # Fila limitada: a extração fica no máximo algumas
+        # tarefas à frente dos trabalhadores
+        fila: "asyncio.Queue[Optional[_TarefaRevisao]]" = (
+            asyncio.Queue(maxsize=2 * limite)
+        )
+        total = 0
+        concluidas = 0
+        percentual = 15
+        # Fases ainda em andamento por seção (id -> contagem)
+        fases_restantes: Dict[int, int] = {}
+
+        def _concluir(nome_fase: str, grupo: List[Secao]) -> None:
+            nonlocal concluidas, percentual
+            prefixo = prefixos[nome_fase]
+            for secao in grupo:
+                concluidas += 1
+                # Total cresce enquanto a extração produz;
+                # manter o percentual monotônico
+                percentual = max(
+                    percentual,
+                    15 + int((concluidas / total) * 40),
+                )
+                execucao.notificar(
+                    "revisao",
+                    percentual,
+                    f"{prefixo}{concluidas}/{total}: {secao.titulo}",
+                )
+                fases_restantes[id(secao)] -= 1
+                if fases_restantes[id(secao)] == 0:
+                    del fases_restantes[id(secao)]
+                    # Restaurar a ordem das revisões por fase,
+                    # como na execução sequencial (a última
+                    # revisão é da última fase)
+                    secao.revisoes.sort(
+                        key=lambda r: ordem_fases.get(
+                            r.agente, len(ordem_fases)
+                        )
+                    )
+                    if ao_concluir_secao is not None:
+                        ao_concluir_secao(secao)
+
+        async def _trabalhar() -> None:
+            while True:
+                item = await fila.get()
+                if item is None:
+                    return
+                uc_revisar, grupo = item
+                execucao.verificar_cancelamento()
+                if len(grupo) == 1:
+                    await execucao.aguardar(
+                        uc_revisar.executar(grupo[0], texto)
+                    )
+                else:
+                    await execucao.aguardar(
+                        uc_revisar.executar_lote(grupo, texto)
+                    )
+                _concluir(uc_revisar._agente.obter_nome(), grupo)
+
+        async def _produzir() -> None:
+            nonlocal total
+            # Lote em formação por fase: (seções, tokens estimados)
+            lotes: Dict[int, Tuple[List[Secao], int]] = {}
+            async for secao in secoes:
+                execucao.verificar_cancelamento()
+                tokens = len(secao.conteudo_original) // 4 + 1
+                fases_restantes[id(secao)] = len(self._ucs_revisar)
+                for idx, uc in enumerate(self._ucs_revisar):
+                    total += 1
+                    if orcamento_lote <= 0 or not uc.suporta_lote:
+                        await fila.put((uc, [secao]))
+                        continue
+                    grupo, usados = lotes.get(idx, ([], 0))
+                    if grupo and (
+                        usados + tokens > orcamento_lote
+                        or grupo[0].configuracao_id
+                        != secao.configuracao_id
+                    ):
+                        await fila.put((uc, grupo))
+                        grupo, usados = [], 0
+                    grupo.append(secao)
+                    lotes[idx] = (grupo, usados + tokens)
+            for idx, (grupo, _) in lotes.items():
+                if grupo:
+                    await fila.put((self._ucs_revisar[idx], grupo))
+            for _ in range(limite):
+                await fila.put(None)
+
+        await self._reunir(
+            [_produzir()] + [_trabalhar() for _ in range(limite)]
+        )
+
+        execucao.notificar(
+            "revisao", 55, f"━━━ FIM: {fases}"
         )
 
+    async def _revisar_e_validar(
+        self,
+        texto: TextoEstruturado,
+        config: Dict[str, Any],
+        mock_label: str,
+        secoes: AsyncIterator[Secao],
+        execucao: Optional[_ContextoExecucao] = None,
+    ) -> None:
+        """
+        Sobrepõe revisão, validação e consistência.
+
+        As seções concluídas pela revisão seguem por uma fila
+        para a validação, que começa enquanto outras seções
+        ainda estão sendo revisadas. A consistência lê o texto
+        inteiro e só começa ao fim das revisões.
+
+        Args:
+            texto: Texto sendo processado
+            config: Configuração global do sistema
+            mock_label: Sufixo exibido em modo mock
+            secoes: Fluxo de seções extraídas
+            execucao: Contexto da execução; se omitido, usa
+                os padrões do construtor
+        """
+        if execucao is None:
+            execucao = self._nova_execucao()
+        fila: "asyncio.Queue[Optional[Secao]]" = asyncio.Queue()
+        revisao_concluida = asyncio.Event()
+
+        async def _revisar() -> None:
+            await self._revisar_secoes(
+                texto,
+                config,
+                mock_label,
+                secoes=secoes,
+                ao_concluir_secao=fila.put_nowait,
+                execucao=execucao,
+            )
+            revisao_concluida.set()
+            fila.put_nowait(None)
+
+        async def _revisadas() -> AsyncIterator[Secao]:
+            while True:
+                secao = await fila.get()
+                if secao is None:
+                    return
+                yield secao
+
+        await self._reunir(
+            [
+                _revisar(),
+                self._validar_e_verificar(
+                    texto,
+                    config,
+                    mock_label,
+                    secoes=_revisadas(),
+                    revisao_concluida=revisao_concluida,
+                    execucao=execucao,
+                ),
+            ]
+        )
+
+    async def _validar_e_verificar(
+        self,
+        texto: TextoEstruturado,
+        config: Dict[str, Any],
+        mock_label: str = "",
+        secoes: Optional[AsyncIterator[Secao]] = None,
+        revisao_concluida: Optional[asyncio.Event] = None,
+        execucao: Optional[_ContextoExecucao] = None,
+    ) -> None:
+        """
+        Executa validação e consistência simultaneamente.
+
+        As duas etapas leem apenas o resultado das revisões
+        e não dependem uma da outra; as seções também são
+        validadas em paralelo. Todas as chamadas compartilham
+        o limite ``max_secoes_paralelas``, e o progresso das
+        duas etapas (60-78%) é mantido monotônico. Enquanto
+        a revisão não termina, o percentual não avança além
+        do já notificado por ela.
+
+        Args:
+            texto: Texto com as seções revisadas
+            config: Configuração global do sistema
+            mock_label: Sufixo exibido em modo mock
+            secoes: Fluxo de seções prontas para validar; se
+                omitido, usa ``texto.secoes``
+            revisao_concluida: Sinalizado ao fim das revisões;
+                se omitido, as revisões já terminaram
+            execucao: Contexto da execução; se omitido, usa
+                os padrões do construtor
+        """
+        if execucao is None:
+            execucao = self._nova_execucao()
+        if secoes is None:
+            secoes = self._iterar(texto.secoes)
+        if revisao_concluida is None:
+            revisao_concluida = asyncio.Event()
+            revisao_concluida.set()
+        semaforo = asyncio.Semaphore(
+            max(
+                1,
+                int(
+                    config.get(
+                        "max_secoes_paralelas",
+                        MAX_SECOES_PARALELAS_PADRAO,
+                    )
+                ),
+            )
+        )
+        percentual = 60
+
+        def _avancar(etapa: str, alvo: int, mensagem: str) -> None:
+            nonlocal percentual
+            if not revisao_concluida.is_set():
+                execucao.notificar(
+                    etapa, execucao.ultimo_percentual, mensagem
+                )
+                return
+            percentual = max(percentual, alvo)
+            execucao.notificar(etapa, percentual, mensagem)
+
+        async def _chamar(coro: Awaitable[T]) -> T:
+            async with semaforo:
+                execucao.verificar_cancelamento()
+                return await execucao.aguardar(coro)
+
+        async def _validar() -> None:
+            _avancar(
+                "validacao",
+                60,
+                f"━━━ INÍCIO: Validação{mock_label}",
+            )
+            concluidas = 0
+
+            async def _validar_secao(secao: Secao) -> None:
+                nonlocal concluidas
+                ultima_rev = secao.obter_ultima_revisao()
+                config_val = {
+                    "texto_original": secao.conteudo_original,
+                    "texto_revisado": (
+                        ultima_rev.texto_saida
+                        if ultima_rev else secao.conteudo_original
+                    ),
+                    "erros_encontrados": [
+                        {
+                            "trecho": e.trecho_original,
+                            "sugestao": e.sugestao_correcao,
+                        }
+                        for e in secao.obter_todos_erros()
+                    ],
+                }
+                await _chamar(
+                    self._agente_validador.processar(
+                        secao, config_val
+                    )
+                )
+                # Contador em vez do índice: seções terminam
+                # fora de ordem. O total só é definitivo depois
+                # da revisão; antes disso o percentual não avança
+                concluidas += 1
+                total = len(texto.secoes)
+                _avancar(
+                    "validacao",
+                    60 + int((concluidas / total) * 16),
+                    f"  [Validação] Seção {concluidas}/{total}: "
+                    f"{secao.titulo}",
+                )
+
+            tarefas: List[Awaitable[None]] = []
+            try:
+                async for secao in secoes:
+                    tarefas.append(
+                        asyncio.ensure_future(_validar_secao(secao))
+                    )
+            except BaseException:
+                for tarefa in tarefas:
+                    tarefa.cancel()
+                raise
+            await self._reunir(tarefas)
+            _avancar("validacao", 76, "━━━ FIM: Validação")
+
+        async def _verificar() -> None:
+            await revisao_concluida.wait()
+            _avancar(
+                "consistencia",
+                60,
+                f"━━━ INÍCIO: Consistência{mock_label}",
+            )
+            resultado = await _chamar(
+                self._uc_consistencia.executar(texto)
+            )
+            # O UC retorna um dict, pegamos o texto 'resultado'
+            texto.analise_consistencia = resultado.get("resultado")
+            _avancar("consistencia", 78, "━━━ FIM: Consistência")
+
+        etapas = []
+        if self._agente_validador:
+            etapas.append(_validar())
+        else:
+            self._logger.info("Fase de validação desativada.")
+            # Consumir o fluxo para não bloquear a fila
+            etapas.append(self._drenar(secoes))
+        if self._uc_consistencia:
+            etapas.append(_verificar())
+        else:
+            self._logger.info("Fase de consistência desativada.")
+        execucao.verificar_cancelamento()
+        await self._reunir(etapas)
+
+    @staticmethod
+    async def _reunir(coros: List[Awaitable[Any]]) -> None:
+        """
+        Aguarda corrotinas concorrentes, cancelando as demais
+        se uma falhar.
+
+        Args:
+            coros: Corrotinas a executar juntas
+        """
+        tarefas = [asyncio.ensure_future(c) for c in coros]
+        try:
+            await asyncio.gather(*tarefas)
+        except BaseException:
+            # Uma tarefa falhou ou foi cancelada: não deixar as
+            # outras consumindo a API em segundo plano
+            for tarefa in tarefas:
+                tarefa.cancel()
+            await asyncio.gather(*tarefas, return_exceptions=True)
+            raise
+
+    @staticmethod
+    async def _drenar(secoes: AsyncIterator[Secao]) -> None:
+        """Consome um fluxo de seções sem processá-las."""
+        async for _ in secoes:
+            pass
+
+    @staticmethod
+    async def _iterar(
+        secoes: List[Secao],
+    ) -> AsyncIterator[Secao]:
+        """Adapta uma lista de seções a um fluxo assíncrono."""
+        for secao in secoes:
+            yield secao
+
     async def _gerar_relatorios(
         self,
         texto: TextoEstruturado,
@@ -550,25 +1205,15 @@ class ProcessarTextoUseCase:
         Returns:
             Mapa formato -> caminho do arquivo
         """
-        relatorios: Dict[str, str] = {}
         dir_saida = input_dto.opcoes.get(
             "diretorio_saida", "./output"
         )
 
-        for formato in input_dto.formatos_relatorio:
-            try:
-                caminho = (
-                    await self._uc_relatorio.executar(
-                        texto, formato, dir_saida
-                    )
-                )
-                relatorios[formato] = caminho
-            except ValueError as e:
-                self._logger.warning(
-                    f"Formato ignorado: {e}"
-                )
-
-        return relatorios
+        return await self._uc_relatorio.executar_multi(
+            texto,
+            input_dto.formatos_relatorio,
+            dir_saida,
+        )
 
     def _coletar_metricas(
         self, texto: TextoEstruturado
@@ -590,20 +1235,3 @@ class ProcessarTextoUseCase:
             "progresso": texto.progresso_percentual,
             "status": texto.status.value,
         }
-
-    def _notificar_progresso(
-        self,
-        etapa: str,
-        percentual: float,
-        mensagem: str,
-    ) -> None:
-        """
-        Notifica callback de progresso.
-        """
-        if self._callback_progresso:
-            dto = ProgressoDTO(
-                etapa=etapa,
-                percentual=percentual,
-                mensagem=mensagem,
-            )
-            self._callback_progresso(dto)
@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RevisarSecaoInputDTO:
     """
     DTO de entrada para revisão de seção.
@@ -29,7 +29,7 @@ class RevisarSecaoInputDTO:
     limiar_convergencia: float = 0.95
 
 
-@dataclass
+@dataclass(slots=True)
 class RevisarSecaoOutputDTO:
     """
     DTO de saída da revisão de seção.
@@ -5,7 +5,16 @@ Orquestra a revisão iterativa de uma seção do texto
 usando agentes de IA até atingir convergência.
 """
 
-from typing import Optional, Dict, Any
+from collections import Counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
 import time
 
 from ....core.entities.secao import Secao
@@ -36,6 +45,12 @@ from .dto import RevisarSecaoOutputDTO
 MAX_ITERACOES_PADRAO = 5
 # Limiar de convergência padrão
 LIMIAR_CONVERGENCIA_PADRAO = 0.95
+# max_tokens assumido pelo agente quando não configurado
+MAX_TOKENS_PADRAO = 8192
+# Teto de max_tokens ao repetir uma resposta truncada
+MAX_TOKENS_RETENTATIVA = 16384
+
+T = TypeVar("T")
 
 
 class RevisarSecaoUseCase:
@@ -122,16 +137,18 @@ class RevisarSecaoUseCase:
 
             # Executar revisão com agente
             try:
-                inicio_ia = time.time()
-                self._logger.info(
+                inicio_ia = time.perf_counter()
+                # O agente já registra envio e resposta em INFO
+                self._logger.debug(
                     f"  [{nome_agente}] ⏳ Enviando à IA "
                     f"({len(texto_atual)} chars)..."
                 )
-                revisao = await self._agente.processar(
-                    secao, config
+                revisao = await self._processar_ampliando(
+                    lambda: self._agente.processar(secao, config),
+                    config,
                 )
-                tempo_ia = time.time() - inicio_ia
-                self._logger.info(
+                tempo_ia = time.perf_counter() - inicio_ia
+                self._logger.debug(
                     f"  [{nome_agente}] ✅ Resposta da IA "
                     f"recebida em {tempo_ia:.1f}s"
                 )
@@ -146,36 +163,17 @@ class RevisarSecaoUseCase:
                     self._agente._gateway.limpar_cache()
                 continue
 
-            revisao.numero_iteracao = i
-            revisao.texto_entrada = texto_atual
-            revisao.finalizar()
-
-            # Registrar revisão na seção
-            secao.adicionar_revisao(revisao)
-
-            # Verificar convergência
-            erros_atual = revisao.total_erros
-            self._logger.info(
-                f"  [{nome_agente}] Iteração {i} concluída: "
-                f"{erros_atual} erro(s) "
-                f"(anterior: {erros_anterior})"
+            convergiu = self._registrar_iteracao(
+                secao, revisao, i, texto_atual,
+                erros_anterior, limiar,
             )
-            convergiu = self._verificar_convergencia(
-                erros_anterior, erros_atual, limiar
-            )
-
             if convergiu:
-                revisao.convergiu = True
-                self._logger.info(
-                    f"✓ Convergência atingida em "
-                    f"{i} iteração(ões) para '{secao.titulo}'"
-                )
                 break
 
             # Atualizar para próxima iteração
             if revisao.texto_saida:
                 texto_atual = revisao.texto_saida
-            erros_anterior = erros_atual
+            erros_anterior = revisao.total_erros
 
         if not convergiu:
             self._logger.warning(
@@ -187,6 +185,264 @@ class RevisarSecaoUseCase:
 
         return self._criar_output(secao, convergiu)
 
+    @property
+    def suporta_lote(self) -> bool:
+        """Se o agente revisa várias seções por chamada."""
+        # Agentes declaram a capacidade (decoradores repassam
+        # a do agente decorado); sem declaração, vale a
+        # sobrescrita de processar_lote
+        declarado = getattr(self._agente, "suporta_lote", None)
+        if isinstance(declarado, bool):
+            return declarado
+        padrao = IAIAgent.processar_lote
+        return (
+            getattr(type(self._agente), "processar_lote", padrao)
+            is not padrao
+        )
+
+    async def executar_lote(
+        self,
+        secoes: List[Secao],
+        texto: TextoEstruturado,
+        max_iteracoes: int = MAX_ITERACOES_PADRAO,
+        limiar: float = LIMIAR_CONVERGENCIA_PADRAO,
+    ) -> List[RevisarSecaoOutputDTO]:
+        """
+        Revisa várias seções com uma chamada por iteração.
+
+        Cada iteração envia num só prompt as seções que
+        ainda não convergiram; a convergência continua
+        sendo avaliada seção a seção. Seções omitidas pela
+        IA são revisadas individualmente naquela iteração.
+        Usa a configuração da primeira seção.
+
+        Args:
+            secoes: Seções a serem revisadas
+            texto: Texto que contém as seções
+            max_iteracoes: Máximo de iterações
+            limiar: Limiar de convergência
+
+        Returns:
+            DTOs com resultado, na ordem de ``secoes``
+        """
+        if len(secoes) == 1 or not self.suporta_lote:
+            return [
+                await self.executar(
+                    secao, texto, max_iteracoes, limiar
+                )
+                for secao in secoes
+            ]
+
+        self._logger.info(
+            f"Iniciando revisão em lote: {len(secoes)} seções"
+        )
+        for secao in secoes:
+            secao.status = StatusTexto.REVISANDO
+
+        config = dict(
+            self._obter_configuracao(secoes[0].configuracao_id)
+        )
+        config.pop("texto_entrada", None)
+        nome_agente = self._agente.obter_nome()
+        textos_atuais = [s.conteudo_original for s in secoes]
+        erros_anteriores = [0] * len(secoes)
+        convergiram = [False] * len(secoes)
+
+        for i in range(1, max_iteracoes + 1):
+            ativas = [
+                j for j, ok in enumerate(convergiram) if not ok
+            ]
+            if not ativas:
+                break
+            self._logger.info(
+                f"  [{nome_agente}] Iteração {i}/{max_iteracoes} "
+                f"| Lote: {len(ativas)} seção(ões)"
+            )
+
+            try:
+                inicio_ia = time.perf_counter()
+                revisoes = await self._processar_ampliando(
+                    lambda: self._agente.processar_lote(
+                        [secoes[j] for j in ativas],
+                        {
+                            **config,
+                            "textos_entrada": [
+                                textos_atuais[j] for j in ativas
+                            ],
+                        },
+                    ),
+                    config,
+                )
+                self._logger.info(
+                    f"  [{nome_agente}] ✅ Resposta da IA "
+                    f"recebida em {time.perf_counter() - inicio_ia:.1f}s"
+                )
+            except InvalidResponseException as e:
+                self._logger.warning(
+                    f"  [{nome_agente}] Iteração {i}: "
+                    f"resposta inválida da IA para o lote. "
+                    f"Tentando novamente... ({e})"
+                )
+                if hasattr(self._agente, '_gateway'):
+                    self._agente._gateway.limpar_cache()
+                continue
+
+            for j, revisao in zip(ativas, revisoes):
+                secao = secoes[j]
+                if revisao is None:
+                    revisao = await self._revisar_avulsa(
+                        secao, config, textos_atuais[j], i
+                    )
+                    if revisao is None:
+                        continue
+
+                convergiram[j] = self._registrar_iteracao(
+                    secao, revisao, i, textos_atuais[j],
+                    erros_anteriores[j], limiar,
+                )
+                if revisao.texto_saida:
+                    textos_atuais[j] = revisao.texto_saida
+                erros_anteriores[j] = revisao.total_erros
+
+        saidas = []
+        for secao, convergiu in zip(secoes, convergiram):
+            if not convergiu:
+                self._logger.warning(
+                    f"✗ Não convergiu em {max_iteracoes} "
+                    f"iterações para '{secao.titulo}'"
+                )
+            secao.status = StatusTexto.CONCLUIDO
+            saidas.append(self._criar_output(secao, convergiu))
+        return saidas
+
+    async def _revisar_avulsa(
+        self,
+        secao: Secao,
+        config: Dict[str, Any],
+        texto_atual: str,
+        iteracao: int,
+    ) -> Optional[Revisao]:
+        """Revisa isoladamente uma seção omitida do lote."""
+        self._logger.warning(
+            f"  [{self._agente.obter_nome()}] Iteração {iteracao}: "
+            f"'{secao.titulo}' ausente da resposta do lote; "
+            f"revisando separadamente"
+        )
+        try:
+            return await self._agente.processar(
+                secao, {**config, "texto_entrada": texto_atual}
+            )
+        except InvalidResponseException as e:
+            self._logger.warning(
+                f"  [{self._agente.obter_nome()}] Iteração "
+                f"{iteracao}: resposta inválida da IA ({e})"
+            )
+            return None
+
+    async def _processar_ampliando(
+        self,
+        chamada: Callable[[], Awaitable[T]],
+        config: Dict[str, Any],
+    ) -> T:
+        """
+        Executa a chamada ao agente, repetindo uma vez com
+        o dobro de ``max_tokens`` se a resposta for inválida.
+
+        O JSON inválido costuma ser resposta truncada; com
+        limite maior, a repetição não consome uma iteração.
+        O novo limite fica em ``config`` para as seguintes
+        e muda a chave do cache do gateway, dispensando
+        limpá-lo.
+
+        Args:
+            chamada: Fábrica da corrotina (lê ``config``)
+            config: Configuração da seção (alterada)
+
+        Returns:
+            Resultado da chamada
+
+        Raises:
+            InvalidResponseException: Se o limite não puder
+                crescer ou a repetição também falhar
+        """
+        try:
+            return await chamada()
+        except InvalidResponseException as e:
+            atual = int(config.get("max_tokens", MAX_TOKENS_PADRAO))
+            # 0 = automático: o gateway já usa o máximo
+            if atual <= 0 or atual >= MAX_TOKENS_RETENTATIVA:
+                raise
+            config["max_tokens"] = min(
+                MAX_TOKENS_RETENTATIVA, atual * 2
+            )
+            self._logger.warning(
+                f"  [{self._agente.obter_nome()}] Resposta "
+                f"inválida da IA (JSON truncado?); repetindo "
+                f"com max_tokens={config['max_tokens']} ({e})"
+            )
+            return await chamada()
+
+    def _registrar_iteracao(
+        self,
+        secao: Secao,
+        revisao: Revisao,
+        iteracao: int,
+        texto_entrada: str,
+        erros_anterior: int,
+        limiar: float,
+    ) -> bool:
+        """
+        Registra a revisão na seção e avalia convergência.
+
+        Args:
+            secao: Seção revisada
+            revisao: Revisão retornada pelo agente
+            iteracao: Número da iteração
+            texto_entrada: Texto enviado nesta iteração
+            erros_anterior: Erros da iteração anterior
+            limiar: Limiar de convergência
+
+        Returns:
+            True se convergiu
+        """
+        nome_agente = self._agente.obter_nome()
+        revisao.numero_iteracao = iteracao
+        revisao.texto_entrada = texto_entrada
+        revisao.finalizar()
+
+        # Registrar revisão na seção
+        secao.adicionar_revisao(revisao)
+
+        # Verificar convergência
+        erros_atual = revisao.total_erros
+        self._logger.info(
+            f"  [{nome_agente}] Iteração {iteracao} concluída: "
+            f"{erros_atual} erro(s) "
+            f"(anterior: {erros_anterior})"
+        )
+        convergiu = self._verificar_convergencia(
+            erros_anterior, erros_atual, limiar
+        )
+        if not convergiu and (
+            not revisao.texto_saida
+            or revisao.texto_saida == texto_entrada
+        ):
+            # A próxima iteração reenviaria o mesmo texto e
+            # obteria a mesma resposta (cache do gateway)
+            self._logger.info(
+                f"  [{nome_agente}] Texto inalterado na "
+                f"iteração {iteracao}; encerrando revisão"
+            )
+            convergiu = True
+
+        if convergiu:
+            revisao.convergiu = True
+            self._logger.info(
+                f"✓ Convergência atingida em "
+                f"{iteracao} iteração(ões) para '{secao.titulo}'"
+            )
+        return convergiu
+
     def _obter_configuracao(
         self, config_id: Optional[str]
     ) -> Dict[str, Any]:
@@ -262,12 +518,9 @@ class RevisarSecaoUseCase:
             DTO com resultados
         """
         erros = secao.obter_todos_erros()
-        erros_por_tipo: Dict[str, int] = {}
-        for erro in erros:
-            tipo = erro.tipo.value
-            erros_por_tipo[tipo] = (
-                erros_por_tipo.get(tipo, 0) + 1
-            )
+        erros_por_tipo: Dict[str, int] = dict(
+            Counter(erro.tipo.value for erro in erros)
+        )
 
         ultima = secao.obter_ultima_revisao()
         texto = (
@@ -5,8 +5,17 @@ Verifica a consistência entre seções do texto,
 identificando contradições e divergências.
 """
 
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 from ....core.entities.texto_estruturado import TextoEstruturado
 from ....core.interfaces.services.i_ai_agent import (
     IAIAgent,
@@ -15,6 +24,23 @@ from ....core.interfaces.services.i_logger import (
     ILogger,
 )
 
+# Análises lembradas por conteúdo do contexto
+MAX_RESULTADOS_CACHE = 128
+
+# Caracteres de cada seção enviados ao agente
+MAX_CHARS_SECAO = 5000
+
+
+def _chave_contexto(contexto: Dict[str, Any]) -> str:
+    """Digest do JSON canônico do contexto."""
+    if orjson is not None:
+        bruto = orjson.dumps(contexto, option=orjson.OPT_SORT_KEYS)
+    else:
+        bruto = json.dumps(
+            contexto, sort_keys=True, ensure_ascii=False
+        ).encode("utf-8")
+    return hashlib.blake2b(bruto, digest_size=16).hexdigest()
+
 
 class VerificarConsistenciaUseCase:
     """
@@ -26,6 +52,7 @@ class VerificarConsistenciaUseCase:
     Attributes:
         _agente: Agente de consistência
         _logger: Sistema de logging
+        _cache: LRU digest do contexto -> resultado
     """
 
     def __init__(
@@ -42,6 +69,7 @@ class VerificarConsistenciaUseCase:
         """
         self._agente = agente
         self._logger = logger
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
 
     async def executar(
         self, texto: TextoEstruturado
@@ -62,10 +90,23 @@ class VerificarConsistenciaUseCase:
         # Preparar contexto com todas as seções
         contexto = self._preparar_contexto(texto)
 
-        # Enviar para agente de consistência
-        resultado = await self._agente.gerar_sintese(
-            contexto
-        )
+        # Reexecuções sobre o mesmo conteúdo reaproveitam
+        # a análise anterior
+        chave = _chave_contexto(contexto)
+        if chave in self._cache:
+            self._cache.move_to_end(chave)
+            resultado = self._cache[chave]
+            self._logger.debug(
+                "Consistência obtida do cache"
+            )
+        else:
+            # Enviar para agente de consistência
+            resultado = await self._agente.gerar_sintese(
+                contexto
+            )
+            self._cache[chave] = resultado
+            if len(self._cache) > MAX_RESULTADOS_CACHE:
+                self._cache.popitem(last=False)
 
         self._logger.info(
             "Verificação de consistência concluída"
@@ -78,6 +119,27 @@ class VerificarConsistenciaUseCase:
             ),
         }
 
+    async def executar_lote(
+        self, textos: List[TextoEstruturado]
+    ) -> List[Dict[str, Any]]:
+        """
+        Verifica a consistência de vários textos em paralelo.
+
+        As chamadas ao agente são independentes e seguem
+        juntas, aproveitando o paralelismo do provedor.
+
+        Args:
+            textos: Textos com seções revisadas
+
+        Returns:
+            Resultados na ordem de ``textos``
+        """
+        return list(
+            await asyncio.gather(
+                *(self.executar(texto) for texto in textos)
+            )
+        )
+
     def _preparar_contexto(
         self, texto: TextoEstruturado
     ) -> Dict[str, Any]:
@@ -90,24 +152,16 @@ class VerificarConsistenciaUseCase:
         Returns:
             Contexto estruturado
         """
-        secoes_resumo: List[Dict[str, Any]] = []
-
-        for secao in texto.secoes:
-            ultima = secao.obter_ultima_revisao()
-            conteudo_secao = (
-                ultima.texto_saida
-                if ultima and ultima.texto_saida
-                else secao.conteudo_original
-            )
-            secoes_resumo.append(
-                {
-                    "titulo": secao.titulo,
-                    "conteudo": conteudo_secao[:5000],
-                    "erros": len(
-                        secao.obter_todos_erros()
-                    ),
-                }
-            )
+        secoes_resumo: List[Dict[str, Any]] = [
+            {
+                "titulo": secao.titulo,
+                "conteudo": secao.texto_vigente[
+                    :MAX_CHARS_SECAO
+                ],
+                "erros": secao.contar_erros(),
+            }
+            for secao in texto.secoes
+        ]
 
         return {
             "texto_nome": texto.nome_arquivo,
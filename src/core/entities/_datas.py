@@ -0,0 +1,39 @@
+"""
+Conversão das datas serializadas pelas entidades.
+
+``to_dict`` grava datas em ISO 8601; estas funções fazem o
+caminho inverso em ``from_dict``.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+
+def ler_data(valor: Optional[str]) -> datetime:
+    """
+    Lê data ISO 8601, usando o instante atual se ausente.
+
+    Args:
+        valor: Data serializada ou None
+
+    Returns:
+        Data lida ou ``datetime.now()``
+    """
+    if valor:
+        return datetime.fromisoformat(valor)
+    return datetime.now()
+
+
+def ler_data_opcional(
+    valor: Optional[str],
+) -> Optional[datetime]:
+    """
+    Lê data ISO 8601 opcional.
+
+    Args:
+        valor: Data serializada ou None
+
+    Returns:
+        Data lida ou None
+    """
+    return datetime.fromisoformat(valor) if valor else None
@@ -5,12 +5,15 @@ Define a estrutura de uma correção proposta para
 um erro identificado no texto estruturado.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+from ._datas import ler_data
 
-@dataclass
+
+@dataclass(slots=True)
 class Correcao:
     """
     Representa uma correção proposta para um erro.
@@ -84,9 +87,12 @@ class Correcao:
             texto_original=data["texto_original"],
             texto_corrigido=data["texto_corrigido"],
             justificativa=data.get("justificativa", ""),
-            agente_origem=data.get("agente_origem", ""),
+            agente_origem=sys.intern(
+                data.get("agente_origem", "")
+            ),
             confianca=data.get("confianca", 1.0),
             aplicada=data.get("aplicada", False),
+            data_proposta=ler_data(data.get("data_proposta")),
             iteracao=data.get("iteracao", 0),
         )
 
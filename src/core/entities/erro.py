@@ -5,15 +5,17 @@ Define a estrutura de um erro identificado durante
 a revisão de uma seção do texto estruturado.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 
 from ..enums.tipo_erro import TipoErro
 from ..value_objects.localizacao_erro import LocalizacaoErro
+from ._datas import ler_data
 
 
-@dataclass
+@dataclass(slots=True)
 class Erro:
     """
     Representa um erro identificado no texto.
@@ -141,7 +143,11 @@ class Erro:
             localizacao=localizacao,
             severidade=data.get("severidade", 1),
             confianca=data.get("confianca", 1.0),
-            agente_origem=data.get("agente_origem", ""),
+            # Poucos agentes distintos: uma cópia de cada
+            agente_origem=sys.intern(
+                data.get("agente_origem", "")
+            ),
+            data_deteccao=ler_data(data.get("data_deteccao")),
             aceito=data.get("aceito"),
             justificativa=data.get("justificativa", ""),
         )
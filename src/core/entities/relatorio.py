@@ -12,7 +12,7 @@ from typing import List, Optional, Dict, Any
 from ..enums.formato_relatorio import FormatoRelatorio
 
 
-@dataclass
+@dataclass(slots=True)
 class Relatorio:
     """
     Representa um relatório de revisão gerado.
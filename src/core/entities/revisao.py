@@ -5,6 +5,8 @@ Define a estrutura de uma iteração de revisão realizada
 por um agente de IA sobre uma seção do texto.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -13,7 +15,7 @@ from .erro import Erro
 from .correcao import Correcao
 
 
-@dataclass
+@dataclass(slots=True)
 class Revisao:
     """
     Representa uma iteração de revisão de uma seção.
@@ -64,6 +66,14 @@ class Revisao:
     data_fim: Optional[datetime] = None
     resposta_bruta: str = ""
     prompt_utilizado: str = ""
+    # Relógio monotônico para a duração: imune a ajustes
+    # do relógio de parede
+    _inicio_monotonico: float = field(
+        default_factory=time.monotonic,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def adicionar_erro(self, erro: Erro) -> None:
         """
@@ -100,11 +110,9 @@ class Revisao:
     def finalizar(self) -> None:
         """Marca a revisão como finalizada."""
         self.data_fim = datetime.now()
-        if self.data_inicio:
-            delta = self.data_fim - self.data_inicio
-            self.tempo_processamento_seg = (
-                delta.total_seconds()
-            )
+        self.tempo_processamento_seg = (
+            time.monotonic() - self._inicio_monotonico
+        )
 
     @property
     def total_erros(self) -> int:
@@ -168,7 +176,7 @@ class Revisao:
             numero_iteracao=data["numero_iteracao"],
             texto_entrada=data["texto_entrada"],
             texto_saida=data.get("texto_saida", ""),
-            agente=data.get("agente", ""),
+            agente=sys.intern(data.get("agente", "")),
             convergiu=data.get("convergiu", False),
             tokens_input=data.get("tokens_input", 0),
             tokens_output=data.get("tokens_output", 0),
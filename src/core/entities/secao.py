@@ -7,7 +7,7 @@ conteúdo original, configurações de revisão e histórico.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 from ..enums.status_texto import StatusTexto
 from ..exceptions.secao_exceptions import (
@@ -16,9 +16,27 @@ from ..exceptions.secao_exceptions import (
 )
 from .revisao import Revisao
 from .erro import Erro
+from ._datas import ler_data
 
 
-@dataclass
+def _mesmo_prefixo(
+    anterior: Tuple[Tuple[Revisao, int], ...],
+    atual: Tuple[Tuple[Revisao, int], ...],
+) -> bool:
+    """
+    Indica se ``anterior`` é prefixo de ``atual``.
+
+    As revisões são comparadas por identidade.
+    """
+    if len(anterior) > len(atual):
+        return False
+    return all(
+        r_ant is r_atu and n_ant == n_atu
+        for (r_ant, n_ant), (r_atu, n_atu) in zip(anterior, atual)
+    )
+
+
+@dataclass(slots=True)
 class Secao:
     """
     Representa uma seção de um texto estruturado.
@@ -64,6 +82,22 @@ class Secao:
     metadados: Dict[str, Any] = field(
         default_factory=dict
     )
+    # Memo de obter_todos_erros: (assinatura das revisões, erros).
+    # A assinatura guarda as próprias revisões (não id()), para
+    # que um id reaproveitado após remoção não valide o memo.
+    _cache_erros: Optional[
+        Tuple[
+            Tuple[Tuple[Revisao, int], ...],
+            List[Erro],
+            Set[int],
+        ]
+    ] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memo de numero_palavras: (conteúdo contado, total)
+    _cache_palavras: Optional[Tuple[str, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validações após criação da instância."""
@@ -162,23 +196,55 @@ class Secao:
         Realiza deduplicação baseada no trecho original e tipo do erro.
         Isso consolida o histórico de correções sem repetir erros persistentes.
 
+        O resultado é memorizado enquanto a lista de revisões
+        (e o número de erros de cada uma) não mudar. Quando
+        apenas novas revisões foram acrescentadas, só os
+        erros delas são examinados.
+
         Returns:
             Lista de erros únicos identificados
         """
-        todos_erros = []
-        unicos = set()
-        
-        for revisao in self.revisoes:
+        return list(self._erros_unicos())
+
+    def contar_erros(self) -> int:
+        """
+        Conta os erros únicos sem copiar a lista.
+
+        Returns:
+            Número de erros de ``obter_todos_erros``
+        """
+        return len(self._erros_unicos())
+
+    def _erros_unicos(self) -> List[Erro]:
+        """Lista memorizada de erros únicos (não alterar)."""
+        assinatura = tuple(
+            (r, len(r.erros)) for r in self.revisoes
+        )
+        cache = self._cache_erros
+        if cache is not None and _mesmo_prefixo(cache[0], assinatura):
+            if len(cache[0]) == len(assinatura):
+                return cache[1]
+            _, todos_erros, unicos = cache
+            novas = self.revisoes[len(cache[0]):]
+        else:
+            todos_erros = []
+            unicos = set()
+            novas = self.revisoes
+
+        for revisao in novas:
             for erro in revisao.erros:
                 # Chave de unicidade: tipo + trecho
                 # Normalizar trecho removendo espaços extras
                 trecho_norm = " ".join(erro.trecho_original.split())
-                chave = (erro.tipo.value, trecho_norm)
+                # Guardar só o hash: o conjunto não retém os
+                # trechos (colisão em 64 bits é desprezível)
+                chave = hash((erro.tipo.value, trecho_norm))
                 
                 if chave not in unicos:
                     unicos.add(chave)
                     todos_erros.append(erro)
-                    
+
+        self._cache_erros = (assinatura, todos_erros, unicos)
         return todos_erros
 
     def obter_erros_por_tipo(
@@ -208,6 +274,14 @@ class Secao:
             + 1
         )
 
+    @property
+    def texto_vigente(self) -> str:
+        """Texto da última revisão, ou o original se não houver."""
+        ultima = self.obter_ultima_revisao()
+        if ultima is not None and ultima.texto_saida:
+            return ultima.texto_saida
+        return self.conteudo_original
+
     @property
     def tamanho_conteudo(self) -> int:
         """Tamanho do conteúdo em caracteres."""
@@ -216,7 +290,14 @@ class Secao:
     @property
     def numero_palavras(self) -> int:
         """Número aproximado de palavras."""
-        return len(self.conteudo_original.split())
+        cache = self._cache_palavras
+        if cache is None or cache[0] is not self.conteudo_original:
+            cache = (
+                self.conteudo_original,
+                len(self.conteudo_original.split()),
+            )
+            self._cache_palavras = cache
+        return cache[1]
 
     @property
     def foi_revisada(self) -> bool:
@@ -283,6 +364,7 @@ class Secao:
             status=StatusTexto(
                 data.get("status", "pendente")
             ),
+            data_criacao=ler_data(data.get("data_criacao")),
             metadados=data.get("metadados", {}),
         )
         for rev_data in data.get("revisoes", []):
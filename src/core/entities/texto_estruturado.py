@@ -5,11 +5,26 @@ Define a estrutura principal de um texto estruturado,
 o agregado raiz do domínio.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+import bisect
 import hashlib
+import mmap
+import os
+import stat
+import time
 
 from ..enums.status_texto import StatusTexto
 from ..value_objects.metadados_pdf import MetadadosPDF
@@ -19,9 +34,50 @@ from ..exceptions.texto_exceptions import (
     SecaoDuplicadaException,
 )
 from .secao import Secao
+from ._datas import ler_data, ler_data_opcional
+
+# Extensões agora são flexíveis (PDF, DOCX, ODT, TEX)
+EXTENSOES_SUPORTADAS = frozenset(
+    {".pdf", ".docx", ".odt", ".tex", ".md"}
+)
+
+# Eventos mantidos no histórico; os mais antigos saem
+HISTORICO_MAX = 1024
 
+# Bloco de leitura do hash quando file_digest não existe
+TAMANHO_BLOCO_HASH = 1 << 20
+
+# A partir deste tamanho o hash lê o arquivo mapeado
+LIMIAR_MMAP_HASH = 32 << 20
+
+
+def sha256_arquivo(f: BinaryIO) -> Any:
+    """
+    Calcula o SHA-256 de um arquivo aberto em modo binário.
 
-@dataclass
+    Único ponto de hash de documentos: a entidade e o
+    cache de extração usam esta função. Arquivos grandes são mapeados em memória e entregues
+    inteiros ao hashlib, sem cópias para buffers Python;
+    nos menores, o custo do mapeamento não compensa.
+    """
+    if os.fstat(f.fileno()).st_size >= LIMIAR_MMAP_HASH:
+        with mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapa:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapa.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mapa)
+    if hasattr(hashlib, "file_digest"):
+        return hashlib.file_digest(f, "sha256")
+    sha256_hash = hashlib.sha256()
+    buffer = bytearray(TAMANHO_BLOCO_HASH)
+    visao = memoryview(buffer)
+    while lidos := f.readinto(buffer):
+        sha256_hash.update(visao[:lidos])
+    return sha256_hash
+
+
+@dataclass(slots=True)
 class TextoEstruturado:
     """
     Representa um texto estruturado completo.
@@ -40,7 +96,8 @@ class TextoEstruturado:
         hash_arquivo: Hash SHA-256 do arquivo
         tamanho_bytes: Tamanho em bytes
         numero_paginas: Total de páginas (se aplicável)
-        historico: Eventos de processamento
+        historico: Eventos de processamento (os últimos
+            HISTORICO_MAX)
 
     Example:
         >>> texto = TextoEstruturado(
@@ -63,8 +120,8 @@ class TextoEstruturado:
     hash_arquivo: Optional[str] = None
     tamanho_bytes: int = 0
     numero_paginas: int = 0
-    historico: List[Dict[str, Any]] = field(
-        default_factory=list
+    historico: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=HISTORICO_MAX)
     )
     info_ia: Dict[str, Any] = field(
         default_factory=dict
@@ -74,6 +131,15 @@ class TextoEstruturado:
     _secoes_index: Dict[str, Secao] = field(
         default_factory=dict, init=False, repr=False
     )
+    # Página final de cada seção, na ordem de ``secoes``;
+    # None se as seções não estiverem em ordem de páginas
+    _fins_paginas: Optional[List[int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (tamanho, mtime_ns) do arquivo quando o hash foi calculado
+    _estado_hash: Optional[Tuple[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """
@@ -84,6 +150,10 @@ class TextoEstruturado:
         """
         self._validar_caminho_arquivo()
         self._reconstruir_index_secoes()
+        if not isinstance(self.historico, deque):
+            self.historico = deque(
+                self.historico, maxlen=HISTORICO_MAX
+            )
 
     def _validar_caminho_arquivo(self) -> None:
         """
@@ -97,19 +167,20 @@ class TextoEstruturado:
                 "Caminho do arquivo não pode ser vazio"
             )
         caminho = Path(self.caminho_arquivo)
-        if not caminho.exists():
+        # Um único stat responde existência e tipo
+        try:
+            modo = os.stat(self.caminho_arquivo).st_mode
+        except (OSError, ValueError):
             raise TextoInvalidoException(
                 f"Arquivo não encontrado: "
                 f"{self.caminho_arquivo}"
             )
-        if not caminho.is_file():
+        if not stat.S_ISREG(modo):
             raise TextoInvalidoException(
                 f"Caminho não é um arquivo: "
                 f"{self.caminho_arquivo}"
             )
-        
-        # Extensões agora são flexíveis (PDF, DOCX, ODT, TEX)
-        EXTENSOES_SUPORTADAS = {".pdf", ".docx", ".odt", ".tex", ".md"}
+
         if caminho.suffix.lower() not in EXTENSOES_SUPORTADAS:
             raise TextoInvalidoException(
                 f"Formato não suportado: {caminho.suffix}"
@@ -120,12 +191,46 @@ class TextoEstruturado:
         self._secoes_index = {
             s.titulo: s for s in self.secoes
         }
+        self._indexar_paginas()
+
+    def _indexar_paginas(self) -> None:
+        """
+        Indexa as páginas finais para busca binária.
 
-    def calcular_hash(self) -> str:
+        Só vale quando início e fim das seções crescem com
+        a ordem da lista, o caso de documentos lineares.
+        """
+        fins: Optional[List[int]] = []
+        anterior: Optional[Secao] = None
+        for secao in self.secoes:
+            if anterior is not None and not (
+                secao.numero_pagina_inicio
+                >= anterior.numero_pagina_inicio
+                and secao.numero_pagina_fim
+                >= anterior.numero_pagina_fim
+            ):
+                fins = None
+                break
+            fins.append(secao.numero_pagina_fim)
+            anterior = secao
+        self._fins_paginas = fins
+
+    def calcular_hash(self, forcar: bool = False) -> str:
         """
         Calcula hash SHA-256 do arquivo.
 
-        Lê em chunks de 64KB para suportar arquivos grandes.
+        Enquanto tamanho e mtime do arquivo não mudam, o
+        hash já calculado é reaproveitado.
+
+        Arquivos a partir de 32 MB são mapeados em memória.
+        Os demais usam ``hashlib.file_digest`` (Python
+        3.11+), que lê em C e libera o GIL; em versões
+        anteriores, lê blocos de 1 MB num buffer
+        reaproveitado.
+
+        Args:
+            forcar: Relê o arquivo mesmo sem alteração
+                aparente
 
         Returns:
             String hexadecimal do hash SHA-256
@@ -133,16 +238,22 @@ class TextoEstruturado:
         Raises:
             TextoInvalidoException: Se houver erro de I/O
         """
-        sha256_hash = hashlib.sha256()
         try:
+            estado = os.stat(self.caminho_arquivo)
+            chave = (estado.st_size, estado.st_mtime_ns)
+            if (
+                not forcar
+                and self.hash_arquivo
+                and self._estado_hash == chave
+            ):
+                return self.hash_arquivo
+            # Sem buffer: os blocos vão direto ao hasher
             with open(
-                self.caminho_arquivo, "rb"
+                self.caminho_arquivo, "rb", buffering=0
             ) as f:
-                for bloco in iter(
-                    lambda: f.read(65536), b""
-                ):
-                    sha256_hash.update(bloco)
+                sha256_hash = sha256_arquivo(f)
             self.hash_arquivo = sha256_hash.hexdigest()
+            self._estado_hash = chave
             self._adicionar_ao_historico(
                 "Hash calculado",
                 {"hash": self.hash_arquivo},
@@ -168,12 +279,27 @@ class TextoEstruturado:
             raise ValueError(
                 "Seção não pode ser None"
             )
-        if secao.titulo in self._secoes_index:
+        # Uma única sondagem no índice: se nada entrou, o
+        # título já existia
+        total = len(self._secoes_index)
+        self._secoes_index.setdefault(secao.titulo, secao)
+        if len(self._secoes_index) == total:
             raise SecaoDuplicadaException(
                 f"Já existe seção '{secao.titulo}'"
             )
+        fins = self._fins_paginas
+        if fins is not None and self.secoes:
+            ultima = self.secoes[-1]
+            if (
+                secao.numero_pagina_inicio
+                < ultima.numero_pagina_inicio
+                or secao.numero_pagina_fim
+                < ultima.numero_pagina_fim
+            ):
+                fins = self._fins_paginas = None
+        if fins is not None:
+            fins.append(secao.numero_pagina_fim)
         self.secoes.append(secao)
-        self._secoes_index[secao.titulo] = secao
         self._adicionar_ao_historico(
             "Seção adicionada",
             {"titulo": secao.titulo},
@@ -196,6 +322,7 @@ class TextoEstruturado:
             )
         self.secoes.remove(secao)
         del self._secoes_index[titulo]
+        self._indexar_paginas()
         self._adicionar_ao_historico(
             "Seção removida", {"titulo": titulo}
         )
@@ -220,12 +347,26 @@ class TextoEstruturado:
         """
         Busca seção que contém determinada página.
 
+        Com seções em ordem de páginas, a busca é binária
+        sobre as páginas finais; havendo mais de uma seção
+        na página, retorna a primeira.
+
         Args:
             numero_pagina: Número da página (base 1)
 
         Returns:
             Secao ou None
         """
+        fins = self._fins_paginas
+        if fins is not None and len(fins) == len(self.secoes):
+            i = bisect.bisect_left(fins, numero_pagina)
+            if (
+                i < len(fins)
+                and self.secoes[i].numero_pagina_inicio
+                <= numero_pagina
+            ):
+                return self.secoes[i]
+            return None
         for secao in self.secoes:
             inicio = secao.numero_pagina_inicio
             fim = secao.numero_pagina_fim
@@ -245,10 +386,37 @@ class TextoEstruturado:
         Returns:
             Lista de seções com o status
         """
-        return [
-            s for s in self.secoes
-            if s.status == status
-        ]
+        return list(self.iterar_secoes_por_status(status))
+
+    def iterar_secoes_por_status(
+        self, status: StatusTexto
+    ) -> Iterator[Secao]:
+        """
+        Percorre as seções com o status, sem montar lista.
+
+        Args:
+            status: Status a filtrar
+
+        Returns:
+            Iterador sobre as seções com o status
+        """
+        return (s for s in self.secoes if s.status == status)
+
+    def contar_secoes_por_status(
+        self, status: StatusTexto
+    ) -> int:
+        """
+        Conta as seções com o status.
+
+        Args:
+            status: Status a contar
+
+        Returns:
+            Número de seções com o status
+        """
+        return sum(
+            1 for s in self.secoes if s.status == status
+        )
 
     def atualizar_status(
         self, novo_status: StatusTexto
@@ -273,6 +441,8 @@ class TextoEstruturado:
         """
         Verifica se arquivo corresponde ao hash.
 
+        Sempre relê o arquivo, ignorando o hash memorizado.
+
         Returns:
             True se íntegro, False caso contrário
 
@@ -284,7 +454,7 @@ class TextoEstruturado:
                 "Hash do arquivo não foi calculado"
             )
         hash_anterior = self.hash_arquivo
-        hash_atual = self.calcular_hash()
+        hash_atual = self.calcular_hash(forcar=True)
         return hash_atual == hash_anterior
 
     def _adicionar_ao_historico(
@@ -295,17 +465,42 @@ class TextoEstruturado:
         """
         Adiciona evento ao histórico.
 
+        O instante fica em nanossegundos desde a época e só
+        é formatado em ISO 8601 ao exportar.
+
         Args:
             evento: Descrição do evento
             detalhes: Detalhes adicionais
         """
         entrada = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time_ns(),
             "evento": evento,
             "detalhes": detalhes or {},
         }
         self.historico.append(entrada)
 
+    def historico_formatado(self) -> List[Dict[str, Any]]:
+        """
+        Retorna o histórico com instantes em ISO 8601.
+
+        Entradas restauradas de ``from_dict`` já trazem o
+        instante como texto e são mantidas.
+
+        Returns:
+            Cópia dos eventos, do mais antigo ao mais novo
+        """
+        return [
+            {
+                **entrada,
+                "timestamp": datetime.fromtimestamp(
+                    entrada["timestamp"] / 1e9
+                ).isoformat(),
+            }
+            if isinstance(entrada.get("timestamp"), int)
+            else entrada
+            for entrada in self.historico
+        ]
+
     @property
     def esta_completo(self) -> bool:
         """Verifica se todas as seções estão concluídas."""
@@ -321,20 +516,15 @@ class TextoEstruturado:
         """Percentual de conclusão (0.0 a 100.0)."""
         if not self.secoes:
             return 0.0
-        concluidas = len(
-            self.obter_secoes_por_status(
-                StatusTexto.CONCLUIDO
-            )
+        concluidas = self.contar_secoes_por_status(
+            StatusTexto.CONCLUIDO
         )
         return (concluidas / len(self.secoes)) * 100.0
 
     @property
     def total_erros_encontrados(self) -> int:
         """Total de erros em todas as seções."""
-        return sum(
-            len(s.obter_todos_erros())
-            for s in self.secoes
-        )
+        return sum(s.contar_erros() for s in self.secoes)
 
     def to_dict(self) -> Dict[str, Any]:
         """Serializa para dicionário."""
@@ -361,7 +551,7 @@ class TextoEstruturado:
             "hash_arquivo": self.hash_arquivo,
             "tamanho_bytes": self.tamanho_bytes,
             "numero_paginas": self.numero_paginas,
-            "historico": self.historico,
+            "historico": self.historico_formatado(),
             "analise_consistencia": self.analise_consistencia,
             "sintese_geral": self.sintese_geral,
         }
@@ -382,6 +572,12 @@ class TextoEstruturado:
         texto = cls(
             caminho_arquivo=data["caminho_arquivo"],
             nome_arquivo=data["nome_arquivo"],
+            data_carregamento=ler_data(
+                data.get("data_carregamento")
+            ),
+            data_ultima_modificacao=ler_data_opcional(
+                data.get("data_ultima_modificacao")
+            ),
             status=StatusTexto(
                 data.get("status", "pendente")
             ),
@@ -391,13 +587,20 @@ class TextoEstruturado:
                 "numero_paginas", 0
             ),
             historico=data.get("historico", []),
+            # Seções entram de uma vez: o índice é montado
+            # uma única vez e o histórico salvo não ganha
+            # eventos "Seção adicionada" a cada carga
+            secoes=[
+                Secao.from_dict(secao_data)
+                for secao_data in data.get("secoes", [])
+            ],
         )
+        if len(texto._secoes_index) != len(texto.secoes):
+            raise SecaoDuplicadaException(
+                "Títulos de seção duplicados nos dados"
+            )
         texto.analise_consistencia = data.get("analise_consistencia")
         texto.sintese_geral = data.get("sintese_geral")
-        
-        for secao_data in data.get("secoes", []):
-            secao = Secao.from_dict(secao_data)
-            texto.adicionar_secao(secao)
         return texto
 
     def __str__(self) -> str:
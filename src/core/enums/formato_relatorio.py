@@ -33,11 +33,13 @@ class FormatoRelatorio(Enum):
     @property
     def extensao(self) -> str:
         """Retorna a extensão de arquivo correspondente."""
-        extensoes = {
-            FormatoRelatorio.MARKDOWN: ".md",
-            FormatoRelatorio.HTML: ".html",
-            FormatoRelatorio.PDF: ".pdf",
-            FormatoRelatorio.DOCX: ".docx",
-            FormatoRelatorio.LATEX: ".tex",
-        }
-        return extensoes[self]
+        return _EXTENSOES[self]
+
+
+_EXTENSOES = {
+    FormatoRelatorio.MARKDOWN: ".md",
+    FormatoRelatorio.HTML: ".html",
+    FormatoRelatorio.PDF: ".pdf",
+    FormatoRelatorio.DOCX: ".docx",
+    FormatoRelatorio.LATEX: ".tex",
+}
@@ -46,16 +46,18 @@ class TipoErro(Enum):
     @property
     def descricao(self) -> str:
         """Retorna descrição detalhada do tipo de erro."""
-        descricoes = {
-            TipoErro.GRAMATICAL: "Erro gramatical ou ortográfico",
-            TipoErro.TECNICO: "Erro técnico ou científico",
-            TipoErro.JURIDICO: "Erro jurídico ou processual",
-            TipoErro.FORMATACAO: "Erro de formatação",
-            TipoErro.CONSISTENCIA: "Inconsistência entre seções",
-            TipoErro.REFERENCIA: "Erro em referência ou citação",
-            TipoErro.NUMERICO: "Erro numérico ou de cálculo",
-            TipoErro.LOGICO: "Erro de lógica ou raciocínio",
-            TipoErro.OMISSAO: "Informação omitida ou incompleta",
-            TipoErro.OUTRO: "Outro tipo de erro",
-        }
-        return descricoes.get(self, "Tipo desconhecido")
+        return _DESCRICOES.get(self, "Tipo desconhecido")
+
+
+_DESCRICOES = {
+    TipoErro.GRAMATICAL: "Erro gramatical ou ortográfico",
+    TipoErro.TECNICO: "Erro técnico ou científico",
+    TipoErro.JURIDICO: "Erro jurídico ou processual",
+    TipoErro.FORMATACAO: "Erro de formatação",
+    TipoErro.CONSISTENCIA: "Inconsistência entre seções",
+    TipoErro.REFERENCIA: "Erro em referência ou citação",
+    TipoErro.NUMERICO: "Erro numérico ou de cálculo",
+    TipoErro.LOGICO: "Erro de lógica ou raciocínio",
+    TipoErro.OMISSAO: "Informação omitida ou incompleta",
+    TipoErro.OUTRO: "Outro tipo de erro",
+}
@@ -40,3 +40,22 @@ class RevisaoInvalidaException(RevisaoException):
         super().__init__(
             mensagem, codigo="REVISAO_INVALIDA"
         )
+
+
+class ProcessamentoCanceladoException(RevisaoException):
+    """
+    Exceção para processamento interrompido pelo usuário.
+
+    Lançada quando o cancelamento é sinalizado durante
+    o pipeline, inclusive no meio de uma chamada à IA.
+    """
+
+    def __init__(
+        self,
+        mensagem: str = (
+            "Processamento interrompido pelo usuário."
+        ),
+    ) -> None:
+        super().__init__(
+            mensagem, codigo="PROCESSAMENTO_CANCELADO"
+        )
@@ -5,6 +5,7 @@ Define o contrato para comunicação com APIs
 de modelos de linguagem (Google Gemini).
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 
@@ -15,8 +16,37 @@ class IAIGateway(ABC):
 
     Define operações de geração de conteúdo e
     gerenciamento de métricas de uso.
+
+    Implementações devem manter um cliente HTTP de longa
+    duração, com pool de conexões, em vez de abrir uma
+    sessão por chamada. O gateway também é um gerenciador
+    de contexto assíncrono: ``async with`` chama
+    ``aquecer`` na entrada e ``encerrar`` na saída.
     """
 
+    async def aquecer(self) -> None:
+        """
+        Prepara conexões antes da primeira chamada.
+
+        Falhas devem ser apenas registradas. O padrão não
+        faz nada.
+        """
+
+    async def encerrar(self) -> None:
+        """
+        Libera recursos próprios do gateway.
+
+        Clientes compartilhados entre gateways não são
+        fechados aqui. O padrão não faz nada.
+        """
+
+    async def __aenter__(self) -> "IAIGateway":
+        await self.aquecer()
+        return self
+
+    async def __aexit__(self, *excecao: Any) -> None:
+        await self.encerrar()
+
     @abstractmethod
     async def gerar_conteudo(
         self,
@@ -40,6 +70,33 @@ class IAIGateway(ABC):
             Texto gerado pelo modelo
         """
 
+    async def gerar_conteudo_lote(
+        self,
+        requisicoes: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        Gera conteúdo para várias requisições.
+
+        Cada requisição traz os argumentos de
+        ``gerar_conteudo`` (``prompt`` e opcionais). A
+        implementação padrão dispara as chamadas juntas;
+        provedores com API de lote podem sobrescrever.
+
+        Args:
+            requisicoes: Argumentos de cada chamada
+
+        Returns:
+            Textos gerados, na ordem de ``requisicoes``
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.gerar_conteudo(**requisicao)
+                    for requisicao in requisicoes
+                )
+            )
+        )
+
     @abstractmethod
     def obter_metricas(self) -> Dict[str, Any]:
         """
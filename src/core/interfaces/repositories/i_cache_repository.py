@@ -5,8 +5,9 @@ Define o contrato para armazenamento em cache de
 respostas da API e resultados de processamento.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 
 class ICacheRepository(ABC):
@@ -45,6 +46,55 @@ class ICacheRepository(ABC):
             ttl_segundos: Tempo de vida em segundos
         """
 
+    async def obter_lote(
+        self, chaves: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Obtém vários valores do cache.
+
+        A implementação padrão consulta as chaves juntas;
+        backends com leitura múltipla (ex.: MGET) devem
+        sobrescrever para usar uma única ida ao servidor.
+
+        Args:
+            chaves: Chaves de busca
+
+        Returns:
+            Valores encontrados, indexados pela chave
+            (ausentes e expirados ficam de fora)
+        """
+        valores = await asyncio.gather(
+            *(self.obter(chave) for chave in chaves)
+        )
+        return {
+            chave: valor
+            for chave, valor in zip(chaves, valores)
+            if valor is not None
+        }
+
+    async def armazenar_lote(
+        self,
+        itens: Dict[str, Any],
+        ttl_segundos: int = 3600,
+    ) -> None:
+        """
+        Armazena vários valores no cache.
+
+        A implementação padrão grava os itens juntos;
+        backends com escrita múltipla (ex.: pipeline com
+        MSET) devem sobrescrever.
+
+        Args:
+            itens: Valores indexados pela chave
+            ttl_segundos: Tempo de vida em segundos
+        """
+        await asyncio.gather(
+            *(
+                self.armazenar(chave, valor, ttl_segundos)
+                for chave, valor in itens.items()
+            )
+        )
+
     @abstractmethod
     async def remover(self, chave: str) -> None:
         """
@@ -22,6 +22,10 @@ class IConfigRepository(ABC):
         """
         Carrega configuração completa do sistema.
 
+        Implementações baseadas em arquivo devem reutilizar
+        o conteúdo já parseado enquanto o mtime do arquivo
+        não mudar.
+
         Returns:
             Dicionário com todas as configurações
         """
@@ -71,6 +75,10 @@ class IConfigRepository(ABC):
         """
         Carrega template de prompt por tipo.
 
+        Como em ``carregar_configuracao``, o arquivo só
+        deve ser relido quando mudar; cada chamada devolve
+        um dicionário que o chamador pode alterar.
+
         Args:
             tipo: Tipo do prompt (ex: "revisao_tecnica")
 
@@ -5,12 +5,17 @@ Define o contrato para agentes que realizam
 revisão de conteúdo usando modelos de IA.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from ...entities.secao import Secao
 from ...entities.revisao import Revisao
 
+# Chamadas simultâneas do ``processar_lote`` padrão quando a
+# configuração não informa ``max_concorrencia``
+MAX_CONCORRENCIA_LOTE_PADRAO = 3
+
 
 class IAIAgent(ABC):
     """
@@ -38,6 +43,80 @@ class IAIAgent(ABC):
             Resultado da revisão
         """
 
+    async def processar_lote(
+        self,
+        secoes: List[Secao],
+        configuracao: Dict[str, Any],
+    ) -> List[Optional[Revisao]]:
+        """
+        Processa várias seções.
+
+        A implementação padrão chama ``processar`` para
+        cada seção, no máximo ``max_concorrencia`` por vez;
+        agentes que revisam várias seções numa única
+        chamada à IA sobrescrevem.
+
+        Args:
+            secoes: Seções a processar
+            configuracao: Configurações do agente; a chave
+                opcional ``textos_entrada`` traz o texto de
+                cada seção e ``max_concorrencia`` limita as
+                chamadas simultâneas
+
+        Returns:
+            Revisões na ordem de ``secoes`` (None se ausente)
+        """
+        textos = configuracao.get("textos_entrada") or [
+            secao.conteudo_original for secao in secoes
+        ]
+        base = {
+            nome: valor
+            for nome, valor in configuracao.items()
+            if nome not in ("textos_entrada", "max_concorrencia")
+        }
+        semaforo = asyncio.Semaphore(
+            max(
+                1,
+                int(
+                    configuracao.get(
+                        "max_concorrencia",
+                        MAX_CONCORRENCIA_LOTE_PADRAO,
+                    )
+                ),
+            )
+        )
+
+        async def _processar(
+            secao: Secao, texto: str
+        ) -> Revisao:
+            async with semaforo:
+                return await self.processar(
+                    secao, {**base, "texto_entrada": texto}
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    _processar(secao, texto)
+                    for secao, texto in zip(secoes, textos)
+                )
+            )
+        )
+
+    @property
+    def suporta_lote(self) -> bool:
+        """
+        Se ``processar_lote`` revisa várias seções por chamada.
+
+        Falso quando o agente herda a implementação padrão,
+        que apenas repassa cada seção a ``processar``.
+        Decoradores devem informar o agente decorado.
+        """
+        return (
+            type(self).processar_lote
+            is not IAIAgent.processar_lote
+        )
+
     @abstractmethod
     async def gerar_sintese(
         self, contexto: Dict[str, Any]
@@ -5,8 +5,9 @@ Define o contrato para logging estruturado
 utilizado por todos os componentes.
 """
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Dict, Iterable, Tuple
 
 
 class ILogger(ABC):
@@ -14,7 +15,10 @@ class ILogger(ABC):
     Interface para sistema de logging.
 
     Define operações de logging em diferentes níveis
-    para rastreamento e debugging do sistema.
+    para rastreamento e debugging do sistema. Os
+    métodos por nível registram uma mensagem a cada
+    chamada; laços que produzem muitas mensagens
+    devem preferir ``log_batch``.
     """
 
     @abstractmethod
@@ -42,3 +46,35 @@ class ILogger(ABC):
         self, mensagem: str, **kwargs: Any
     ) -> None:
         """Registra erro crítico."""
+
+    def log_batch(
+        self,
+        nivel: int,
+        registros: Iterable[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        """
+        Registra várias mensagens de um mesmo nível.
+
+        A implementação padrão repassa cada registro ao
+        método do nível correspondente; implementações
+        podem descartar o lote inteiro de uma vez quando
+        o nível estiver desabilitado, sem consumir
+        ``registros`` (que pode ser um gerador).
+
+        Args:
+            nivel: Nível do módulo ``logging`` (ex.:
+                ``logging.INFO``)
+            registros: Pares (mensagem, campos extras)
+        """
+        if nivel >= logging.CRITICAL:
+            metodo = self.critical
+        elif nivel >= logging.ERROR:
+            metodo = self.error
+        elif nivel >= logging.WARNING:
+            metodo = self.warning
+        elif nivel >= logging.INFO:
+            metodo = self.info
+        else:
+            metodo = self.debug
+        for mensagem, extras in registros:
+            metodo(mensagem, **extras)
@@ -7,7 +7,7 @@ e detecção de seções em arquivos PDF.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ...value_objects.metadados_pdf import MetadadosPDF
 
@@ -56,18 +56,42 @@ class IPdfProcessor(ABC):
 
     @abstractmethod
     async def extrair_texto(
-        self, caminho: str
+        self,
+        caminho: str,
+        hash_arquivo: Optional[str] = None,
     ) -> str:
         """
         Extrai texto completo do PDF.
 
         Args:
             caminho: Caminho do arquivo PDF
+            hash_arquivo: SHA-256 do arquivo, se o chamador
+                já o calculou; processadores com cache o
+                usam como chave em vez de reler o arquivo
 
         Returns:
             Texto completo extraído
         """
 
+    async def extrair_texto_stream(
+        self, caminho: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Extrai texto entregando-o página a página.
+
+        A implementação padrão entrega o resultado de
+        ``extrair_texto`` como um único bloco (página 1);
+        processadores capazes de ler por página devem
+        sobrescrevê-la.
+
+        Args:
+            caminho: Caminho do arquivo PDF
+
+        Yields:
+            Tuplas (número da página, texto), em ordem
+        """
+        yield 1, await self.extrair_texto(caminho)
+
     @abstractmethod
     async def extrair_metadados(
         self, caminho: str
@@ -99,6 +123,30 @@ class IPdfProcessor(ABC):
             Lista de seções detectadas
         """
 
+    async def detectar_secoes_stream(
+        self,
+        texto: str,
+        numero_paginas: int = 0,
+    ) -> AsyncIterator[SecaoDetectada]:
+        """
+        Detecta seções entregando-as à medida que surgem.
+
+        A implementação padrão percorre o resultado de
+        ``detectar_secoes``; processadores capazes de
+        detectar incrementalmente devem sobrescrevê-la.
+
+        Args:
+            texto: Texto completo do PDF
+            numero_paginas: Total de páginas
+
+        Yields:
+            Cada seção detectada, em ordem
+        """
+        for secao in await self.detectar_secoes(
+            texto, numero_paginas
+        ):
+            yield secao
+
     @abstractmethod
     async def extrair_texto_por_pagina(
         self, caminho: str, pagina: int
@@ -113,3 +161,28 @@ class IPdfProcessor(ABC):
         Returns:
             Texto da página
         """
+
+    async def extrair_texto_paginas(
+        self, caminho: str, paginas: List[int]
+    ) -> Dict[int, str]:
+        """
+        Extrai texto de várias páginas de uma vez.
+
+        A implementação padrão chama
+        ``extrair_texto_por_pagina`` para cada página;
+        processadores capazes de abrir o documento uma
+        única vez devem sobrescrevê-la.
+
+        Args:
+            caminho: Caminho do PDF
+            paginas: Números das páginas (base 1)
+
+        Returns:
+            Texto de cada página, indexado pelo número
+        """
+        return {
+            pagina: await self.extrair_texto_por_pagina(
+                caminho, pagina
+            )
+            for pagina in paginas
+        }
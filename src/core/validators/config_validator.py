@@ -8,20 +8,20 @@ do aplicativo e prompts de IA.
 from typing import List, Tuple, Dict, Any
 
 # Chaves obrigatórias na configuração principal
-CHAVES_OBRIGATORIAS = [
+CHAVES_OBRIGATORIAS = frozenset({
     "gemini_model",
     "max_retries",
     "timeout",
-]
+})
 
 # Modelos Gemini suportados
-MODELOS_SUPORTADOS = [
+MODELOS_SUPORTADOS = frozenset({
     "gemini-1.5-pro",
     "gemini-1.5-flash",
     "gemini-2.0-flash",
     "gemini-2.0-flash-lite",
     "gemini-2.5-pro-preview-05-06",
-]
+})
 
 
 class ConfigValidator:
@@ -66,16 +66,12 @@ class ConfigValidator:
         self, config: Dict[str, Any]
     ) -> List[str]:
         """Verifica presença de chaves obrigatórias."""
-        erros: List[str] = []
-
-        for chave in CHAVES_OBRIGATORIAS:
-            if chave not in config:
-                erros.append(
-                    f"Configuração obrigatória "
-                    f"ausente: '{chave}'"
-                )
-
-        return erros
+        return [
+            f"Configuração obrigatória ausente: '{chave}'"
+            for chave in sorted(
+                CHAVES_OBRIGATORIAS - config.keys()
+            )
+        ]
 
     def _validar_modelo(
         self, config: Dict[str, Any]
@@ -87,7 +83,7 @@ class ConfigValidator:
         if modelo and modelo not in MODELOS_SUPORTADOS:
             erros.append(
                 f"Modelo não suportado: '{modelo}'. "
-                f"Suportados: {MODELOS_SUPORTADOS}"
+                f"Suportados: {sorted(MODELOS_SUPORTADOS)}"
             )
 
         return erros
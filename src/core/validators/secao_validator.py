@@ -13,6 +13,10 @@ from ..entities.secao import Secao
 MIN_CONTEUDO_CHARS = 10
 # Tamanho máximo de conteúdo por seção (caracteres)
 MAX_CONTEUDO_CHARS = 500_000
+# Tamanho máximo do título (caracteres)
+MAX_TITULO_CHARS = 200
+# Páginas acima das quais a seção é extensa demais
+MAX_PAGINAS_SECAO = 100
 
 
 class SecaoValidator:
@@ -47,6 +51,37 @@ class SecaoValidator:
 
         return len(erros) == 0, erros
 
+    def validar_lote(
+        self, secoes: List[Secao]
+    ) -> List[Tuple[bool, List[str]]]:
+        """
+        Valida várias seções de uma vez.
+
+        Seções válidas passam por uma checagem única, sem
+        montar listas de erros; só as inválidas seguem
+        para ``validar``, que gera as mensagens.
+
+        Args:
+            secoes: Seções a validar
+
+        Returns:
+            Tuplas (é_válido, lista_de_erros) na ordem de
+            ``secoes``
+        """
+        resultados: List[Tuple[bool, List[str]]] = []
+        for secao in secoes:
+            if (
+                MIN_CONTEUDO_CHARS
+                <= secao.tamanho_conteudo
+                <= MAX_CONTEUDO_CHARS
+                and len(secao.titulo) <= MAX_TITULO_CHARS
+                and secao.numero_paginas <= MAX_PAGINAS_SECAO
+            ):
+                resultados.append((True, []))
+            else:
+                resultados.append(self.validar(secao))
+        return resultados
+
     def _validar_conteudo(
         self, secao: Secao
     ) -> List[str]:
@@ -74,9 +109,10 @@ class SecaoValidator:
         """Valida título da seção."""
         erros: List[str] = []
 
-        if len(secao.titulo) > 200:
+        if len(secao.titulo) > MAX_TITULO_CHARS:
             erros.append(
-                "Título muito longo (máximo: 200 chars)"
+                f"Título muito longo "
+                f"(máximo: {MAX_TITULO_CHARS} chars)"
             )
 
         return erros
@@ -87,7 +123,7 @@ class SecaoValidator:
         """Valida paginação da seção."""
         erros: List[str] = []
 
-        if secao.numero_paginas > 100:
+        if secao.numero_paginas > MAX_PAGINAS_SECAO:
             erros.append(
                 f"Seção muito extensa: "
                 f"{secao.numero_paginas} páginas"
@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetadadosPDF:
     """
     Metadados extraídos de um arquivo PDF.
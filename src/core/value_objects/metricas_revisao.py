@@ -5,11 +5,11 @@ Define as métricas coletadas durante o processo
 de revisão de uma seção ou texto completo.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from collections import Counter
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricasRevisao:
     """
     Métricas coletadas durante o processo de revisão.
@@ -38,18 +38,22 @@ class MetricasRevisao:
 
     total_iteracoes: int = 0
     total_erros: int = 0
-    erros_por_tipo: Dict[str, int] = None  # type: ignore
+    erros_por_tipo: "Counter[str]" = field(
+        default_factory=Counter
+    )
     tokens_consumidos: int = 0
     tempo_processamento_seg: float = 0.0
     convergiu: bool = False
     custo_estimado_usd: float = 0.0
 
     def __post_init__(self) -> None:
-        """Inicializa valores default para campos mutáveis."""
-        if self.erros_por_tipo is None:
-            # Workaround para frozen dataclass com dict
+        """Aceita dict ou None em ``erros_por_tipo``."""
+        if not isinstance(self.erros_por_tipo, Counter):
+            # Workaround para frozen dataclass
             object.__setattr__(
-                self, "erros_por_tipo", {}
+                self,
+                "erros_por_tipo",
+                Counter(self.erros_por_tipo or {}),
             )
 
     def to_dict(self) -> dict:
@@ -0,0 +1,322 @@
+"""
+Agente com cache persistente de revisões.
+
+Decorador de ``IAIAgent`` que memoriza a ``Revisao``
+produzida para um mesmo texto de entrada, agente, modelo
+e parâmetros. Reprocessar um documento (ou seções que se
+repetem entre documentos) evita a chamada à IA.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from ...core.entities.revisao import Revisao
+from ...core.entities.secao import Secao
+from ...core.interfaces.services.i_ai_agent import (
+    IAIAgent,
+)
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando o formato da revisão mudar
+VERSAO_CACHE = 1
+
+# Revisões mantidas em memória além do cache em disco
+MAX_ENTRADAS_MEMORIA = 256
+
+# Chaves da configuração que não influenciam a resposta
+_CHAVES_IGNORADAS = frozenset(
+    {"texto_entrada", "textos_entrada"}
+)
+
+
+def _normalizar(texto: str) -> str:
+    """Remove diferenças irrelevantes de espaçamento."""
+    return "\n".join(
+        linha.rstrip() for linha in texto.strip().splitlines()
+    )
+
+
+class AgenteComCache(IAIAgent):
+    """
+    Cache de revisões sobre outro agente.
+
+    A chave é o SHA-256 do nome do agente, do modelo, do
+    template do prompt, dos parâmetros da chamada e do
+    texto de entrada normalizado.
+    Mantém um LRU de revisões em memória e arquivos JSON
+    (``<sha256>.json``), sobrevivendo a reinícios. Respostas
+    inválidas não são armazenadas, pois o agente interno
+    levanta exceção antes.
+
+    Attributes:
+        _interno: Agente que faz a revisão real
+        _diretorio: Diretório do cache em disco
+        _memoria: LRU chave -> revisão serializada
+    """
+
+    def __init__(
+        self,
+        interno: IAIAgent,
+        diretorio_cache: str = ".cache/revisoes",
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            interno: Agente a decorar
+            diretorio_cache: Diretório para os JSONs
+        """
+        self._interno = interno
+        self._diretorio = Path(diretorio_cache)
+        self._memoria: "OrderedDict[str, Dict[str, Any]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def _gateway(self) -> Any:
+        """Gateway do agente interno (limpeza de cache)."""
+        return getattr(self._interno, "_gateway", None)
+
+    @functools.cached_property
+    def _modelo(self) -> str:
+        """Modelo do gateway; fixo durante a vida do agente."""
+        if self._gateway is None:
+            return ""
+        return self._gateway.obter_info_modelo().get(
+            "modelo", ""
+        )
+
+    def _chave(
+        self, secao: Secao, configuracao: Dict[str, Any]
+    ) -> str:
+        """Calcula a chave da revisão."""
+        texto = configuracao.get(
+            "texto_entrada", secao.conteudo_original
+        )
+        parametros = sorted(
+            (nome, repr(valor))
+            for nome, valor in configuracao.items()
+            if nome not in _CHAVES_IGNORADAS
+        )
+        h = hashlib.sha256()
+        for parte in (
+            self._interno.obter_nome(),
+            self._modelo,
+            self._template(configuracao),
+            repr(parametros),
+            _normalizar(texto),
+        ):
+            h.update(parte.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _template(self, configuracao: Dict[str, Any]) -> str:
+        """
+        Prompt do agente interno renderizado sem o texto.
+
+        Entra na chave para que editar os templates invalide
+        as revisões gravadas com o prompt anterior.
+        """
+        construir = getattr(
+            self._interno, "_construir_prompt", None
+        )
+        if construir is None:
+            return ""
+        try:
+            return construir("", configuracao.get("tipo"))
+        except ValueError:
+            # O agente interno falhará com o mesmo erro
+            return ""
+
+    async def processar(
+        self,
+        secao: Secao,
+        configuracao: Dict[str, Any],
+    ) -> Revisao:
+        """
+        Processa a seção, reutilizando revisão em cache.
+
+        Args:
+            secao: Seção a ser processada
+            configuracao: Configurações do agente
+
+        Returns:
+            Revisão nova ou reconstruída do cache
+        """
+        chave = self._chave(secao, configuracao)
+        revisao = await self._buscar(chave, secao)
+        if revisao is not None:
+            return revisao
+
+        revisao = await self._interno.processar(
+            secao, configuracao
+        )
+        await self._guardar(chave, revisao)
+        return revisao
+
+    @property
+    def suporta_lote(self) -> bool:
+        """Lote de verdade só se o agente interno o tiver."""
+        return self._interno.suporta_lote
+
+    async def processar_lote(
+        self,
+        secoes: List[Secao],
+        configuracao: Dict[str, Any],
+    ) -> List[Optional[Revisao]]:
+        """
+        Revisa um lote, enviando ao agente só as faltantes.
+
+        As chaves são as mesmas de ``processar``, então
+        revisões obtidas em lote servem chamadas avulsas e
+        vice-versa.
+
+        Args:
+            secoes: Seções a revisar
+            configuracao: Configurações do agente, com
+                ``textos_entrada`` opcional
+
+        Returns:
+            Revisões na ordem de ``secoes`` (None se ausente)
+        """
+        textos = configuracao.get("textos_entrada") or [
+            secao.conteudo_original for secao in secoes
+        ]
+        base = {
+            nome: valor
+            for nome, valor in configuracao.items()
+            if nome != "textos_entrada"
+        }
+        chaves = [
+            self._chave(secao, {**base, "texto_entrada": texto})
+            for secao, texto in zip(secoes, textos)
+        ]
+        revisoes: List[Optional[Revisao]] = [
+            await self._buscar(chave, secao)
+            for chave, secao in zip(chaves, secoes)
+        ]
+        faltantes = [
+            i for i, revisao in enumerate(revisoes)
+            if revisao is None
+        ]
+        if not faltantes:
+            return revisoes
+
+        novas = await self._interno.processar_lote(
+            [secoes[i] for i in faltantes],
+            {**base, "textos_entrada": [
+                textos[i] for i in faltantes
+            ]},
+        )
+        for i, revisao in zip(faltantes, novas):
+            if revisao is not None:
+                revisoes[i] = revisao
+                await self._guardar(chaves[i], revisao)
+        return revisoes
+
+    async def _buscar(
+        self, chave: str, secao: Secao
+    ) -> Optional[Revisao]:
+        """Procura a revisão em memória e depois em disco."""
+        dados = self._memoria.get(chave)
+        if dados is None:
+            dados = await asyncio.to_thread(
+                self._ler_disco, chave
+            )
+            if dados is None:
+                return None
+            self._lembrar(chave, dados)
+        else:
+            self._memoria.move_to_end(chave)
+        logger.debug(
+            f"Revisão em cache ({self.obter_nome()}): "
+            f"'{secao.titulo}'"
+        )
+        # Instância nova a cada acerto: o chamador
+        # reescreve iteração e texto de entrada
+        return Revisao.from_dict(dados)
+
+    async def _guardar(
+        self, chave: str, revisao: Revisao
+    ) -> None:
+        """Armazena a revisão em memória e em disco."""
+        dados = revisao.to_dict()
+        self._lembrar(chave, dados)
+        await asyncio.to_thread(
+            self._gravar_disco, chave, dados
+        )
+
+    def _lembrar(
+        self, chave: str, dados: Dict[str, Any]
+    ) -> None:
+        """Insere no LRU em memória, descartando a mais antiga."""
+        self._memoria[chave] = dados
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > MAX_ENTRADAS_MEMORIA:
+            self._memoria.popitem(last=False)
+
+    async def gerar_sintese(
+        self, contexto: Dict[str, Any]
+    ) -> str:
+        """Delega a síntese ao agente interno."""
+        return await self._interno.gerar_sintese(contexto)
+
+    def obter_nome(self) -> str:
+        return self._interno.obter_nome()
+
+    def obter_descricao(self) -> str:
+        return self._interno.obter_descricao()
+
+    def limpar_cache(self) -> None:
+        """Descarta as revisões em memória."""
+        self._memoria.clear()
+
+    def _ler_disco(
+        self, chave: str
+    ) -> Optional[Dict[str, Any]]:
+        """Lê entrada do cache em disco, se válida."""
+        caminho = self._diretorio / f"{chave}.json"
+        try:
+            bruto = caminho.read_bytes()
+        except OSError:
+            return None
+        try:
+            if orjson is not None:
+                dados = orjson.loads(bruto)
+            else:
+                dados = json.loads(bruto.decode("utf-8"))
+        except ValueError as e:
+            logger.warning(f"Cache de revisão corrompido: {e}")
+            return None
+        if dados.get("versao") != VERSAO_CACHE:
+            return None
+        return dados.get("revisao")
+
+    def _gravar_disco(
+        self, chave: str, revisao: Dict[str, Any]
+    ) -> None:
+        """Grava entrada no cache em disco (falhas são ignoradas)."""
+        dados = {"versao": VERSAO_CACHE, "revisao": revisao}
+        try:
+            self._diretorio.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                bruto = orjson.dumps(dados)
+            else:
+                bruto = json.dumps(
+                    dados, ensure_ascii=False
+                ).encode("utf-8")
+            (self._diretorio / f"{chave}.json").write_bytes(bruto)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache de revisão: {e}")
@@ -7,7 +7,12 @@ validação, consistência e síntese.
 
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from ...core.interfaces.services.i_ai_agent import (
     IAIAgent,
@@ -20,12 +25,61 @@ from ...core.enums.tipo_erro import TipoErro
 from ...core.exceptions.agent_exceptions import (
     InvalidResponseException,
 )
-from .prompt_builder import PromptBuilder
+from .prompt_builder import (
+    PROMPT_REVISAO_LOTE,
+    PROMPT_REVISAO_MULTIPLA,
+    PromptBuilder,
+    compilar_template,
+)
 from ...core.interfaces.gateways.i_ai_gateway import IAIGateway
 
 logger = logging.getLogger(__name__)
 
 
+def _extrair_json(resposta: str) -> Dict[str, Any]:
+    """
+    Extrai o objeto JSON de uma resposta da IA.
+
+    Tolera conversa antes/depois do JSON e blocos de
+    código markdown.
+
+    Raises:
+        json.JSONDecodeError: Se não houver JSON válido
+    """
+    # Seleção robusta do bloco JSON (caso a IA mande conversa antes/depois)
+    json_str = resposta.strip()
+
+    # Tenta encontrar o primeiro '{' e o último '}'
+    idx_start = json_str.find('{')
+    idx_end = json_str.rfind('}')
+
+    if idx_start != -1 and idx_end != -1:
+        json_str = json_str[idx_start:idx_end+1]
+
+    # Limpar blocos de código markdown se ainda existirem
+    if "```json" in json_str:
+        json_str = json_str.split("```json")[-1].split("```")[0]
+    elif "```" in json_str:
+        json_str = json_str.split("```")[-1].split("```")[0]
+
+    json_str = json_str.strip()
+    if orjson is not None:
+        # orjson.JSONDecodeError herda de json.JSONDecodeError
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+
+def _para_json(dados: Any) -> str:
+    """Serializa dados para inclusão em prompts."""
+    if orjson is not None:
+        return orjson.dumps(
+            dados,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(dados, ensure_ascii=False, default=str)
+
+
 class AgenteRevisor(IAIAgent):
     """
     Agente de revisão de texto.
@@ -71,9 +125,7 @@ class AgenteRevisor(IAIAgent):
         texto_para_revisao = configuracao.get(
             "texto_entrada", secao.conteudo_original
         )
-        prompt = self._prompt_builder.construir(
-            tipo, texto=texto_para_revisao
-        )
+        prompt = self._construir_prompt(texto_para_revisao, tipo)
 
         info_ia = self._gateway.obter_info_modelo()
         provedor = info_ia.get("provedor", "IA")
@@ -110,9 +162,7 @@ class AgenteRevisor(IAIAgent):
             f"━━━ INÍCIO fase 'síntese'{mock_tag}"
         )
         prompt = self._prompt_builder.construir(
-            "sintese", dados=json.dumps(
-                contexto, ensure_ascii=False
-            )
+            "sintese", dados=_para_json(contexto)
         )
         resultado = await self._gateway.gerar_conteudo(
             prompt=prompt, temperatura=0.5, origem=f"{self.obter_nome()}_sintese"
@@ -142,74 +192,10 @@ class AgenteRevisor(IAIAgent):
         )
 
         try:
-            # Seleção robusta do bloco JSON (caso a IA mande conversa antes/depois)
-            json_str = resposta.strip()
-            
-            # Tenta encontrar o primeiro '{' e o último '}'
-            idx_start = json_str.find('{')
-            idx_end = json_str.rfind('}')
-            
-            if idx_start != -1 and idx_end != -1:
-                json_str = json_str[idx_start:idx_end+1]
-            
-            # Limpar blocos de código markdown se ainda existirem
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[-1].split("```")[0]
-            elif "```" in json_str:
-                json_str = json_str.split("```")[-1].split("```")[0]
-
-            dados = json.loads(json_str.strip())
+            dados = _extrair_json(resposta)
+            self._preencher_revisao(revisao, dados, secao)
 
-            # Extrair erros
-            for erro_data in dados.get("erros", []):
-                tipo = self._mapear_tipo_erro(
-                    erro_data.get("tipo", "outro")
-                )
-                # Fallback em cascata para garantir descrição não vazia
-                descricao = (
-                    erro_data.get("justificativa") or 
-                    erro_data.get("descricao") or 
-                    erro_data.get("tipo") or 
-                    "Ajuste sugerido pela IA"
-                )
-                
-                # Garantir que trecho_original tenha algo (fallback pro texto da seção se nulo)
-                trecho_orig = erro_data.get("trecho_original") or ""
-                sugestao = erro_data.get("sugestao_correcao") or ""
-
-                erro = Erro(
-                    tipo=tipo,
-                    descricao=descricao,
-                    trecho_original=trecho_orig,
-                    sugestao_correcao=sugestao,
-                    severidade=min(
-                        5,
-                        max(
-                            1,
-                            erro_data.get(
-                                "severidade", 1
-                            ),
-                        ),
-                    ),
-                    agente_origem=self.obter_nome(),
-                )
-                revisao.adicionar_erro(erro)
-
-                correcao = Correcao(
-                    texto_original=trecho_orig,
-                    texto_corrigido=sugestao,
-                    justificativa=descricao,
-                    agente_origem=self.obter_nome(),
-                )
-                revisao.adicionar_correcao(correcao)
-
-            # Texto revisado
-            revisao.texto_saida = dados.get(
-                "texto_revisado",
-                secao.conteudo_original,
-            )
-
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, AttributeError) as e:
             logger.error(
                 f"Falha ao parsear resposta JSON: {e} "
                 f"| Resposta (trecho): "
@@ -226,6 +212,180 @@ class AgenteRevisor(IAIAgent):
 
         return revisao
 
+    def _preencher_revisao(
+        self,
+        revisao: Revisao,
+        dados: Dict[str, Any],
+        secao: Secao,
+    ) -> None:
+        """Preenche a revisão com o JSON de uma seção."""
+        self._adicionar_erros(
+            revisao, dados.get("erros", []), self.obter_nome()
+        )
+
+        # Texto revisado
+        revisao.texto_saida = dados.get(
+            "texto_revisado",
+            secao.conteudo_original,
+        )
+
+    async def processar_lote(
+        self,
+        secoes: List[Secao],
+        configuracao: Dict[str, Any],
+    ) -> List[Optional[Revisao]]:
+        """
+        Revisa várias seções numa única chamada à IA.
+
+        As seções são delimitadas por marcadores no prompt
+        e a resposta traz um objeto JSON por seção.
+
+        Args:
+            secoes: Seções a revisar
+            configuracao: Configurações do agente; a chave
+                ``textos_entrada`` traz o texto de cada seção
+
+        Returns:
+            Revisões na ordem de ``secoes``; None para
+            seções ausentes da resposta
+
+        Raises:
+            InvalidResponseException: Se o JSON for inválido
+        """
+        textos = configuracao.get("textos_entrada") or [
+            secao.conteudo_original for secao in secoes
+        ]
+        tipo = configuracao.get("tipo", self._tipo_revisao)
+        mock_tag = " [MOCK]" if self._gateway._modo_mock else ""
+        logger.info(
+            f"━━━ INÍCIO fase '{tipo}' (lote){mock_tag} "
+            f"| {len(secoes)} seções "
+            f"| Tamanho: {sum(map(len, textos))} chars"
+        )
+
+        blocos = "\n".join(
+            f"<<<SEC id={i}>>>\n{texto}\n<<<END>>>"
+            for i, texto in enumerate(textos, 1)
+        )
+        prompt = compilar_template(PROMPT_REVISAO_LOTE)(
+            {
+                "total": len(secoes),
+                "instrucoes": self._construir_prompt(blocos, tipo),
+            }
+        )
+
+        resposta = await self._gateway.gerar_conteudo(
+            prompt=prompt,
+            temperatura=configuracao.get("temperatura", 0.3),
+            max_tokens=configuracao.get("max_tokens", 8192),
+            origem=self.obter_nome(),
+        )
+        logger.info(
+            f"━━━ FIM fase '{tipo}' (lote){mock_tag} "
+            f"| {len(secoes)} seções"
+        )
+
+        try:
+            itens = _extrair_json(resposta)["secoes"]
+            por_id = {
+                int(item["id"]): item
+                for item in itens
+                if isinstance(item, dict) and "id" in item
+            }
+        except (
+            json.JSONDecodeError, KeyError, TypeError, ValueError
+        ) as e:
+            logger.error(
+                f"Falha ao parsear resposta JSON do lote: {e} "
+                f"| Resposta (trecho): "
+                f"{resposta[:200]!r}"
+            )
+            raise InvalidResponseException(
+                f"A resposta da IA para o lote não é um JSON "
+                f"válido. Detalhes: {e}"
+            )
+
+        revisoes: List[Optional[Revisao]] = []
+        for i, (secao, texto) in enumerate(
+            zip(secoes, textos), 1
+        ):
+            item = por_id.get(i)
+            if item is None:
+                revisoes.append(None)
+                continue
+            revisao = Revisao(
+                numero_iteracao=0,
+                texto_entrada=texto,
+                agente=self.obter_nome(),
+            )
+            self._preencher_revisao(revisao, item, secao)
+            revisoes.append(revisao)
+        return revisoes
+
+    def _construir_prompt(
+        self, texto: str, tipo: Optional[str] = None
+    ) -> str:
+        """Constrói o prompt de revisão para o texto."""
+        return self._prompt_builder.construir(
+            tipo or self._tipo_revisao, texto=texto
+        )
+
+    def _adicionar_erros(
+        self,
+        revisao: Revisao,
+        erros: List[Dict[str, Any]],
+        agente_origem: str,
+    ) -> None:
+        """
+        Converte erros do JSON em Erro/Correcao na revisão.
+
+        Args:
+            revisao: Revisão a preencher
+            erros: Lista de erros do JSON da IA
+            agente_origem: Agente creditado pelos erros
+        """
+        for erro_data in erros:
+            tipo = self._mapear_tipo_erro(
+                erro_data.get("tipo", "outro")
+            )
+            # Fallback em cascata para garantir descrição não vazia
+            descricao = (
+                erro_data.get("justificativa") or 
+                erro_data.get("descricao") or 
+                erro_data.get("tipo") or 
+                "Ajuste sugerido pela IA"
+            )
+            
+            # Garantir que trecho_original tenha algo (fallback pro texto da seção se nulo)
+            trecho_orig = erro_data.get("trecho_original") or ""
+            sugestao = erro_data.get("sugestao_correcao") or ""
+
+            erro = Erro(
+                tipo=tipo,
+                descricao=descricao,
+                trecho_original=trecho_orig,
+                sugestao_correcao=sugestao,
+                severidade=min(
+                    5,
+                    max(
+                        1,
+                        erro_data.get(
+                            "severidade", 1
+                        ),
+                    ),
+                ),
+                agente_origem=agente_origem,
+            )
+            revisao.adicionar_erro(erro)
+
+            correcao = Correcao(
+                texto_original=trecho_orig,
+                texto_corrigido=sugestao,
+                justificativa=descricao,
+                agente_origem=agente_origem,
+            )
+            revisao.adicionar_correcao(correcao)
+
     def _mapear_tipo_erro(
         self, tipo_str: str
     ) -> TipoErro:
@@ -262,6 +422,113 @@ class AgenteRevisor(IAIAgent):
         )
 
 
+class AgenteMultiRevisor(AgenteRevisor):
+    """
+    Agente que executa várias revisões numa única chamada.
+
+    Compõe os prompts das fases independentes (ex.:
+    gramatical e técnica) em um só pedido cuja resposta
+    JSON traz os erros de cada fase separadamente. Os
+    erros continuam creditados ao revisor de cada fase,
+    mas a API é chamada uma vez por iteração.
+    """
+
+    # Substitui o texto nos prompts das tarefas individuais
+    _REFERENCIA_TEXTO = "(ver TEXTO PARA REVISÃO ao final)"
+
+    def __init__(
+        self,
+        gateway: IAIGateway,
+        prompt_builder: PromptBuilder,
+        tarefas: Sequence[str] = (
+            "revisao_gramatical",
+            "revisao_tecnica",
+        ),
+    ) -> None:
+        super().__init__(
+            gateway, prompt_builder, tipo_revisao=tarefas[0]
+        )
+        self._tarefas = tuple(tarefas)
+
+    async def processar(
+        self,
+        secao: Secao,
+        configuracao: Dict[str, Any],
+    ) -> Revisao:
+        """Processa seção com todas as revisões de uma vez."""
+        mock_tag = " [MOCK]" if self._gateway._modo_mock else ""
+        logger.info(
+            f"━━━ INÍCIO fase '{'+'.join(self._tarefas)}'{mock_tag} "
+            f"| Seção: '{secao.titulo}' "
+            f"| Tamanho: {len(secao.conteudo_original)} chars"
+        )
+
+        texto_para_revisao = configuracao.get(
+            "texto_entrada", secao.conteudo_original
+        )
+        prompt = self._construir_prompt(texto_para_revisao)
+
+        resposta = await self._gateway.gerar_conteudo(
+            prompt=prompt,
+            temperatura=configuracao.get("temperatura", 0.3),
+            max_tokens=configuracao.get("max_tokens", 8192),
+            origem=self.obter_nome(),
+        )
+
+        logger.info(
+            f"━━━ FIM fase '{'+'.join(self._tarefas)}'{mock_tag} "
+            f"| Seção: '{secao.titulo}'"
+        )
+        return self._parsear_resposta(resposta, secao)
+
+    def _construir_prompt(
+        self, texto: str, tipo: Optional[str] = None
+    ) -> str:
+        """Compõe as tarefas num único prompt."""
+        tarefas = "\n\n".join(
+            f"### Tarefa \"{tipo}\"\n"
+            + self._prompt_builder.construir(
+                tipo, texto=self._REFERENCIA_TEXTO
+            )
+            for tipo in self._tarefas
+        )
+        chaves = "".join(
+            f'  "{tipo}": {{"erros": [...]}},\n'
+            for tipo in self._tarefas
+        )
+        return compilar_template(PROMPT_REVISAO_MULTIPLA)(
+            {"tarefas": tarefas, "texto": texto, "chaves": chaves}
+        )
+
+    def _preencher_revisao(
+        self,
+        revisao: Revisao,
+        dados: Dict[str, Any],
+        secao: Secao,
+    ) -> None:
+        """Separa a resposta combinada por tarefa."""
+        for tipo in self._tarefas:
+            parte = dados.get(tipo) or {}
+            self._adicionar_erros(
+                revisao,
+                parte.get("erros", []),
+                f"revisor_{tipo}",
+            )
+        revisao.texto_saida = dados.get(
+            "texto_revisado",
+            secao.conteudo_original,
+        )
+
+    def obter_nome(self) -> str:
+        return "revisor_multiplo"
+
+    def obter_descricao(self) -> str:
+        return (
+            f"Agente de revisão combinada: "
+            f"{', '.join(self._tarefas)}"
+        )
+
+
 class AgenteValidador(IAIAgent):
     """
     Agente validador de correções.
@@ -297,11 +564,10 @@ class AgenteValidador(IAIAgent):
             texto_revisado=configuracao.get(
                 "texto_revisado", ""
             ),
-            correcoes=json.dumps(
+            correcoes=_para_json(
                 configuracao.get(
                     "erros_encontrados", []
-                ),
-                ensure_ascii=False,
+                )
             ),
         )
 
@@ -370,10 +636,7 @@ class AgenteConsistencia(IAIAgent):
             f"━━━ INÍCIO fase 'consistência'{mock_tag} "
             f"| {len(contexto.get('secoes', []))} seções"
         )
-        secoes_str = json.dumps(
-            contexto.get("secoes", []),
-            ensure_ascii=False,
-        )
+        secoes_str = _para_json(contexto.get("secoes", []))
         prompt = self._prompt_builder.construir(
             "consistencia", secoes=secoes_str
         )
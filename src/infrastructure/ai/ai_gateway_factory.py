@@ -12,6 +12,7 @@ from ...core.interfaces.gateways.i_ai_gateway import IAIGateway
 from .gemini_gateway import GeminiGateway
 from .groq_gateway import GroqGateway
 from .openrouter_gateway import OpenRouterGateway
+from .gateway_coalescente import GatewayCoalescente
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +29,25 @@ class AIGatewayFactory:
         """
         Cria um gateway com base na configuração.
 
+        O gateway do provedor é envolvido por um
+        ``GatewayCoalescente``, que compartilha chamadas
+        idênticas em andamento.
+
         Args:
             config: Dicionário de configuração contendo 'provider' e 'api_keys'.
 
         Returns:
             Instância de IAIGateway configurada.
         """
+        return GatewayCoalescente(
+            AIGatewayFactory._criar_provedor(config)
+        )
+
+    @staticmethod
+    def _criar_provedor(
+        config: Dict[str, Any]
+    ) -> IAIGateway:
+        """Instancia o gateway concreto do provedor."""
         provider = config.get("provider", "gemini").lower()
         api_keys = config.get("api_keys", {})
         
@@ -0,0 +1,154 @@
+"""
+Gateway que agrupa requisições idênticas em andamento.
+
+Decorador de ``IAIGateway``: chamadas simultâneas com o
+mesmo modelo, prompt, contexto e parâmetros compartilham
+uma única requisição à API.
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+from typing import Any, Dict, List
+
+from ...core.interfaces.gateways.i_ai_gateway import (
+    IAIGateway,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GatewayCoalescente(IAIGateway):
+    """
+    Coalescência de requisições sobre outro gateway.
+
+    O cache de respostas concluídas continua sendo o do
+    gateway interno; aqui apenas as chamadas em voo são
+    compartilhadas, evitando RPCs duplicados quando
+    agentes diferentes pedem o mesmo conteúdo ao mesmo
+    tempo.
+
+    Attributes:
+        _interno: Gateway que executa as requisições
+        _em_andamento: Futures indexados pela chave
+    """
+
+    def __init__(self, interno: IAIGateway) -> None:
+        """
+        Inicializa o decorador.
+
+        Args:
+            interno: Gateway a decorar
+        """
+        self._interno = interno
+        self._em_andamento: Dict[bytes, asyncio.Future] = {}
+
+    @property
+    def _modo_mock(self) -> bool:
+        """Repassa o modo mock do gateway interno."""
+        return getattr(self._interno, "_modo_mock", False)
+
+    @functools.cached_property
+    def _modelo(self) -> bytes:
+        """Modelo do gateway interno, já codificado."""
+        return self._interno.obter_info_modelo().get(
+            "modelo", ""
+        ).encode("utf-8")
+
+    def _chave(
+        self, prompt: str, parametros: Dict[str, Any]
+    ) -> bytes:
+        """
+        Gera chave compacta da requisição.
+
+        ``origem`` só identifica o chamador nos logs e
+        não entra na chave.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self._modelo)
+        h.update(b"\0")
+        h.update(prompt.encode("utf-8"))
+        for nome in sorted(parametros):
+            if nome != "origem":
+                h.update(
+                    f"\0{nome}={parametros[nome]!r}".encode(
+                        "utf-8"
+                    )
+                )
+        return h.digest()
+
+    async def gerar_conteudo(
+        self,
+        prompt: str,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Gera conteúdo, compartilhando chamadas idênticas.
+
+        Parâmetros omitidos mantêm os padrões do gateway
+        interno.
+
+        Args:
+            prompt: Prompt principal
+            **kwargs: contexto, temperatura, max_tokens,
+                stop_sequences e extras do gateway interno
+
+        Returns:
+            Texto gerado pelo modelo
+        """
+        chave = self._chave(prompt, kwargs)
+        while True:
+            futuro = self._em_andamento.get(chave)
+            if futuro is None:
+                break
+            try:
+                logger.debug("Requisição idêntica em voo; aguardando")
+                return await asyncio.shield(futuro)
+            except asyncio.CancelledError:
+                # Líder cancelado: tentar de novo como líder
+                if not futuro.cancelled():
+                    raise
+
+        futuro = asyncio.get_running_loop().create_future()
+        self._em_andamento[chave] = futuro
+        try:
+            resultado = await self._interno.gerar_conteudo(
+                prompt, **kwargs
+            )
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except BaseException as e:
+            futuro.set_exception(e)
+            # Evita aviso de exceção não recuperada
+            futuro.exception()
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            self._em_andamento.pop(chave, None)
+
+    async def aquecer(self) -> None:
+        """Repassa o aquecimento de conexões."""
+        await self._interno.aquecer()
+
+    async def encerrar(self) -> None:
+        """Repassa a liberação de recursos."""
+        await self._interno.encerrar()
+
+    def obter_metricas(self) -> Dict[str, Any]:
+        return self._interno.obter_metricas()
+
+    def limpar_cache(self) -> None:
+        self._interno.limpar_cache()
+
+    def resetar_metricas(self) -> None:
+        self._interno.resetar_metricas()
+
+    def obter_info_modelo(self) -> Dict[str, str]:
+        return self._interno.obter_info_modelo()
+
+    def listar_modelos(self) -> List[str]:
+        return self._interno.listar_modelos()
@@ -221,7 +221,7 @@ class GeminiGateway(IAIGateway):
 
         # Verificar cache
         cache_key = self._gerar_cache_key(
-            prompt, contexto, temperatura
+            prompt, contexto, temperatura, max_tokens
         )
         if cache_key in self._cache:
             logger.debug("Resposta obtida do cache")
@@ -263,14 +263,14 @@ class GeminiGateway(IAIGateway):
                     f"timeout: {self._timeout}s)..."
                 )
                 
-                _inicio_req = time.time()
+                _inicio_req = time.perf_counter()
                 resultado = await self._executar_request(
                     prompt_completo,
                     temperatura,
                     tokens_to_use,
                     stop_sequences,
                 )
-                _tempo_req = time.time() - _inicio_req
+                _tempo_req = time.perf_counter() - _inicio_req
                 logger.info(
                     f"[{origem}] ✅ Resposta recebida em "
                     f"{_tempo_req:.1f}s "
@@ -354,7 +354,7 @@ class GeminiGateway(IAIGateway):
                 "• Verifique em Configurações → IA / Provedores → Gemini"
             )
 
-        inicio = time.time()
+        inicio = time.perf_counter()
 
         try:
             generation_config = (
@@ -371,10 +371,10 @@ class GeminiGateway(IAIGateway):
                 generation_config=generation_config,
             )
 
-            elapsed = time.time() - inicio
+            elapsed = time.perf_counter() - inicio
             self._registrar_metricas(response, elapsed)
             self._request_timestamps.append(
-                time.time()
+                time.monotonic()
             )
 
             if not response.text:
@@ -426,7 +426,7 @@ class GeminiGateway(IAIGateway):
         Raises:
             RateLimitException: Se limite excedido
         """
-        agora = time.time()
+        agora = time.monotonic()
         # Limpar timestamps antigos (> 60s)
         self._request_timestamps = [
             ts
@@ -454,9 +454,10 @@ class GeminiGateway(IAIGateway):
         prompt: str,
         contexto: Optional[str],
         temperatura: float,
+        max_tokens: int = 0,
     ) -> str:
         """Gera chave de cache baseada nos parâmetros."""
-        dados = f"{prompt}|{contexto}|{temperatura}"
+        dados = f"{prompt}|{contexto}|{temperatura}|{max_tokens}"
         return hashlib.md5(
             dados.encode()
         ).hexdigest()
@@ -22,6 +22,7 @@ except ImportError:
     AsyncGroq = None  # type: ignore
 
 from ...core.interfaces.gateways.i_ai_gateway import IAIGateway
+from .http_client import obter_cliente_http
 from ...core.exceptions.agent_exceptions import (
     APIException,
     RateLimitException,
@@ -57,7 +58,12 @@ class GroqGateway(IAIGateway):
         
         self._client = None
         if AsyncGroq:
-            self._client = AsyncGroq(api_key=api_key, timeout=timeout)
+            # Reutiliza o pool HTTP compartilhado entre gateways
+            self._client = AsyncGroq(
+                api_key=api_key,
+                timeout=timeout,
+                http_client=obter_cliente_http(),
+            )
         else:
             logger.warning("Biblioteca 'groq' não instalada.")
 
@@ -88,7 +94,10 @@ class GroqGateway(IAIGateway):
             )
 
         # Verificar cache
-        dados_cache = f"{prompt}|{contexto}|{temperatura}|{self._model_name}"
+        dados_cache = (
+            f"{prompt}|{contexto}|{temperatura}|{max_tokens}"
+            f"|{self._model_name}"
+        )
         cache_key = hashlib.md5(dados_cache.encode()).hexdigest()
         
         if cache_key in self._cache:
@@ -101,7 +110,7 @@ class GroqGateway(IAIGateway):
             messages.append({"role": "system", "content": contexto})
         messages.append({"role": "user", "content": prompt})
 
-        inicio = time.time()
+        inicio = time.perf_counter()
         try:
             # Ajuste automático de max_tokens
             tokens_to_use = max_tokens
@@ -123,7 +132,7 @@ class GroqGateway(IAIGateway):
                 stop=stop_sequences,
             )
 
-            elapsed = time.time() - inicio
+            elapsed = time.perf_counter() - inicio
             resultado = chat_completion.choices[0].message.content or ""
             
             if not resultado:
@@ -0,0 +1,72 @@
+"""
+Pool HTTP compartilhado pelos gateways de IA.
+
+Mantém um único ``httpx.AsyncClient`` por processo para
+que todas as chamadas reutilizem conexões TLS já abertas
+(keep-alive) em vez de refazer o handshake a cada request.
+"""
+
+import logging
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_DISPONIVEL = True
+except ImportError:
+    HTTP2_DISPONIVEL = False
+
+logger = logging.getLogger(__name__)
+
+MAX_CONEXOES = 64
+MAX_CONEXOES_KEEPALIVE = 32
+TIMEOUT_PADRAO_SEG = 60.0
+TIMEOUT_CONEXAO_SEG = 5.0
+
+_cliente: Optional["httpx.AsyncClient"] = None
+
+
+def obter_cliente_http() -> Optional["httpx.AsyncClient"]:
+    """
+    Retorna o cliente HTTP compartilhado, criando-o se preciso.
+
+    O cliente deve ser usado sempre a partir do mesmo
+    event loop (o loop de longa duração da aplicação).
+
+    Returns:
+        Cliente assíncrono, ou None se httpx ausente
+    """
+    global _cliente
+    if httpx is None:
+        return None
+    if _cliente is None or _cliente.is_closed:
+        _cliente = httpx.AsyncClient(
+            http2=HTTP2_DISPONIVEL,
+            limits=httpx.Limits(
+                max_connections=MAX_CONEXOES,
+                max_keepalive_connections=(
+                    MAX_CONEXOES_KEEPALIVE
+                ),
+            ),
+            timeout=httpx.Timeout(
+                TIMEOUT_PADRAO_SEG,
+                connect=TIMEOUT_CONEXAO_SEG,
+            ),
+        )
+        logger.debug(
+            f"Pool HTTP criado (http2={HTTP2_DISPONIVEL})"
+        )
+    return _cliente
+
+
+async def fechar_cliente_http() -> None:
+    """Fecha o cliente compartilhado e libera as conexões."""
+    global _cliente
+    if _cliente is not None and not _cliente.is_closed:
+        await _cliente.aclose()
+    _cliente = None
@@ -17,6 +17,7 @@ except ImportError:
     httpx = None  # type: ignore
 
 from ...core.interfaces.gateways.i_ai_gateway import IAIGateway
+from .http_client import obter_cliente_http
 from ...core.exceptions.agent_exceptions import (
     APIException,
     RateLimitException,
@@ -41,6 +42,7 @@ class OpenRouterGateway(IAIGateway):
         _api_key: Chave de API do OpenRouter
         _model_name: Nome do modelo (ex: google/gemini-2.5-flash-preview-05-20)
         _timeout: Timeout em segundos
+        _cliente_http: Cliente HTTP (pool compartilhado)
         _cache: Cache local de respostas
         _metricas: Métricas acumuladas
     """
@@ -50,10 +52,12 @@ class OpenRouterGateway(IAIGateway):
         api_key: str,
         model_name: str = "google/gemini-2.5-flash-preview-05-20",
         timeout: int = 120,
+        cliente_http: Optional["httpx.AsyncClient"] = None,
     ) -> None:
         self._api_key = api_key
         self._model_name = model_name
         self._timeout = timeout
+        self._cliente_http = cliente_http
 
         self._cache: Dict[str, str] = {}
         self._metricas: Dict[str, Any] = {
@@ -93,7 +97,8 @@ class OpenRouterGateway(IAIGateway):
 
         # Verificar cache
         dados_cache = (
-            f"{prompt}|{contexto}|{temperatura}|{self._model_name}"
+            f"{prompt}|{contexto}|{temperatura}|{max_tokens}"
+            f"|{self._model_name}"
         )
         cache_key = hashlib.md5(
             dados_cache.encode()
@@ -138,7 +143,7 @@ class OpenRouterGateway(IAIGateway):
             "X-Title": "Revisor de Textos Estruturados",
         }
 
-        inicio = time.time()
+        inicio = time.perf_counter()
         try:
             logger.info(
                 f"[{origem}] 📡 OpenRouter: "
@@ -150,16 +155,14 @@ class OpenRouterGateway(IAIGateway):
                 f"(timeout: {self._timeout}s)..."
             )
 
-            async with httpx.AsyncClient(
-                timeout=self._timeout
-            ) as client:
-                response = await client.post(
-                    f"{OPENROUTER_BASE_URL}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
+            response = await self._cliente().post(
+                f"{OPENROUTER_BASE_URL}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout,
+            )
 
-            elapsed = time.time() - inicio
+            elapsed = time.perf_counter() - inicio
             logger.info(
                 f"[{origem}] ✅ Resposta recebida em "
                 f"{elapsed:.1f}s (HTTP {response.status_code})"
@@ -279,6 +282,32 @@ class OpenRouterGateway(IAIGateway):
                 f"Erro inesperado OpenRouter: {e}"
             )
 
+    def _cliente(self) -> "httpx.AsyncClient":
+        """Retorna o cliente HTTP de longa duração."""
+        if self._cliente_http is None or self._cliente_http.is_closed:
+            self._cliente_http = obter_cliente_http()
+        return self._cliente_http
+
+    async def aquecer(self) -> None:
+        """
+        Abre a conexão TLS com o OpenRouter antecipadamente.
+
+        Faz um GET barato em ``/models`` para que a primeira
+        revisão já encontre a conexão no pool. Falhas são
+        apenas registradas.
+        """
+        if httpx is None or not self._api_key:
+            return
+        try:
+            await self._cliente().get(
+                f"{OPENROUTER_BASE_URL}/models",
+                headers={
+                    "Authorization": f"Bearer {self._api_key}",
+                },
+            )
+        except Exception as e:
+            logger.debug(f"Aquecimento OpenRouter falhou: {e}")
+
     def obter_metricas(self) -> Dict[str, Any]:
         return dict(self._metricas)
 
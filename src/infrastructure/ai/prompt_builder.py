@@ -5,7 +5,9 @@ Gerencia templates de prompts estruturados para
 cada tipo de agente e caso de uso.
 """
 
-from typing import Dict, Any, Optional
+import functools
+import string
+from typing import Any, Callable, Dict, Mapping, Optional
 
 
 # Templates de prompt em PT-BR
@@ -172,6 +174,98 @@ com parágrafos claros e objetivos.
 }
 
 
+# Envelope que combina várias tarefas de revisão num só pedido;
+# ``{tarefas}`` recebe os prompts individuais já construídos
+PROMPT_REVISAO_MULTIPLA = """
+Execute, de forma independente, cada uma das tarefas de revisão
+abaixo sobre o mesmo texto. Em todas elas, o texto a analisar é o
+TEXTO PARA REVISÃO apresentado ao final.
+
+{tarefas}
+
+TEXTO PARA REVISÃO:
+{texto}
+
+Responda com um único objeto JSON, sem texto adicional, contendo
+a lista "erros" de cada tarefa (no formato pedido na tarefa) e o
+texto com todas as correções aplicadas:
+{{
+{chaves}
+  "texto_revisado": "texto completo com todas as correções"
+}}
+""".strip()
+
+
+# Envelope para revisar várias seções numa só chamada;
+# ``{instrucoes}`` é o prompt da revisão com as seções
+# delimitadas no lugar do texto
+PROMPT_REVISAO_LOTE = """
+O texto abaixo contém {total} seções independentes, cada uma
+delimitada por <<<SEC id=N>>> e <<<END>>>. Revise cada seção
+separadamente, seguindo as instruções. Não mova conteúdo entre
+seções e não inclua os delimitadores no texto revisado.
+
+{instrucoes}
+
+IMPORTANTE: em vez de um único objeto, responda com um objeto
+JSON contendo a lista "secoes", com um item por seção, cada um
+com o campo "id" (o N do delimitador) e os demais campos no
+formato pedido acima:
+{{
+  "secoes": [
+    {{"id": 1, "...": "..."}}
+  ]
+}}
+""".strip()
+
+Renderizador = Callable[[Mapping[str, Any]], str]
+
+
+@functools.lru_cache(maxsize=None)
+def compilar_template(template: str) -> Renderizador:
+    """
+    Pré-processa um template ``str.format`` uma única vez.
+
+    O template é dividido em trechos literais e campos
+    nomeados; renderizar passa a ser apenas um ``join``.
+    Templates com especificadores de formato, conversões
+    ou campos posicionais caem no ``format_map`` comum.
+
+    Args:
+        template: Template no formato de ``str.format``
+
+    Returns:
+        Função que recebe as variáveis e devolve o texto
+
+    Raises:
+        ValueError: Se o template for malformado
+    """
+    partes = []
+    nomes = []
+    for literal, campo, especificador, conversao in (
+        string.Formatter().parse(template)
+    ):
+        partes.append(literal)
+        if campo is None:
+            continue
+        if (
+            especificador
+            or conversao
+            or not campo.isidentifier()
+        ):
+            return template.format_map
+        nomes.append((len(partes), campo))
+        partes.append("")
+
+    def renderizar(variaveis: Mapping[str, Any]) -> str:
+        saida = list(partes)
+        for posicao, nome in nomes:
+            saida[posicao] = str(variaveis[nome])
+        return "".join(saida)
+
+    return renderizar
+
+
 class PromptBuilder:
     """
     Construtor de prompts para agentes de IA.
@@ -204,6 +298,10 @@ class PromptBuilder:
             self._templates.update(
                 templates_customizados
             )
+        self._compilados: Dict[str, Renderizador] = {
+            tipo: compilar_template(template)
+            for tipo, template in self._templates.items()
+        }
 
     def construir(
         self,
@@ -223,8 +321,8 @@ class PromptBuilder:
         Raises:
             ValueError: Se tipo não existir
         """
-        template = self._templates.get(tipo)
-        if not template:
+        renderizar = self._compilados.get(tipo)
+        if renderizar is None or not self._templates[tipo]:
             tipos = list(self._templates.keys())
             raise ValueError(
                 f"Tipo de prompt '{tipo}' não encontrado."
@@ -232,7 +330,7 @@ class PromptBuilder:
             )
 
         try:
-            return template.format(**kwargs)
+            return renderizar(kwargs)
         except KeyError as e:
             raise ValueError(
                 f"Variável {e} não fornecida "
@@ -254,3 +352,4 @@ class PromptBuilder:
             template: Conteúdo do template
         """
         self._templates[tipo] = template
+        self._compilados[tipo] = compilar_template(template)
@@ -0,0 +1 @@
+"""Acesso a variáveis de ambiente e configuração do processo."""
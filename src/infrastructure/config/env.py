@@ -0,0 +1,46 @@
+"""
+Leitura preguiçosa de variáveis de ambiente.
+
+O arquivo ``.env`` só é carregado na primeira consulta,
+mantendo a importação dos módulos livre de efeitos
+colaterais e de I/O.
+"""
+
+import functools
+import os
+from typing import Optional
+
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None  # type: ignore
+
+
+@functools.cache
+def carregar_env() -> bool:
+    """
+    Carrega o ``.env`` uma única vez por processo.
+
+    Returns:
+        True se algum arquivo ``.env`` foi carregado
+    """
+    if load_dotenv is None:
+        return False
+    return bool(load_dotenv())
+
+
+def getenv(
+    nome: str, padrao: Optional[str] = None
+) -> Optional[str]:
+    """
+    Lê variável de ambiente, carregando o ``.env`` antes.
+
+    Args:
+        nome: Nome da variável
+        padrao: Valor se a variável não existir
+
+    Returns:
+        Valor da variável ou o padrão
+    """
+    carregar_env()
+    return os.environ.get(nome, padrao)
@@ -9,7 +9,7 @@ Inclui handler Qt para exibição em GUI.
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -193,3 +193,19 @@ class AppLogger(ILogger):
         self._logger.critical(
             mensagem, extra=kwargs
         )
+
+    def log_batch(
+        self,
+        nivel: int,
+        registros: Iterable[Tuple[str, Dict[str, Any]]],
+    ) -> None:
+        """
+        Registra um lote de mensagens de um mesmo nível.
+
+        O nível é verificado uma única vez; se estiver
+        desabilitado, ``registros`` nem é percorrido.
+        """
+        if not self._logger.isEnabledFor(nivel):
+            return
+        for mensagem, extras in registros:
+            self._logger.log(nivel, mensagem, extra=extras)
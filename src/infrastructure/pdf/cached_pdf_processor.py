@@ -0,0 +1,244 @@
+"""
+Processador de documentos com cache por conteúdo.
+
+Decorador de ``IPdfProcessor`` que memoriza o texto
+extraído, indexado pelo SHA-256 do arquivo. Reexecuções
+sobre o mesmo documento (ex.: ajuste de prompts) pulam
+a etapa de extração.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+from ...core.entities.texto_estruturado import (
+    sha256_arquivo,
+)
+from ...core.interfaces.services.i_pdf_processor import (
+    IPdfProcessor,
+    SecaoDetectada,
+)
+from ...core.value_objects.metadados_pdf import (
+    MetadadosPDF,
+)
+
+logger = logging.getLogger(__name__)
+
+# Incrementar quando a extração mudar de forma incompatível
+VERSAO_CACHE = 1
+
+# Entradas mantidas em memória além do cache em disco
+MAX_ENTRADAS_MEMORIA = 4
+
+# Hashes lembrados por (caminho, tamanho, mtime)
+MAX_HASHES_MEMORIA = 32
+
+
+def _hash_conteudo(caminho: str) -> str:
+    """Calcula o SHA-256 do arquivo, como a entidade do documento."""
+    with open(caminho, "rb", buffering=0) as f:
+        return sha256_arquivo(f).hexdigest()
+
+
+@functools.lru_cache(maxsize=MAX_HASHES_MEMORIA)
+def _hash_por_estado(
+    caminho: str, tamanho: int, mtime_ns: int
+) -> str:
+    """Memoriza o hash enquanto o arquivo não muda."""
+    return _hash_conteudo(caminho)
+
+
+def _hash_arquivo(caminho: str) -> str:
+    """
+    Retorna o SHA-256 do arquivo.
+
+    Reprocessar um documento inalterado não relê o
+    arquivo: tamanho e mtime identificam a versão.
+    """
+    estado = os.stat(caminho)
+    return _hash_por_estado(
+        os.path.abspath(caminho),
+        estado.st_size,
+        estado.st_mtime_ns,
+    )
+
+
+class CachedPdfProcessor(IPdfProcessor):
+    """
+    Cache de extração de texto sobre outro processador.
+
+    Mantém duas camadas: um LRU pequeno em memória e
+    arquivos JSON em disco (``<sha256>.json``). As demais
+    operações são delegadas ao processador interno.
+
+    Attributes:
+        _interno: Processador que faz a extração real
+        _diretorio: Diretório do cache em disco
+        _memoria: LRU hash -> texto extraído
+    """
+
+    def __init__(
+        self,
+        interno: IPdfProcessor,
+        diretorio_cache: str = ".cache/pdf",
+    ) -> None:
+        """
+        Inicializa o cache.
+
+        Args:
+            interno: Processador a decorar
+            diretorio_cache: Diretório para os JSONs
+        """
+        self._interno = interno
+        self._diretorio = Path(diretorio_cache)
+        self._memoria: "OrderedDict[str, str]" = OrderedDict()
+
+    async def validar_pdf(self, caminho: str) -> bool:
+        """Delega a validação ao processador interno."""
+        return await self._interno.validar_pdf(caminho)
+
+    async def extrair_texto(
+        self,
+        caminho: str,
+        hash_arquivo: Optional[str] = None,
+    ) -> str:
+        """
+        Extrai texto, reutilizando resultado já em cache.
+
+        Args:
+            caminho: Caminho do documento
+            hash_arquivo: SHA-256 já calculado pelo chamador;
+                se omitido, o arquivo é lido para calculá-lo
+
+        Returns:
+            Texto completo extraído
+        """
+        chave = hash_arquivo or await asyncio.to_thread(
+            _hash_arquivo, caminho
+        )
+
+        texto = self._memoria.get(chave)
+        if texto is not None:
+            self._memoria.move_to_end(chave)
+            logger.debug(f"Extração em cache (memória): {caminho}")
+            return texto
+
+        texto = await asyncio.to_thread(self._ler_disco, chave)
+        if texto is not None:
+            logger.info(f"Extração em cache (disco): {caminho}")
+        else:
+            texto = await self._interno.extrair_texto(caminho)
+            await asyncio.to_thread(
+                self._gravar_disco, chave, texto
+            )
+
+        self._lembrar(chave, texto)
+        return texto
+
+    async def extrair_texto_stream(
+        self, caminho: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Delega a extração incremental.
+
+        Não passa pelo cache: quem consome página a página
+        quer evitar o texto completo em memória.
+        """
+        async for pagina in self._interno.extrair_texto_stream(
+            caminho
+        ):
+            yield pagina
+
+    async def extrair_metadados(
+        self, caminho: str
+    ) -> MetadadosPDF:
+        """Delega a extração de metadados."""
+        return await self._interno.extrair_metadados(caminho)
+
+    async def detectar_secoes(
+        self,
+        texto: str,
+        numero_paginas: int = 0,
+    ) -> List[SecaoDetectada]:
+        """Delega a detecção de seções."""
+        return await self._interno.detectar_secoes(
+            texto, numero_paginas
+        )
+
+    async def detectar_secoes_stream(
+        self,
+        texto: str,
+        numero_paginas: int = 0,
+    ) -> AsyncIterator[SecaoDetectada]:
+        """Delega a detecção incremental de seções."""
+        async for secao in self._interno.detectar_secoes_stream(
+            texto, numero_paginas
+        ):
+            yield secao
+
+    async def extrair_texto_por_pagina(
+        self, caminho: str, pagina: int
+    ) -> str:
+        """Delega a extração por página."""
+        return await self._interno.extrair_texto_por_pagina(
+            caminho, pagina
+        )
+
+    async def extrair_texto_paginas(
+        self, caminho: str, paginas: List[int]
+    ) -> Dict[int, str]:
+        """Delega a extração de várias páginas."""
+        return await self._interno.extrair_texto_paginas(
+            caminho, paginas
+        )
+
+    def _lembrar(self, chave: str, texto: str) -> None:
+        """Insere no LRU em memória, descartando o mais antigo."""
+        self._memoria[chave] = texto
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > MAX_ENTRADAS_MEMORIA:
+            self._memoria.popitem(last=False)
+
+    def _ler_disco(self, chave: str) -> Optional[str]:
+        """Lê entrada do cache em disco, se válida."""
+        caminho = self._diretorio / f"{chave}.json"
+        try:
+            bruto = caminho.read_bytes()
+        except OSError:
+            return None
+        try:
+            if orjson is not None:
+                dados = orjson.loads(bruto)
+            else:
+                dados = json.loads(bruto.decode("utf-8"))
+        except ValueError as e:
+            logger.warning(f"Cache de extração corrompido: {e}")
+            return None
+        if dados.get("versao") != VERSAO_CACHE:
+            return None
+        return dados.get("texto")
+
+    def _gravar_disco(self, chave: str, texto: str) -> None:
+        """Grava entrada no cache em disco (falhas são ignoradas)."""
+        dados = {"versao": VERSAO_CACHE, "texto": texto}
+        try:
+            self._diretorio.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                bruto = orjson.dumps(dados)
+            else:
+                bruto = json.dumps(
+                    dados, ensure_ascii=False
+                ).encode("utf-8")
+            (self._diretorio / f"{chave}.json").write_bytes(bruto)
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache de extração: {e}")
@@ -4,17 +4,32 @@ Processador de arquivos de documentos.
 Implementação concreta para extração de texto,
 metadados e detecção de seções.
 
-Suporta: PDF (PyPDF2), Word (.docx), OpenOffice (.odt),
-e LaTeX (.tex).
+Suporta: PDF (pypdfium2, com fallback para PyPDF2),
+Word (.docx), OpenOffice (.odt) e LaTeX (.tex).
 """
 
+import asyncio
 import logging
 import re
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None  # type: ignore
 
 try:
     from PyPDF2 import PdfReader
@@ -37,7 +52,9 @@ from ...core.exceptions.pdf_exceptions import (
 logger = logging.getLogger(__name__)
 
 # Extensões suportadas
-EXTENSOES_SUPORTADAS = {".pdf", ".docx", ".odt", ".tex", ".md"}
+EXTENSOES_SUPORTADAS = frozenset(
+    {".pdf", ".docx", ".odt", ".tex", ".md"}
+)
 
 # Padrões para detecção de seções em textos estruturados
 PADRAO_SECAO = re.compile(
@@ -152,9 +169,11 @@ class PdfProcessor(IPdfProcessor):
     # ── Extração de texto ──────────────────────
 
     async def extrair_texto(
-        self, caminho: str
+        self,
+        caminho: str,
+        hash_arquivo: Optional[str] = None,
     ) -> str:
-        """Extrai texto completo do documento."""
+        """Extrai texto completo do documento (sem usar o hash)."""
         path = Path(caminho)
         ext = path.suffix.lower()
 
@@ -176,37 +195,36 @@ class PdfProcessor(IPdfProcessor):
     async def _extrair_texto_pdf(
         self, caminho: str
     ) -> str:
-        """Extrai texto de PDF usando PyPDF2."""
-        if PdfReader is None:
+        """
+        Extrai texto de PDF.
+
+        Usa pypdfium2 (PDFium nativo) quando disponível e
+        PyPDF2 como alternativa. A leitura roda em thread
+        separada para não bloquear o event loop.
+        """
+        if pdfium is None and PdfReader is None:
             raise ExtracaoException(
-                "PyPDF2 não está instalado"
+                "Nenhuma biblioteca de PDF instalada "
+                "(pypdfium2 ou PyPDF2)"
             )
 
         try:
-            reader = PdfReader(caminho)
-
-            if reader.is_encrypted:
-                raise PDFProtegidoException(
-                    f"PDF protegido: {caminho}"
-                )
-
-            paginas_texto: List[str] = []
-            for i, pagina in enumerate(
-                reader.pages, 1
-            ):
-                texto = pagina.extract_text()
-                if texto:
-                    paginas_texto.append(
-                        f"--- Página {i} ---\n{texto}"
-                    )
+            paginas = await asyncio.to_thread(
+                self._ler_paginas_pdf, caminho
+            )
 
+            paginas_texto: List[str] = [
+                f"--- Página {i} ---\n{texto}"
+                for i, texto in enumerate(paginas, 1)
+                if texto
+            ]
             texto_completo = "\n\n".join(
                 paginas_texto
             )
 
             logger.info(
                 f"PDF: extraídos {len(texto_completo)} chars "
-                f"de {len(reader.pages)} páginas"
+                f"de {len(paginas)} páginas"
             )
 
             return texto_completo
@@ -218,6 +236,107 @@ class PdfProcessor(IPdfProcessor):
                 f"Erro ao extrair texto do PDF: {e}"
             )
 
+    def _ler_paginas_pdf(
+        self,
+        caminho: str,
+        paginas: Optional[List[int]] = None,
+    ) -> List[str]:
+        """
+        Lê o texto das páginas do PDF.
+
+        Args:
+            caminho: Caminho do PDF
+            paginas: Números das páginas (base 1);
+                None lê todas
+
+        Returns:
+            Texto de cada página pedida, na ordem
+
+        Raises:
+            PDFProtegidoException: Se o PDF exigir senha
+            ExtracaoException: Se alguma página estiver
+                fora do intervalo
+        """
+        return list(self._iterar_paginas_pdf(caminho, paginas))
+
+    def _iterar_paginas_pdf(
+        self,
+        caminho: str,
+        paginas: Optional[List[int]] = None,
+    ) -> Iterator[str]:
+        """
+        Percorre o texto das páginas do PDF, uma a uma.
+
+        PDFium não é thread-safe para um mesmo documento:
+        o iterador inteiro deve ser consumido numa única
+        thread de trabalho. Fechar o iterador fecha o
+        documento.
+
+        Args:
+            caminho: Caminho do PDF
+            paginas: Números das páginas (base 1);
+                None lê todas
+
+        Yields:
+            Texto de cada página pedida, na ordem
+
+        Raises:
+            PDFProtegidoException: Se o PDF exigir senha
+            ExtracaoException: Se alguma página estiver
+                fora do intervalo
+        """
+        if pdfium is not None:
+            try:
+                documento = pdfium.PdfDocument(caminho)
+            except pdfium.PdfiumError as e:
+                if "password" in str(e).lower():
+                    raise PDFProtegidoException(
+                        f"PDF protegido: {caminho}"
+                    )
+                raise
+            try:
+                for indice in self._indices_paginas(
+                    paginas, len(documento)
+                ):
+                    pagina = documento[indice]
+                    pagina_texto = pagina.get_textpage()
+                    texto = pagina_texto.get_text_range()
+                    pagina_texto.close()
+                    pagina.close()
+                    # PDFium quebra linhas com CRLF; PyPDF2
+                    # e os marcadores de página usam "\n"
+                    yield texto.replace("\r\n", "\n").replace(
+                        "\r", "\n"
+                    )
+            finally:
+                documento.close()
+            return
+
+        reader = PdfReader(caminho)
+        if reader.is_encrypted:
+            raise PDFProtegidoException(
+                f"PDF protegido: {caminho}"
+            )
+        for indice in self._indices_paginas(
+            paginas, len(reader.pages)
+        ):
+            yield reader.pages[indice].extract_text() or ""
+
+    @staticmethod
+    def _indices_paginas(
+        paginas: Optional[List[int]], total: int
+    ) -> Sequence[int]:
+        """Converte números de página em índices (base 0)."""
+        if paginas is None:
+            return range(total)
+        for pagina in paginas:
+            if not 1 <= pagina <= total:
+                raise ExtracaoException(
+                    f"Página {pagina} fora do intervalo"
+                    f" (1-{total})"
+                )
+        return [pagina - 1 for pagina in paginas]
+
     def _extrair_texto_docx(
         self, caminho: str
     ) -> str:
@@ -492,6 +611,63 @@ class PdfProcessor(IPdfProcessor):
 
     # ── Metadados ──────────────────────────────
 
+    async def extrair_texto_stream(
+        self, caminho: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Extrai texto página a página.
+
+        As páginas são lidas numa thread dedicada, uma por
+        vez, conforme o consumidor avança: o documento
+        inteiro nunca fica em memória e o processamento da
+        primeira página começa antes do fim da leitura.
+        Formatos sem paginação entregam o texto completo
+        como página 1.
+
+        Args:
+            caminho: Caminho do documento
+
+        Yields:
+            Tuplas (número da página, texto), em ordem
+        """
+        if Path(caminho).suffix.lower() != ".pdf":
+            yield 1, await self.extrair_texto(caminho)
+            return
+
+        if pdfium is None and PdfReader is None:
+            raise ExtracaoException(
+                "Nenhuma biblioteca de PDF instalada "
+                "(pypdfium2 ou PyPDF2)"
+            )
+
+        loop = asyncio.get_running_loop()
+        paginas = self._iterar_paginas_pdf(caminho)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                numero = 0
+                while True:
+                    try:
+                        texto = await loop.run_in_executor(
+                            executor, next, paginas, None
+                        )
+                    except (
+                        ExtracaoException,
+                        PDFProtegidoException,
+                    ):
+                        raise
+                    except Exception as e:
+                        raise ExtracaoException(
+                            f"Erro ao extrair texto do PDF: {e}"
+                        )
+                    if texto is None:
+                        break
+                    numero += 1
+                    yield numero, texto
+            finally:
+                await loop.run_in_executor(
+                    executor, paginas.close
+                )
+
     async def extrair_metadados(
         self, caminho: str
     ) -> MetadadosPDF:
@@ -588,41 +764,75 @@ class PdfProcessor(IPdfProcessor):
         Usa padrões de numeração de textos estruturados
         (1. TÍTULO, 1.1 SUBTÍTULO, etc.)
         """
-        secoes: List[SecaoDetectada] = []
+        secoes = list(
+            self._iterar_secoes(texto, numero_paginas)
+        )
+        logger.info(
+            f"Detectadas {len(secoes)} seções"
+        )
+        return secoes
 
-        # Buscar padrões de seção numerada
-        matches = list(PADRAO_SECAO.finditer(texto))
+    async def detectar_secoes_stream(
+        self,
+        texto: str,
+        numero_paginas: int = 0,
+    ) -> AsyncIterator[SecaoDetectada]:
+        """
+        Detecta seções entregando cada uma assim que o
+        início da seguinte é encontrado.
+        """
+        total = 0
+        for secao in self._iterar_secoes(
+            texto, numero_paginas
+        ):
+            total += 1
+            yield secao
+        logger.info(
+            f"Detectadas {total} seções"
+        )
+
+    def _iterar_secoes(
+        self,
+        texto: str,
+        numero_paginas: int,
+    ) -> Iterator[SecaoDetectada]:
+        """
+        Percorre as seções do texto sob demanda.
 
-        if not matches:
+        Os padrões são testados em ordem (numerado,
+        descritivo, Markdown); o primeiro com alguma
+        ocorrência define as seções.
+        """
+        usa_md = False
+        matches = PADRAO_SECAO.finditer(texto)
+        atual = next(matches, None)
+
+        if atual is None:
             # Fallback: seções descritivas (I, II, III...)
-            matches = list(
-                PADRAO_SECAO_DESCRITIVA.finditer(texto)
-            )
+            matches = PADRAO_SECAO_DESCRITIVA.finditer(texto)
+            atual = next(matches, None)
 
         # Fallback: headings Markdown (# Título)
-        usa_md = False
-        if not matches:
-            matches = list(
-                PADRAO_SECAO_MARKDOWN.finditer(texto)
-            )
-            usa_md = bool(matches)
+        if atual is None:
+            matches = PADRAO_SECAO_MARKDOWN.finditer(texto)
+            atual = next(matches, None)
+            usa_md = atual is not None
 
-        if not matches:
+        if atual is None:
             # Sem seções detectadas
-            secoes.append(
-                SecaoDetectada(
-                    titulo="DOCUMENTO COMPLETO",
-                    conteudo=texto,
-                    pagina_inicio=1,
-                    pagina_fim=max(1, numero_paginas),
-                    nivel=1,
-                )
-            )
-            return secoes
-
-        for i, match in enumerate(matches):
-            grupo1 = match.group(1).strip()
-            titulo_texto = match.group(2).strip()
+            yield SecaoDetectada(
+                titulo="DOCUMENTO COMPLETO",
+                conteudo=texto,
+                pagina_inicio=1,
+                pagina_fim=max(1, numero_paginas),
+                nivel=1,
+            )
+            return
+
+        while atual is not None:
+            seguinte = next(matches, None)
+            grupo1 = atual.group(1).strip()
+            titulo_texto = atual.group(2).strip()
             if usa_md:
                 nivel = len(grupo1)  # contagem de #
                 titulo = titulo_texto
@@ -631,16 +841,16 @@ class PdfProcessor(IPdfProcessor):
                 titulo = f"{grupo1} {titulo_texto}"
 
             # Determinar conteúdo da seção
-            inicio = match.end()
-            if i + 1 < len(matches):
-                fim = matches[i + 1].start()
+            inicio = atual.end()
+            if seguinte is not None:
+                fim = seguinte.start()
             else:
                 fim = len(texto)
 
             conteudo = texto[inicio:fim].strip()
 
             # Estimar páginas (aprox 3000 chars/página)
-            pos_inicio = match.start()
+            pos_inicio = atual.start()
             pag_inicio = max(
                 1, pos_inicio // 3000 + 1
             )
@@ -653,21 +863,14 @@ class PdfProcessor(IPdfProcessor):
                 )
 
             if conteudo:
-                secoes.append(
-                    SecaoDetectada(
-                        titulo=titulo,
-                        conteudo=conteudo,
-                        pagina_inicio=pag_inicio,
-                        pagina_fim=pag_fim,
-                        nivel=nivel,
-                    )
+                yield SecaoDetectada(
+                    titulo=titulo,
+                    conteudo=conteudo,
+                    pagina_inicio=pag_inicio,
+                    pagina_fim=pag_fim,
+                    nivel=nivel,
                 )
-
-        logger.info(
-            f"Detectadas {len(secoes)} seções"
-        )
-
-        return secoes
+            atual = seguinte
 
     # ── Extração por página ────────────────────
 
@@ -675,8 +878,27 @@ class PdfProcessor(IPdfProcessor):
         self, caminho: str, pagina: int
     ) -> str:
         """Extrai texto de uma página específica."""
+        textos = await self.extrair_texto_paginas(
+            caminho, [pagina]
+        )
+        return textos[pagina]
+
+    async def extrair_texto_paginas(
+        self, caminho: str, paginas: List[int]
+    ) -> Dict[int, str]:
+        """
+        Extrai texto de várias páginas abrindo o PDF uma vez.
+
+        Args:
+            caminho: Caminho do documento
+            paginas: Números das páginas (base 1)
+
+        Returns:
+            Texto de cada página, indexado pelo número
+        """
         path = Path(caminho)
         ext = path.suffix.lower()
+        unicas = list(dict.fromkeys(paginas))
 
         if ext != ".pdf":
             # Para não-PDF, retornar texto completo
@@ -686,31 +908,23 @@ class PdfProcessor(IPdfProcessor):
                 f"Formato {ext}: retornando texto "
                 f"completo (sem paginação)"
             )
-            return texto
+            return {pagina: texto for pagina in unicas}
 
-        if PdfReader is None:
+        if pdfium is None and PdfReader is None:
             raise ExtracaoException(
-                "PyPDF2 não instalado"
+                "Nenhuma biblioteca de PDF instalada "
+                "(pypdfium2 ou PyPDF2)"
             )
 
         try:
-            reader = PdfReader(caminho)
-            if pagina < 1 or pagina > len(
-                reader.pages
-            ):
-                raise ExtracaoException(
-                    f"Página {pagina} fora do intervalo"
-                    f" (1-{len(reader.pages)})"
-                )
-
-            texto = reader.pages[
-                pagina - 1
-            ].extract_text()
-            return texto or ""
+            textos = await asyncio.to_thread(
+                self._ler_paginas_pdf, caminho, unicas
+            )
+            return dict(zip(unicas, textos))
 
-        except ExtracaoException:
+        except (ExtracaoException, PDFProtegidoException):
             raise
         except Exception as e:
             raise ExtracaoException(
-                f"Erro ao extrair página {pagina}: {e}"
+                f"Erro ao extrair páginas {unicas}: {e}"
             )
@@ -8,7 +8,12 @@ de configurações e prompts customizados.
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from ...core.interfaces.repositories.i_config_repository import (
     IConfigRepository,
@@ -26,6 +31,10 @@ CONFIG_PADRAO: Dict[str, Any] = {
     "temperatura_validacao": 0.2,
     "max_iteracoes": 5,
     "limiar_convergencia": 0.95,
+    "max_secoes_paralelas": 3,
+    "tokens_lote_revisao": 2000,
+    "revisao_combinada": True,
+    "cache_revisoes": False,
     "max_tokens_revisao": 0,
     "diretorio_saida": "./output",
     "diretorio_dados": "./data",
@@ -91,23 +100,17 @@ class JsonConfigRepository(IConfigRepository):
         self._caminho_config = Path(caminho_config)
         self._caminho_prompts = Path(caminho_prompts)
         self._config: Dict[str, Any] = {}
+        # mtime (ns) do arquivo refletido em _config
+        self._mtime_config: Optional[int] = None
+        # Prompts já lidos: tipo -> (mtime ns, bytes)
+        self._prompts: Dict[str, Tuple[int, bytes]] = {}
         self._carregar_ou_criar()
 
     def _carregar_ou_criar(self) -> None:
         """Carrega config existente ou cria default."""
         if self._caminho_config.exists():
             try:
-                self._config = json.loads(
-                    self._caminho_config.read_text(
-                        encoding="utf-8"
-                    )
-                )
-                
-                # Merge defaults for missing keys
-                for key, val in CONFIG_PADRAO.items():
-                    if key not in self._config:
-                        self._config[key] = val
-                
+                self._ler_arquivo_config()
                 logger.info("Configuração carregada")
                 return
             except Exception as e:
@@ -119,10 +122,51 @@ class JsonConfigRepository(IConfigRepository):
         self._config = dict(CONFIG_PADRAO)
         self.salvar_configuracao(self._config)
 
+    def _ler_arquivo_config(self) -> None:
+        """Lê e parseia o arquivo, completando com defaults."""
+        mtime = self._caminho_config.stat().st_mtime_ns
+        bruto = self._caminho_config.read_bytes()
+        if orjson is not None:
+            config = orjson.loads(bruto)
+        else:
+            config = json.loads(bruto.decode("utf-8"))
+
+        # Merge defaults for missing keys
+        for key, val in CONFIG_PADRAO.items():
+            if key not in config:
+                config[key] = val
+
+        self._config = config
+        self._mtime_config = mtime
+
+    def _recarregar_se_modificado(self) -> None:
+        """Relê o arquivo apenas se o mtime mudou."""
+        try:
+            mtime = self._caminho_config.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._mtime_config:
+            return
+        try:
+            self._ler_arquivo_config()
+            logger.info("Configuração recarregada do disco")
+        except Exception as e:
+            logger.warning(
+                f"Erro ao recarregar config: {e}. "
+                f"Mantendo versão em memória."
+            )
+            self._mtime_config = mtime
+
     def carregar_configuracao(
         self,
     ) -> Dict[str, Any]:
-        """Retorna configuração completa."""
+        """
+        Retorna configuração completa.
+
+        Usa a versão em memória enquanto o mtime do
+        arquivo não mudar; edições externas são relidas.
+        """
+        self._recarregar_se_modificado()
         return dict(self._config)
 
     def salvar_configuracao(
@@ -141,6 +185,9 @@ class JsonConfigRepository(IConfigRepository):
             ),
             encoding="utf-8",
         )
+        self._mtime_config = (
+            self._caminho_config.stat().st_mtime_ns
+        )
         logger.info("Configuração salva")
 
     def obter_valor(
@@ -174,21 +221,32 @@ class JsonConfigRepository(IConfigRepository):
     def carregar_prompt(
         self, tipo: str
     ) -> Optional[Dict[str, Any]]:
-        """Carrega template de prompt por tipo."""
+        """
+        Carrega template de prompt por tipo.
+
+        O conteúdo do arquivo fica em memória e só é relido
+        quando o mtime muda; cada chamada devolve um
+        dicionário novo.
+        """
         caminho = (
             self._caminho_prompts / f"{tipo}.json"
         )
-        if caminho.exists():
-            try:
-                return json.loads(
-                    caminho.read_text(
-                        encoding="utf-8"
-                    )
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Erro ao carregar prompt "
-                    f"'{tipo}': {e}"
-                )
-
-        return None
+        try:
+            mtime = caminho.stat().st_mtime_ns
+        except OSError:
+            self._prompts.pop(tipo, None)
+            return None
+        try:
+            lido = self._prompts.get(tipo)
+            if lido is None or lido[0] != mtime:
+                lido = (mtime, caminho.read_bytes())
+                self._prompts[tipo] = lido
+            if orjson is not None:
+                return orjson.loads(lido[1])
+            return json.loads(lido[1].decode("utf-8"))
+        except Exception as e:
+            logger.warning(
+                f"Erro ao carregar prompt "
+                f"'{tipo}': {e}"
+            )
+            return None
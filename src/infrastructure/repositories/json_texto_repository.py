@@ -15,9 +15,40 @@ from ...core.interfaces.repositories.i_texto_repository import (
     ITextoRepository,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _serializar(dados: Dict[str, Any]) -> bytes:
+    """Serializa dados em JSON UTF-8 indentado."""
+    if orjson is not None:
+        return orjson.dumps(
+            dados,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+            ),
+        )
+    return json.dumps(
+        dados,
+        ensure_ascii=False,
+        indent=2,
+        default=str,
+    ).encode("utf-8")
+
+
+def _desserializar(bruto: bytes) -> Dict[str, Any]:
+    """Desserializa JSON a partir de bytes."""
+    if orjson is not None:
+        return orjson.loads(bruto)
+    return json.loads(bruto.decode("utf-8"))
+
+
 class JsonTextoRepository(ITextoRepository):
     """
     Repositório de textos usando arquivos JSON.
@@ -53,16 +84,7 @@ class JsonTextoRepository(ITextoRepository):
             / f"{texto.hash_arquivo[:16]}.json"
         )
 
-        dados = texto.to_dict()
-        caminho.write_text(
-            json.dumps(
-                dados,
-                ensure_ascii=False,
-                indent=2,
-                default=str,
-            ),
-            encoding="utf-8",
-        )
+        caminho.write_bytes(_serializar(texto.to_dict()))
 
         logger.info(
             f"Texto salvo: {caminho.name}"
@@ -81,9 +103,7 @@ class JsonTextoRepository(ITextoRepository):
             return None
 
         try:
-            dados = json.loads(
-                caminho.read_text(encoding="utf-8")
-            )
+            dados = _desserializar(caminho.read_bytes())
             return TextoEstruturado.from_dict(dados)
         except Exception as e:
             logger.error(
@@ -99,10 +119,8 @@ class JsonTextoRepository(ITextoRepository):
             "*.json"
         ):
             try:
-                dados = json.loads(
-                    arquivo.read_text(
-                        encoding="utf-8"
-                    )
+                dados = _desserializar(
+                    arquivo.read_bytes()
                 )
                 textos.append(
                     TextoEstruturado.from_dict(dados)
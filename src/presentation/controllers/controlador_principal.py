@@ -6,8 +6,20 @@ o ciclo de vida do processamento de textos.
 """
 
 import asyncio
-import os
-from typing import Optional, Dict, Any
+from concurrent.futures import Future
+from typing import (
+    Any,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore
 
 from PyQt6.QtCore import (
     QObject,
@@ -24,12 +36,21 @@ from ...infrastructure.ai.prompt_builder import (
 )
 from ...infrastructure.ai.agents import (
     AgenteRevisor,
+    AgenteMultiRevisor,
     AgenteValidador,
     AgenteConsistencia,
 )
+from ...infrastructure.ai.agente_cache import AgenteComCache
+from ...infrastructure.config.env import getenv
+from ...infrastructure.ai.http_client import (
+    fechar_cliente_http,
+)
 from ...infrastructure.pdf.pdf_processor import (
     PdfProcessor,
 )
+from ...infrastructure.pdf.cached_pdf_processor import (
+    CachedPdfProcessor,
+)
 from ...infrastructure.reports.markdown_generator import (
     MarkdownReportGenerator,
 )
@@ -54,20 +75,124 @@ from ...application.use_cases.processar_texto.dto import (
 )
 
 
-class WorkerProcessamento(QThread):
+# Capacidade da fila de progresso entre pipeline e GUI
+TAMANHO_FILA_PROGRESSO = 64
+
+
+def _coalescer_progresso(
+    pendentes: List[ProgressoDTO],
+) -> List[Tuple[ProgressoDTO, bool]]:
+    """
+    Marca quais DTOs devem atualizar barra e rótulo.
+
+    Toda mensagem continua indo para o log; apenas o
+    último DTO de cada sequência de percentual repetido
+    repinta barra e rótulo. DTOs ``somente_log`` nunca
+    repintam e não contam para as sequências.
+
+    Args:
+        pendentes: DTOs drenados da fila, em ordem
+
+    Returns:
+        Pares (DTO, atualiza_barra), em ordem
+    """
+    barra = [dto for dto in pendentes if not dto.somente_log]
+    repintam = {
+        id(dto)
+        for dto, seguinte in zip(barra, barra[1:] + [None])
+        if seguinte is None
+        or seguinte.percentual != dto.percentual
+    }
+    return [(dto, id(dto) in repintam) for dto in pendentes]
+
+
+class LoopAsyncio(QThread):
     """
-    Worker thread para processamento assíncrono.
+    Thread dedicada a um único event loop asyncio.
 
-    Executa o pipeline de revisão em thread
-    separada para manter a GUI responsiva.
+    O loop é criado uma vez e permanece ativo durante
+    toda a vida da aplicação; corrotinas são submetidas
+    a partir da thread da GUI sem recriar loops a cada
+    processamento.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # O loop roda fora da thread da GUI, sem integração
+        # com o Qt; uvloop pode substituí-lo quando disponível
+        self._loop = (
+            uvloop.new_event_loop()
+            if uvloop is not None
+            else asyncio.new_event_loop()
+        )
+
+    def run(self) -> None:
+        """Executa o loop até ``encerrar`` ser chamado."""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Limpar tarefas pendentes antes de fechar o loop
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self._loop.run_until_complete(
+                    asyncio.gather(
+                        *pending, return_exceptions=True
+                    )
+                )
+            self._loop.run_until_complete(
+                self._loop.shutdown_asyncgens()
+            )
+            self._loop.close()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop mantido por esta thread."""
+        return self._loop
+
+    def submeter(
+        self, coro: Coroutine[Any, Any, Any]
+    ) -> Future:
+        """
+        Agenda corrotina no loop compartilhado.
+
+        Args:
+            coro: Corrotina a executar
+
+        Returns:
+            Future thread-safe do resultado
+        """
+        return asyncio.run_coroutine_threadsafe(
+            coro, self._loop
+        )
+
+    def encerrar(self) -> None:
+        """Para o loop e aguarda a thread terminar."""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(
+                self._loop.stop
+            )
+        self.wait()
+
+
+class WorkerProcessamento(QObject):
+    """
+    Tarefa de processamento no loop compartilhado.
+
+    Executa o pipeline de revisão como corrotina no
+    ``LoopAsyncio`` para manter a GUI responsiva.
 
     Signals:
         progresso: Atualização de progresso
+        mensagem: Mensagem de progresso só para o log
         concluido: Processamento finalizado
         erro: Erro durante processamento
     """
 
     progresso = pyqtSignal(str, float, str)
+    mensagem = pyqtSignal(str, str)
     concluido = pyqtSignal(object)
     erro = pyqtSignal(str)
 
@@ -81,57 +206,104 @@ class WorkerProcessamento(QThread):
         self._orquestrador = orquestrador
         self._caminho_arquivo = caminho_arquivo
         self._formatos = formatos
-        self._interromper = False
-    
+        self._futuro: Optional[Future] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cancelamento: Optional[asyncio.Event] = None
+
     def parar(self) -> None:
-        """Sinaliza para interromper o processamento."""
-        self._interromper = True
+        """
+        Sinaliza para interromper o processamento.
 
-    def _check_cancel(self) -> None:
-        """Verifica se o cancelamento foi solicitado."""
-        if self._interromper:
-            raise Exception("Processamento interrompido pelo usuário.")
+        Thread-safe: o evento é acionado no loop asyncio,
+        interrompendo inclusive chamadas à IA em curso.
+        """
+        if self._loop and self._cancelamento:
+            self._loop.call_soon_threadsafe(
+                self._cancelamento.set
+            )
 
-    def run(self) -> None:
-        """Executa processamento em thread."""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            def callback_progresso(
-                dto: ProgressoDTO,
-            ) -> None:
-                self.progresso.emit(
-                    dto.etapa,
-                    dto.percentual,
-                    dto.mensagem,
-                )
+    def isRunning(self) -> bool:
+        """Indica se o processamento ainda está ativo."""
+        return (
+            self._futuro is not None
+            and not self._futuro.done()
+        )
 
-            resultado = loop.run_until_complete(
-                self._orquestrador.processar_texto(
+    def iniciar(self, loop: LoopAsyncio) -> None:
+        """
+        Submete o processamento ao loop compartilhado.
+
+        Args:
+            loop: Thread do event loop asyncio
+        """
+        self._loop = loop.loop
+        self._cancelamento = asyncio.Event()
+        self._futuro = loop.submeter(self._executar())
+
+    async def _executar(self) -> None:
+        """Executa o pipeline e emite o resultado."""
+        fila: "asyncio.Queue[Optional[ProgressoDTO]]" = (
+            asyncio.Queue(maxsize=TAMANHO_FILA_PROGRESSO)
+        )
+        consumidor = asyncio.ensure_future(
+            self._consumir_progresso(fila)
+        )
+        try:
+            resultado = (
+                await self._orquestrador.processar_texto(
                     caminho_arquivo=self._caminho_arquivo,
                     formatos=self._formatos,
-                    callback_progresso=(
-                        callback_progresso
-                    ),
-                    check_cancel=self._check_cancel,
+                    fila_progresso=fila,
+                    evento_cancelamento=self._cancelamento,
                 )
             )
-
-            # Limpar tarefas pendentes antes de fechar o loop
-            pending = asyncio.all_tasks(loop)
-            for task in pending:
-                task.cancel()
-            if pending:
-                loop.run_until_complete(
-                    asyncio.gather(*pending, return_exceptions=True)
-                )
-            loop.close()
+            await fila.put(None)
+            await consumidor
             self.concluido.emit(resultado)
 
         except Exception as e:
+            consumidor.cancel()
             self.erro.emit(str(e))
 
+    async def _consumir_progresso(
+        self,
+        fila: "asyncio.Queue[Optional[ProgressoDTO]]",
+    ) -> None:
+        """
+        Drena a fila e repassa o progresso à GUI.
+
+        Tudo o que já estiver enfileirado é lido de uma
+        vez. Percentuais repetidos atualizam barra e
+        rótulo uma única vez, reduzindo repinturas; as
+        demais mensagens vão apenas para o log.
+
+        Args:
+            fila: Fila alimentada pelo pipeline; ``None``
+                encerra o consumo
+        """
+        while True:
+            pendentes = [await fila.get()]
+            while not fila.empty():
+                pendentes.append(fila.get_nowait())
+
+            fim = None in pendentes
+            dtos = [d for d in pendentes if d is not None]
+            for dto, atualiza_barra in _coalescer_progresso(
+                dtos
+            ):
+                if atualiza_barra:
+                    self.progresso.emit(
+                        dto.etapa,
+                        dto.percentual,
+                        dto.mensagem,
+                    )
+                else:
+                    self.mensagem.emit(
+                        dto.etapa, dto.mensagem
+                    )
+            if fim:
+                return
+
 
 class ControladorPrincipal(QObject):
     """
@@ -142,6 +314,7 @@ class ControladorPrincipal(QObject):
 
     Signals:
         progresso_atualizado: Progresso do processamento
+        mensagem_progresso: Mensagem só para o log
         processamento_concluido: Resultado final
         processamento_erro: Erro no processamento
     """
@@ -149,6 +322,7 @@ class ControladorPrincipal(QObject):
     progresso_atualizado = pyqtSignal(
         str, float, str
     )
+    mensagem_progresso = pyqtSignal(str, str)
     processamento_concluido = pyqtSignal(object)
     processamento_erro = pyqtSignal(str)
     log_recebido = pyqtSignal(str, str)  # (nivel, msg)
@@ -161,6 +335,10 @@ class ControladorPrincipal(QObject):
         self._logger = AppLogger()
         self._orquestrador = None
 
+        # Event loop único para todos os processamentos
+        self._loop_asyncio = LoopAsyncio()
+        self._loop_asyncio.start()
+
         # Conectar logs detalhados à GUI
         self._logger.log_emitter.log_message.connect(
             self.log_recebido
@@ -174,12 +352,12 @@ class ControladorPrincipal(QObject):
 
         # Consolidar API keys do ambiente
         api_keys = config.get("api_keys", {})
-        if not api_keys.get("gemini") and os.environ.get("GEMINI_API_KEY"):
-            api_keys["gemini"] = os.environ.get("GEMINI_API_KEY")
-        if not api_keys.get("groq") and os.environ.get("GROQ_API_KEY"):
-            api_keys["groq"] = os.environ.get("GROQ_API_KEY")
-        if not api_keys.get("openrouter") and os.environ.get("OPENROUTER_API_KEY"):
-            api_keys["openrouter"] = os.environ.get("OPENROUTER_API_KEY")
+        if not api_keys.get("gemini") and getenv("GEMINI_API_KEY"):
+            api_keys["gemini"] = getenv("GEMINI_API_KEY")
+        if not api_keys.get("groq") and getenv("GROQ_API_KEY"):
+            api_keys["groq"] = getenv("GROQ_API_KEY")
+        if not api_keys.get("openrouter") and getenv("OPENROUTER_API_KEY"):
+            api_keys["openrouter"] = getenv("OPENROUTER_API_KEY")
         
         config["api_keys"] = api_keys
 
@@ -253,6 +431,9 @@ class ControladorPrincipal(QObject):
             "complexo": AIGatewayFactory.criar(configs["complexo"]),
         }
         
+        # Abrir conexões antes da primeira revisão
+        self._aquecer_gateways(gateways.values())
+
         # Gateway principal (usado para validações gerais)
         # Usamos o padrão como fallback
         self._gateway = gateways["padrao"]
@@ -268,22 +449,43 @@ class ControladorPrincipal(QObject):
         agentes_revisores = []
         
         gw_gramatical = get_gateway_for_phase("gramatical")
-        if gw_gramatical:
-            agentes_revisores.append(AgenteRevisor(
-                gw_gramatical, prompt_builder, tipo_revisao="revisao_gramatical"
-            ))
-            
         gw_tecnica = get_gateway_for_phase("tecnica")
-        if gw_tecnica:
-             agentes_revisores.append(AgenteRevisor(
-                gw_tecnica, prompt_builder, tipo_revisao="revisao_tecnica"
+        if (
+            gw_gramatical
+            and gw_tecnica is gw_gramatical
+            and config_base.get("revisao_combinada", True)
+        ):
+            # Mesmo perfil: uma chamada por seção para as duas fases
+            agentes_revisores.append(AgenteMultiRevisor(
+                gw_gramatical, prompt_builder,
+                tarefas=("revisao_gramatical", "revisao_tecnica"),
             ))
+        else:
+            if gw_gramatical:
+                agentes_revisores.append(AgenteRevisor(
+                    gw_gramatical, prompt_builder, tipo_revisao="revisao_gramatical"
+                ))
+            if gw_tecnica:
+                 agentes_revisores.append(AgenteRevisor(
+                    gw_tecnica, prompt_builder, tipo_revisao="revisao_tecnica"
+                ))
             
         gw_estrutural = get_gateway_for_phase("estrutural")
         if gw_estrutural:
              agentes_revisores.append(AgenteRevisor(
                 gw_estrutural, prompt_builder, tipo_revisao="revisao_estrutural"
             ))
+
+        # Opcional: revisões já feitas para o mesmo texto/modelo
+        # são reaproveitadas (cache em disco)
+        if config_base.get("cache_revisoes", False):
+            diretorio_cache = config_base.get(
+                "diretorio_cache_revisoes", ".cache/revisoes"
+            )
+            agentes_revisores = [
+                AgenteComCache(agente, diretorio_cache)
+                for agente in agentes_revisores
+            ]
         
         # Agentes opcionais
         agente_validador = None
@@ -297,7 +499,12 @@ class ControladorPrincipal(QObject):
             agente_consistencia = AgenteConsistencia(gw_consistencia, prompt_builder)
 
         self._orquestrador = OrquestradorRevisao(
-            pdf_processor=PdfProcessor(),
+            pdf_processor=CachedPdfProcessor(
+                PdfProcessor(),
+                diretorio_cache=config_base.get(
+                    "diretorio_cache_pdf", ".cache/pdf"
+                ),
+            ),
             agentes_revisores=agentes_revisores,
             agente_validador=agente_validador,
             agente_consistencia=agente_consistencia,
@@ -307,6 +514,12 @@ class ControladorPrincipal(QObject):
             logger=self._logger,
         )
 
+    def _aquecer_gateways(self, gateways) -> None:
+        """Agenda o aquecimento do pool HTTP de cada gateway."""
+        distintos = {id(gw): gw for gw in gateways}
+        for gw in distintos.values():
+            self._loop_asyncio.submeter(gw.aquecer())
+
     @pyqtSlot(str, list)
     def processar_texto(
         self,
@@ -341,13 +554,16 @@ class ControladorPrincipal(QObject):
         self._worker.progresso.connect(
             self.progresso_atualizado
         )
+        self._worker.mensagem.connect(
+            self.mensagem_progresso
+        )
         self._worker.concluido.connect(
             self._on_concluido
         )
         self._worker.erro.connect(
             self._on_erro
         )
-        self._worker.start()
+        self._worker.iniciar(self._loop_asyncio)
 
     @pyqtSlot()
     def interromper_processamento(self) -> None:
@@ -356,6 +572,20 @@ class ControladorPrincipal(QObject):
             self._logger.warning("Solicitando interrupção do processamento...")
             self._worker.parar()
 
+    def encerrar(self) -> None:
+        """Interrompe processamento e encerra o loop."""
+        if self._worker and self._worker.isRunning():
+            self._worker.parar()
+        try:
+            self._loop_asyncio.submeter(
+                fechar_cliente_http()
+            ).result(timeout=5)
+        except Exception as e:
+            self._logger.warning(
+                f"Falha ao fechar pool HTTP: {e}"
+            )
+        self._loop_asyncio.encerrar()
+
     @pyqtSlot(object)
     def _on_concluido(self, resultado) -> None:
         """Callback de conclusão."""
@@ -33,6 +33,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 
 from ..tema import Tema
+from ...infrastructure.config.env import getenv
 from ...infrastructure.ai.ai_gateway_factory import (
     AIGatewayFactory,
 )
@@ -509,15 +510,15 @@ class ConfigDialog(QDialog):
             self._stack_prov.setCurrentIndex(idx_prov)
 
         # Gemini
-        key_gemini = api_keys.get("gemini") or c.get("gemini_api_key") or os.environ.get("GEMINI_API_KEY", "")
+        key_gemini = api_keys.get("gemini") or c.get("gemini_api_key") or getenv("GEMINI_API_KEY", "")
         self._txt_gemini_key.setText(key_gemini)
         
         # Groq
-        key_groq = api_keys.get("groq") or os.environ.get("GROQ_API_KEY", "")
+        key_groq = api_keys.get("groq") or getenv("GROQ_API_KEY", "")
         self._txt_groq_key.setText(key_groq)
 
         # OpenRouter
-        key_openrouter = api_keys.get("openrouter") or os.environ.get("OPENROUTER_API_KEY", "")
+        key_openrouter = api_keys.get("openrouter") or getenv("OPENROUTER_API_KEY", "")
         self._txt_openrouter_key.setText(key_openrouter)
 
         # Buscar modelos via API para todos os provedores
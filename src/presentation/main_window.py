@@ -6,7 +6,6 @@ Interface central que integra a barra lateral,
 """
 
 import os
-import webbrowser
 
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -23,10 +22,6 @@ from .tema import Tema
 from .widgets.sidebar_widget import SidebarWidget
 from .widgets.home_widget import HomeWidget
 from .widgets.analysis_widget import AnalysisWidget
-from .controllers.controlador_principal import (
-    ControladorPrincipal,
-)
-from .dialogs.config_dialog import ConfigDialog
 
 
 class MainWindow(QMainWindow):
@@ -36,6 +31,13 @@ class MainWindow(QMainWindow):
 
     def __init__(self) -> None:
         super().__init__()
+        # Importado aqui: o controlador puxa PDF, gateways de IA
+        # e relatórios, que não são necessários para importar
+        # este módulo
+        from .controllers.controlador_principal import (
+            ControladorPrincipal,
+        )
+
         self._controlador = ControladorPrincipal()
         self._ultimo_resultado = None
         self._setup_ui()
@@ -102,6 +104,9 @@ class MainWindow(QMainWindow):
         self._controlador.progresso_atualizado.connect(
             self._analysis.atualizar_progresso
         )
+        self._controlador.mensagem_progresso.connect(
+            self._analysis.progresso.registrar_mensagem
+        )
         self._controlador.processamento_concluido.connect(
             self._on_processamento_concluido
         )
@@ -113,6 +118,11 @@ class MainWindow(QMainWindow):
             self._analysis.progresso.adicionar_log_detalhado
         )
 
+    def closeEvent(self, event) -> None:
+        """Encerra o loop asyncio antes de fechar."""
+        self._controlador.encerrar()
+        super().closeEvent(event)
+
     def _mudar_pagina(self, index: int) -> None:
         """Alterna página exibida na pilha."""
         self._stack.setCurrentIndex(index)
@@ -176,6 +186,8 @@ class MainWindow(QMainWindow):
 
     def _abrir_config(self) -> None:
         """Abre configurações."""
+        from .dialogs.config_dialog import ConfigDialog
+
         config = self._controlador.obter_configuracao()
         dialog = ConfigDialog(config, self)
         if dialog.exec():
@@ -197,6 +209,8 @@ class MainWindow(QMainWindow):
                 formato
             )
             if caminho and os.path.exists(caminho):
+                import webbrowser
+
                 webbrowser.open(caminho)
             else:
                 QMessageBox.information(
@@ -132,14 +132,30 @@ class ProgressoWidget(QWidget):
             f"Etapa: {etapa} — "
             f"{percentual:.0f}%"
         )
-        self._adicionar_log(
-            f"[{etapa.upper()}] {mensagem}"
-        )
+        self.registrar_mensagem(etapa, mensagem)
 
         # Desabilitar botão de interrupção ao concluir
         if percentual >= 100:
             self.set_cancelar_habilitado(False, "Concluído")
 
+    @pyqtSlot(str, str)
+    def registrar_mensagem(
+        self, etapa: str, mensagem: str
+    ) -> None:
+        """
+        Registra mensagem de progresso só no log.
+
+        Usado para atualizações cuja barra e rótulo já
+        foram superadas por outra de mesmo percentual.
+
+        Args:
+            etapa: Nome da etapa atual
+            mensagem: Mensagem descritiva
+        """
+        self._adicionar_log(
+            f"[{etapa.upper()}] {mensagem}"
+        )
+
     def set_cancelar_habilitado(self, habilitado: bool, texto: str = None) -> None:
         """
         Altera o estado do botão de interrupção.
@@ -0,0 +1,64 @@
+"""Testes do repasse de progresso do controlador."""
+
+import asyncio
+
+from src.presentation.controllers.controlador_principal import (
+    WorkerProcessamento,
+)
+from src.application.use_cases.processar_texto.dto import (
+    ProgressoDTO,
+)
+from src.application.use_cases.processar_texto.processar_texto_use_case import (
+    MARCADOR_ETAPA,
+)
+
+
+def _consumir(worker, dtos):
+    """Enfileira os DTOs e drena a fila de uma vez."""
+    barra, log = [], []
+    worker.progresso.connect(
+        lambda etapa, pct, msg: barra.append((pct, msg))
+    )
+    worker.mensagem.connect(
+        lambda etapa, msg: log.append(msg)
+    )
+
+    async def _executar():
+        fila = asyncio.Queue()
+        for dto in dtos:
+            fila.put_nowait(dto)
+        fila.put_nowait(None)
+        await worker._consumir_progresso(fila)
+
+    asyncio.run(_executar())
+    return barra, log
+
+
+def test_marcador_seguido_de_mensagem_no_mesmo_percentual(qapp):
+    worker = WorkerProcessamento(None, "", [])
+    inicio = f"{MARCADOR_ETAPA} INÍCIO: Revisão"
+    barra, log = _consumir(worker, [
+        ProgressoDTO("revisao", 20.0, inicio),
+        ProgressoDTO("revisao", 20.0, "Revisando seção 1/5"),
+        ProgressoDTO("revisao", 30.0, "Revisando seção 2/5"),
+    ])
+
+    # Barra repintada uma vez por percentual
+    assert barra == [
+        (20.0, "Revisando seção 1/5"),
+        (30.0, "Revisando seção 2/5"),
+    ]
+    # Nenhuma mensagem se perde: o marcador vai para o log
+    assert log == [inicio]
+
+
+def test_mensagem_somente_log_nao_repinta(qapp):
+    worker = WorkerProcessamento(None, "", [])
+    barra, log = _consumir(worker, [
+        ProgressoDTO("revisao", 20.0, "Seção 1/3"),
+        ProgressoDTO("revisao", 20.0, "Seção 2/3", somente_log=True),
+        ProgressoDTO("revisao", 20.0, "Seção 3/3", somente_log=True),
+    ])
+
+    assert barra == [(20.0, "Seção 1/3")]
+    assert log == ["Seção 2/3", "Seção 3/3"]
@@ -1,12 +1,15 @@
 """Testes das entidades do domínio."""
 
+import hashlib
 import os
 import pytest
+from datetime import datetime
 
 from src.core.entities.erro import Erro
 from src.core.entities.correcao import Correcao
 from src.core.entities.revisao import Revisao
 from src.core.entities.secao import Secao
+from src.core.entities import texto_estruturado
 from src.core.entities.texto_estruturado import TextoEstruturado
 from src.core.entities.relatorio import Relatorio
 from src.core.enums.status_texto import StatusTexto
@@ -17,6 +20,7 @@ from src.core.enums.formato_relatorio import (
 from src.core.value_objects.metadados_pdf import (
     MetadadosPDF,
 )
+from src.core.exceptions import SecaoDuplicadaException
 
 
 class TestErro:
@@ -69,6 +73,7 @@ class TestErro:
         assert e2.tipo == e.tipo
         assert e2.descricao == e.descricao
         assert e2.trecho_original == e.trecho_original
+        assert e2.data_deteccao == e.data_deteccao
 
     def test_severidade_valida(self):
         with pytest.raises(Exception):
@@ -125,6 +130,7 @@ class TestRevisao:
         )
         r.finalizar()
         assert r.esta_finalizada is True
+        assert r.tempo_processamento_seg >= 0
 
     def test_to_dict_from_dict(self):
         r = Revisao(
@@ -185,6 +191,105 @@ class TestSecao:
         erros = s.obter_todos_erros()
         assert len(erros) == 1
 
+    def test_obter_todos_erros_reflete_mudancas(self):
+        s = Secao(
+            titulo="S",
+            conteudo_original="T",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        r = Revisao(
+            numero_iteracao=1, texto_entrada="T"
+        )
+        s.adicionar_revisao(r)
+        assert s.obter_todos_erros() == []
+        r.adicionar_erro(
+            Erro(
+                tipo=TipoErro.GRAMATICAL,
+                descricao="D",
+                trecho_original="a",
+                sugestao_correcao="b",
+            )
+        )
+        assert len(s.obter_todos_erros()) == 1
+        s.adicionar_revisao(
+            Revisao(numero_iteracao=2, texto_entrada="T")
+        )
+        assert len(s.obter_todos_erros()) == 1
+        r3 = Revisao(numero_iteracao=3, texto_entrada="T")
+        for trecho in (" a ", "c"):
+            r3.adicionar_erro(
+                Erro(
+                    tipo=TipoErro.GRAMATICAL,
+                    descricao="D",
+                    trecho_original=trecho,
+                    sugestao_correcao="b",
+                )
+            )
+        s.adicionar_revisao(r3)
+        assert [
+            e.trecho_original for e in s.obter_todos_erros()
+        ] == ["a", "c"]
+        assert s.contar_erros() == 2
+        # Revisões removidas e substituídas: o id() da antiga pode
+        # ser reaproveitado, mas o memo não pode ser reutilizado.
+        def revisao_com_erro(trecho):
+            rev = Revisao(numero_iteracao=1, texto_entrada="T")
+            rev.adicionar_erro(
+                Erro(
+                    tipo=TipoErro.GRAMATICAL,
+                    descricao="D",
+                    trecho_original=trecho,
+                    sugestao_correcao="b",
+                )
+            )
+            return rev
+
+        for i in range(50):
+            s.revisoes.clear()
+            s.adicionar_revisao(revisao_com_erro("AAA"))
+            assert [
+                e.trecho_original for e in s.obter_todos_erros()
+            ] == ["AAA"]
+            s.revisoes.clear()
+            s.adicionar_revisao(revisao_com_erro(f"B{i}"))
+            assert [
+                e.trecho_original for e in s.obter_todos_erros()
+            ] == [f"B{i}"]
+
+    def test_texto_vigente(self):
+        s = Secao(
+            titulo="S",
+            conteudo_original="Original",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        assert s.texto_vigente == "Original"
+        s.adicionar_revisao(
+            Revisao(
+                numero_iteracao=1,
+                texto_entrada="Original",
+                texto_saida="Revisado",
+            )
+        )
+        assert s.texto_vigente == "Revisado"
+        s.adicionar_revisao(
+            Revisao(numero_iteracao=2, texto_entrada="Revisado")
+        )
+        assert s.texto_vigente == "Original"
+
+    def test_numero_palavras_acompanha_conteudo(self):
+        s = Secao(
+            titulo="S",
+            conteudo_original="uma  frase\ncurta",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        assert s.numero_palavras == 3
+        assert s.numero_palavras == 3
+        s.conteudo_original = "outra"
+        assert s.numero_palavras == 1
+
     def test_to_dict_from_dict(self):
         s = Secao(
             titulo="TITULO",
@@ -263,6 +368,101 @@ class TestTextoEstruturado:
         assert texto.hash_arquivo
         assert len(texto.hash_arquivo) > 10
 
+    def test_calcular_hash_memoriza_por_estado(self, pdf_fake):
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+            metadados=MetadadosPDF(numero_paginas=5),
+            tamanho_bytes=os.path.getsize(pdf_fake),
+            numero_paginas=5,
+        )
+        original = texto.calcular_hash()
+        eventos = len(texto.historico)
+        assert texto.calcular_hash() == original
+        assert len(texto.historico) == eventos
+
+        # Mesmo tamanho e mtime: só a verificação percebe
+        estado = os.stat(pdf_fake)
+        with open(pdf_fake, "r+b") as f:
+            f.write(b"X")
+        os.utime(
+            pdf_fake,
+            ns=(estado.st_atime_ns, estado.st_mtime_ns),
+        )
+        assert texto.calcular_hash() == original
+        assert texto.verificar_integridade() is False
+
+    def test_calcular_hash_mapeado(
+        self, pdf_fake, monkeypatch
+    ):
+        monkeypatch.setattr(
+            texto_estruturado, "LIMIAR_MMAP_HASH", 1
+        )
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+            metadados=MetadadosPDF(numero_paginas=5),
+            tamanho_bytes=os.path.getsize(pdf_fake),
+            numero_paginas=5,
+        )
+        with open(pdf_fake, "rb") as f:
+            esperado = hashlib.sha256(f.read()).hexdigest()
+        assert texto.calcular_hash() == esperado
+
+    def test_calcular_hash_sem_file_digest(
+        self, pdf_fake, monkeypatch
+    ):
+        monkeypatch.delattr(
+            hashlib, "file_digest", raising=False
+        )
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+            metadados=MetadadosPDF(numero_paginas=5),
+            tamanho_bytes=os.path.getsize(pdf_fake),
+            numero_paginas=5,
+        )
+        with open(pdf_fake, "rb") as f:
+            esperado = hashlib.sha256(f.read()).hexdigest()
+        assert texto.calcular_hash() == esperado
+
+    def test_obter_secao_por_pagina(self, pdf_fake):
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+        )
+        for titulo, inicio, fim in (
+            ("A", 1, 3), ("B", 3, 5), ("C", 6, 8),
+        ):
+            texto.adicionar_secao(
+                Secao(
+                    titulo=titulo,
+                    conteudo_original="C",
+                    numero_pagina_inicio=inicio,
+                    numero_pagina_fim=fim,
+                )
+            )
+        busca = texto.obter_secao_por_pagina
+        assert busca(3).titulo == "A"
+        assert busca(5).titulo == "B"
+        assert busca(9) is None
+
+        texto.remover_secao("A")
+        assert busca(2) is None
+        assert busca(3).titulo == "B"
+
+        # Fora de ordem: busca linear
+        texto.adicionar_secao(
+            Secao(
+                titulo="D",
+                conteudo_original="C",
+                numero_pagina_inicio=1,
+                numero_pagina_fim=2,
+            )
+        )
+        assert busca(2).titulo == "D"
+        assert busca(7).titulo == "C"
+
     def test_total_erros(self, pdf_fake):
         texto = TextoEstruturado(
             caminho_arquivo=pdf_fake,
@@ -316,6 +516,105 @@ class TestTextoEstruturado:
         texto2 = TextoEstruturado.from_dict(d)
         assert texto2.nome_arquivo == "teste.pdf"
         assert texto2.numero_paginas == 3
+        assert isinstance(d["historico"], list)
+        assert list(texto2.historico) == d["historico"]
+        for entrada in d["historico"]:
+            datetime.fromisoformat(entrada["timestamp"])
+        assert texto2.to_dict()["historico"] == d["historico"]
+
+    def test_from_dict_com_secoes(self, pdf_fake):
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+        )
+        for titulo in ("A", "B"):
+            texto.adicionar_secao(
+                Secao(
+                    titulo=titulo,
+                    conteudo_original="C",
+                    numero_pagina_inicio=1,
+                    numero_pagina_fim=1,
+                )
+            )
+        d = texto.to_dict()
+        texto2 = TextoEstruturado.from_dict(d)
+        assert [s.titulo for s in texto2.secoes] == ["A", "B"]
+        assert texto2.obter_secao_por_titulo("B") is not None
+        assert len(texto2.historico) == len(texto.historico)
+
+        d["secoes"].append(d["secoes"][0])
+        with pytest.raises(SecaoDuplicadaException):
+            TextoEstruturado.from_dict(d)
+
+    def test_adicionar_secao_duplicada(self, pdf_fake):
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+        )
+        secao = Secao(
+            titulo="A",
+            conteudo_original="C",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        texto.adicionar_secao(secao)
+        outra = Secao(
+            titulo="A",
+            conteudo_original="D",
+            numero_pagina_inicio=2,
+            numero_pagina_fim=2,
+        )
+        for repetida in (secao, outra):
+            with pytest.raises(SecaoDuplicadaException):
+                texto.adicionar_secao(repetida)
+        assert texto.secoes == [secao]
+        assert texto.obter_secao_por_titulo("A") is secao
+
+    def test_secoes_por_status(self, pdf_fake):
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+        )
+        for titulo in ("A", "B", "C"):
+            texto.adicionar_secao(
+                Secao(
+                    titulo=titulo,
+                    conteudo_original="C",
+                    numero_pagina_inicio=1,
+                    numero_pagina_fim=1,
+                )
+            )
+        texto.secoes[1].status = StatusTexto.CONCLUIDO
+        concluido = StatusTexto.CONCLUIDO
+        assert texto.contar_secoes_por_status(concluido) == 1
+        assert [
+            s.titulo
+            for s in texto.iterar_secoes_por_status(concluido)
+        ] == ["B"]
+        assert len(
+            texto.obter_secoes_por_status(StatusTexto.PENDENTE)
+        ) == 2
+        assert texto.progresso_percentual == pytest.approx(
+            100 / 3
+        )
+
+    def test_historico_limitado(self, pdf_fake, monkeypatch):
+        monkeypatch.setattr(
+            texto_estruturado, "HISTORICO_MAX", 2
+        )
+        texto = TextoEstruturado(
+            caminho_arquivo=pdf_fake,
+            nome_arquivo="teste.pdf",
+        )
+        for status in (
+            StatusTexto.PROCESSANDO,
+            StatusTexto.REVISANDO,
+            StatusTexto.CONCLUIDO,
+        ):
+            texto.atualizar_status(status)
+        assert [
+            e["detalhes"]["novo"] for e in texto.historico
+        ] == ["revisando", "concluido"]
 
 
 class TestRelatorio:
@@ -1,7 +1,9 @@
 """Testes da camada de infraestrutura."""
 
 import asyncio
+import hashlib
 import json
+import logging
 import os
 import tempfile
 import shutil
@@ -13,14 +15,22 @@ from src.infrastructure.ai.gemini_gateway import (
 from src.infrastructure.ai.prompt_builder import (
     PromptBuilder,
 )
+from src.infrastructure.ai.gateway_coalescente import (
+    GatewayCoalescente,
+)
+from src.infrastructure.ai.agente_cache import AgenteComCache
 from src.infrastructure.ai.agents import (
     AgenteRevisor,
+    AgenteMultiRevisor,
     AgenteValidador,
     AgenteConsistencia,
 )
 from src.infrastructure.pdf.pdf_processor import (
     PdfProcessor,
 )
+from src.infrastructure.pdf.cached_pdf_processor import (
+    CachedPdfProcessor,
+)
 from src.infrastructure.reports.markdown_generator import (
     MarkdownReportGenerator,
 )
@@ -36,6 +46,7 @@ from src.infrastructure.repositories.json_config_repository import (
 from src.infrastructure.logging.app_logger import (
     AppLogger,
 )
+from src.core.interfaces.services.i_ai_agent import IAIAgent
 from src.core.entities.texto_estruturado import TextoEstruturado
 from src.core.entities.secao import Secao
 from src.core.entities.revisao import Revisao
@@ -48,6 +59,9 @@ from src.core.enums.formato_relatorio import (
 from src.core.value_objects.metadados_pdf import (
     MetadadosPDF,
 )
+from src.core.exceptions.pdf_exceptions import (
+    ExtracaoException,
+)
 
 
 @pytest.fixture
@@ -65,6 +79,72 @@ def pdf_fake(tmp_dir):
     return path
 
 
+def _gerar_pdf(paginas):
+    """PDF mínimo; cada página é uma lista de linhas."""
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(paginas)))
+    objetos = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] "
+        f"/Count {len(paginas)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, linhas in enumerate(paginas):
+        texto = " ".join(f"({linha}) '" for linha in linhas)
+        stream = f"BT /F1 12 Tf 14 TL 72 720 Td {texto} ET".encode()
+        objetos.append(
+            f"<< /Type /Page /Parent 2 0 R "
+            f"/MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objetos.append(
+            b"<< /Length %d >>\nstream\n" % len(stream)
+            + stream
+            + b"\nendstream"
+        )
+    corpo = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objetos, 1):
+        offsets.append(len(corpo))
+        corpo += f"{i} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref = len(corpo)
+    corpo += (
+        f"xref\n0 {len(objetos) + 1}\n"
+        f"0000000000 65535 f \n"
+    ).encode()
+    for off in offsets:
+        corpo += f"{off:010d} 00000 n \n".encode()
+    corpo += (
+        f"trailer\n<< /Size {len(objetos) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return corpo
+
+
+@pytest.fixture
+def pdf_valido(tmp_dir):
+    """PDF mínimo de duas páginas com texto."""
+    path = os.path.join(tmp_dir, "valido.pdf")
+    with open(path, "wb") as f:
+        f.write(_gerar_pdf([
+            ["1. INTRODUCAO pagina um"],
+            ["2. METODOLOGIA pagina dois"],
+        ]))
+    return path
+
+
+@pytest.fixture
+def pdf_multilinha(tmp_dir):
+    """PDF de duas seções com várias linhas por página."""
+    path = os.path.join(tmp_dir, "multilinha.pdf")
+    with open(path, "wb") as f:
+        f.write(_gerar_pdf([
+            ["1. INTRODUCAO", "Texto da introducao aqui."],
+            ["2. METODOLOGIA", "Texto da metodologia."],
+        ]))
+    return path
+
+
 @pytest.fixture
 def texto_sample(pdf_fake):
     texto = TextoEstruturado(
@@ -165,6 +245,77 @@ class TestGeminiGateway:
         assert m["total_requests"] == 0
 
 
+class TestGatewayCoalescente:
+    """Testes para coalescência de requisições."""
+
+    def test_chamadas_identicas_compartilham_requisicao(self):
+        interno = GeminiGateway(api_key="", modo_mock=True)
+        chamadas = []
+        original = interno.gerar_conteudo
+
+        async def gerar(prompt, **kwargs):
+            chamadas.append(prompt)
+            await asyncio.sleep(0.01)
+            return await original(prompt, **kwargs)
+
+        interno.gerar_conteudo = gerar
+        gateway = GatewayCoalescente(interno)
+
+        async def _executar():
+            return await asyncio.gather(
+                gateway.gerar_conteudo("p", origem="a"),
+                gateway.gerar_conteudo("p", origem="b"),
+                gateway.gerar_conteudo("outro"),
+            )
+
+        r1, r2, _ = asyncio.run(_executar())
+        assert r1 == r2
+        assert sorted(chamadas) == ["outro", "p"]
+
+    def test_contexto_assincrono_repassa_ciclo_de_vida(self):
+        interno = GeminiGateway(api_key="", modo_mock=True)
+        eventos = []
+
+        async def aquecer():
+            eventos.append("aquecer")
+
+        async def encerrar():
+            eventos.append("encerrar")
+
+        interno.aquecer = aquecer
+        interno.encerrar = encerrar
+
+        async def _executar():
+            async with GatewayCoalescente(interno) as gateway:
+                eventos.append("uso")
+                return await gateway.gerar_conteudo("p")
+
+        assert asyncio.run(_executar())
+        assert eventos == ["aquecer", "uso", "encerrar"]
+
+    def test_lote_preserva_ordem_e_coalesce(self):
+        interno = GeminiGateway(api_key="", modo_mock=True)
+        chamadas = []
+
+        async def gerar(prompt, **kwargs):
+            chamadas.append(prompt)
+            await asyncio.sleep(0.01)
+            return f"r:{prompt}"
+
+        interno.gerar_conteudo = gerar
+        gateway = GatewayCoalescente(interno)
+
+        resultados = asyncio.run(
+            gateway.gerar_conteudo_lote([
+                {"prompt": "b"},
+                {"prompt": "a", "temperatura": 0.2},
+                {"prompt": "b"},
+            ])
+        )
+        assert resultados == ["r:b", "r:a", "r:b"]
+        assert sorted(chamadas) == ["a", "b"]
+
+
 class TestPromptBuilder:
     """Testes para PromptBuilder."""
 
@@ -193,6 +344,13 @@ class TestPromptBuilder:
         with pytest.raises(ValueError):
             pb.construir("tipo_inexistente")
 
+    def test_template_compilado_equivale_a_format(self):
+        pb = PromptBuilder()
+        pb.adicionar_template("t", "{a} {{literal}} {b:>4}")
+        assert pb.construir("t", a="x", b="y") == "x {literal}    y"
+        with pytest.raises(ValueError):
+            pb.construir("t", a="x")
+
 
 class TestAgents:
     """Testes para agentes de IA."""
@@ -231,6 +389,167 @@ class TestAgents:
         )
         assert ac.obter_nome() == "consistencia"
 
+    def test_agente_multi_revisor_separa_tarefas(
+        self, gateway_mock, prompt_builder
+    ):
+        am = AgenteMultiRevisor(gateway_mock, prompt_builder)
+        prompt = am._construir_prompt("Texto da seção.")
+        assert prompt.count("Texto da seção.") == 1
+        assert '"revisao_tecnica"' in prompt
+
+        resposta = json.dumps({
+            "revisao_gramatical": {"erros": [{
+                "trecho_original": "a",
+                "sugestao_correcao": "b",
+                "tipo": "gramatical",
+            }]},
+            "revisao_tecnica": {"erros": [{
+                "trecho_original": "c",
+                "sugestao_correcao": "d",
+                "tipo": "tecnico",
+            }]},
+            "texto_revisado": "Texto corrigido.",
+        })
+        secao = Secao(
+            titulo="S",
+            conteudo_original="Texto.",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        revisao = am._parsear_resposta(resposta, secao)
+
+        assert revisao.agente == "revisor_multiplo"
+        assert revisao.texto_saida == "Texto corrigido."
+        assert [e.agente_origem for e in revisao.erros] == [
+            "revisor_revisao_gramatical",
+            "revisor_revisao_tecnica",
+        ]
+
+
+class TestProcessarLote:
+    """Testes para a revisão de várias seções por chamada."""
+
+    def test_separa_resposta_por_secao(self):
+        gw = GeminiGateway(api_key="test", modo_mock=True)
+        prompts = []
+
+        async def gerar_conteudo(prompt, **kwargs):
+            prompts.append(prompt)
+            return json.dumps({"secoes": [
+                {"id": 2, "erros": [], "texto_revisado": "B."},
+                {"id": 1, "erros": [{
+                    "trecho_original": "a",
+                    "sugestao_correcao": "b",
+                    "tipo": "gramatical",
+                }], "texto_revisado": "A."},
+            ]})
+
+        gw.gerar_conteudo = gerar_conteudo
+        agente = AgenteRevisor(gw, PromptBuilder())
+        secoes = [
+            Secao(
+                titulo=t,
+                conteudo_original=f"Texto {t}.",
+                numero_pagina_inicio=1,
+                numero_pagina_fim=1,
+            )
+            for t in ("A", "B", "C")
+        ]
+
+        revisoes = asyncio.run(agente.processar_lote(secoes, {}))
+
+        assert "<<<SEC id=3>>>\nTexto C.\n<<<END>>>" in prompts[0]
+        assert [r.texto_saida for r in revisoes[:2]] == ["A.", "B."]
+        assert revisoes[0].total_erros == 1
+        assert revisoes[2] is None
+
+    def test_padrao_chama_processar_por_secao(self, tmp_dir):
+        class Agente(IAIAgent):
+            async def processar(self, secao, configuracao):
+                return Revisao(
+                    numero_iteracao=1,
+                    texto_entrada=configuracao["texto_entrada"],
+                    texto_saida=configuracao["texto_entrada"].upper(),
+                )
+
+            async def gerar_sintese(self, contexto):
+                return ""
+
+            def obter_nome(self):
+                return "simples"
+
+            def obter_descricao(self):
+                return ""
+
+        secoes = [
+            Secao(
+                titulo=t,
+                conteudo_original=t,
+                numero_pagina_inicio=1,
+                numero_pagina_fim=1,
+            )
+            for t in ("a", "b")
+        ]
+        agente = AgenteComCache(
+            Agente(), os.path.join(tmp_dir, "revisoes")
+        )
+        revisoes = asyncio.run(
+            agente.processar_lote(
+                secoes, {"textos_entrada": ["x", "y"]}
+            )
+        )
+        assert [r.texto_saida for r in revisoes] == ["X", "Y"]
+
+    def test_padrao_limita_concorrencia(self, tmp_dir):
+        ativas = []
+        pico = []
+
+        class Agente(IAIAgent):
+            async def processar(self, secao, configuracao):
+                assert "max_concorrencia" not in configuracao
+                ativas.append(1)
+                pico.append(len(ativas))
+                await asyncio.sleep(0.01)
+                ativas.pop()
+                return Revisao(
+                    numero_iteracao=1,
+                    texto_entrada=configuracao["texto_entrada"],
+                )
+
+            async def gerar_sintese(self, contexto):
+                return ""
+
+            def obter_nome(self):
+                return "simples"
+
+            def obter_descricao(self):
+                return ""
+
+        secoes = [
+            Secao(
+                titulo=str(i),
+                conteudo_original=str(i),
+                numero_pagina_inicio=1,
+                numero_pagina_fim=1,
+            )
+            for i in range(5)
+        ]
+        agente = AgenteComCache(
+            Agente(), os.path.join(tmp_dir, "revisoes")
+        )
+        revisoes = asyncio.run(
+            agente.processar_lote(secoes, {"max_concorrencia": 2})
+        )
+
+        assert len(revisoes) == 5
+        assert max(pico) == 2
+        # O cache não faz um agente simples parecer em lote
+        assert not agente.suporta_lote
+        gw = GeminiGateway(api_key="test", modo_mock=True)
+        assert AgenteComCache(
+            AgenteRevisor(gw, PromptBuilder()), tmp_dir
+        ).suporta_lote
+
 
 class TestPdfProcessor:
     """Testes para PdfProcessor."""
@@ -250,6 +569,66 @@ class TestPdfProcessor:
         result = asyncio.run(pp.validar_pdf(txt))
         assert result is False
 
+    def test_extrair_texto_pdf(self, pdf_valido):
+        pp = PdfProcessor()
+        texto = asyncio.run(pp.extrair_texto(pdf_valido))
+        assert "--- Página 1 ---" in texto
+        assert "--- Página 2 ---" in texto
+        assert "METODOLOGIA pagina dois" in texto
+
+    def test_extrair_texto_sem_cr_nos_dois_backends(
+        self, pdf_multilinha, monkeypatch
+    ):
+        from src.infrastructure.pdf import pdf_processor
+
+        pp = PdfProcessor()
+
+        def _extrair():
+            texto = asyncio.run(pp.extrair_texto(pdf_multilinha))
+            secoes = asyncio.run(pp.detectar_secoes(texto, 2))
+            return texto, secoes
+
+        texto_pdfium, secoes_pdfium = _extrair()
+        monkeypatch.setattr(pdf_processor, "pdfium", None)
+        texto_pypdf, secoes_pypdf = _extrair()
+
+        assert "\r" not in texto_pdfium
+        assert "\r" not in texto_pypdf
+        assert [s.titulo for s in secoes_pdfium] == [
+            s.titulo for s in secoes_pypdf
+        ]
+        assert [s.conteudo for s in secoes_pdfium] == [
+            s.conteudo for s in secoes_pypdf
+        ]
+        assert len(secoes_pdfium) == 2
+
+    def test_extrair_texto_paginas(self, pdf_valido):
+        pp = PdfProcessor()
+        textos = asyncio.run(
+            pp.extrair_texto_paginas(pdf_valido, [2, 1])
+        )
+        assert list(textos) == [2, 1]
+        assert "METODOLOGIA pagina dois" in textos[2]
+        assert textos[1] == asyncio.run(
+            pp.extrair_texto_por_pagina(pdf_valido, 1)
+        )
+        with pytest.raises(ExtracaoException):
+            asyncio.run(pp.extrair_texto_paginas(pdf_valido, [3]))
+
+    def test_extrair_texto_stream(self, pdf_valido):
+        pp = PdfProcessor()
+
+        async def _coletar():
+            return [
+                p async for p in pp.extrair_texto_stream(pdf_valido)
+            ]
+
+        paginas = asyncio.run(_coletar())
+        assert [numero for numero, _ in paginas] == [1, 2]
+        assert dict(paginas) == asyncio.run(
+            pp.extrair_texto_paginas(pdf_valido, [1, 2])
+        )
+
     def test_detectar_secoes_sem_secoes(self):
         pp = PdfProcessor()
         secoes = asyncio.run(
@@ -319,6 +698,200 @@ class TestPdfProcessor:
         assert secoes[1].titulo == "Metodologia"
         assert secoes[1].nivel == 2
 
+    def test_detectar_secoes_stream_equivale_a_lista(self):
+        pp = PdfProcessor()
+        texto = (
+            "1. INTRODUÇÃO\n"
+            "Texto da introdução.\n\n"
+            "2. METODOLOGIA\n"
+            "Texto da metodologia."
+        )
+
+        async def _coletar():
+            return [
+                s async for s in pp.detectar_secoes_stream(texto, 5)
+            ]
+
+        assert asyncio.run(_coletar()) == asyncio.run(
+            pp.detectar_secoes(texto, 5)
+        )
+
+
+class TestCachedPdfProcessor:
+    """Testes para o cache de extração."""
+
+    def test_reutiliza_extracao(self, tmp_dir):
+        caminho = os.path.join(tmp_dir, "texto.md")
+        with open(caminho, "w", encoding="utf-8") as f:
+            f.write("# Título\n\nConteúdo.")
+        interno = PdfProcessor()
+        chamadas = []
+        original = interno.extrair_texto
+
+        async def extrair(c):
+            chamadas.append(c)
+            return await original(c)
+
+        interno.extrair_texto = extrair
+        cache_dir = os.path.join(tmp_dir, "cache")
+
+        proc = CachedPdfProcessor(interno, cache_dir)
+        texto = asyncio.run(proc.extrair_texto(caminho))
+        assert asyncio.run(proc.extrair_texto(caminho)) == texto
+
+        # Nova instância: acerto vem do disco
+        proc2 = CachedPdfProcessor(interno, cache_dir)
+        assert asyncio.run(proc2.extrair_texto(caminho)) == texto
+        assert len(chamadas) == 1
+
+    def test_hash_informado_dispensa_releitura(
+        self, tmp_dir, monkeypatch
+    ):
+        from src.infrastructure.pdf import cached_pdf_processor
+
+        caminho = os.path.join(tmp_dir, "texto.md")
+        with open(caminho, "w", encoding="utf-8") as f:
+            f.write("# Título\n\nConteúdo.")
+
+        def _sem_hash(c):
+            raise AssertionError("arquivo relido para o hash")
+
+        monkeypatch.setattr(
+            cached_pdf_processor, "_hash_arquivo", _sem_hash
+        )
+        proc = CachedPdfProcessor(
+            PdfProcessor(), os.path.join(tmp_dir, "cache")
+        )
+        texto = asyncio.run(
+            proc.extrair_texto(caminho, hash_arquivo="abc")
+        )
+        assert "Conteúdo." in texto
+
+    def test_hash_acompanha_alteracao_do_arquivo(self, tmp_dir):
+        from src.infrastructure.pdf.cached_pdf_processor import (
+            _hash_arquivo,
+        )
+
+        caminho = os.path.join(tmp_dir, "texto.md")
+        with open(caminho, "wb") as f:
+            f.write(b"primeira")
+        primeiro = _hash_arquivo(caminho)
+        assert primeiro == hashlib.sha256(b"primeira").hexdigest()
+        assert _hash_arquivo(caminho) == primeiro
+
+        with open(caminho, "wb") as f:
+            f.write(b"segunda versao")
+        assert (
+            _hash_arquivo(caminho)
+            == hashlib.sha256(b"segunda versao").hexdigest()
+        )
+
+
+class TestAgenteComCache:
+    """Testes para o cache de revisões."""
+
+    def test_reutiliza_revisao_entre_instancias(self, tmp_dir):
+        chamadas = []
+
+        class Agente(AgenteRevisor):
+            async def processar(self, secao, configuracao):
+                chamadas.append(configuracao["texto_entrada"])
+                return Revisao(
+                    numero_iteracao=1,
+                    texto_entrada=secao.conteudo_original,
+                    texto_saida="Revisado.",
+                    agente=self.obter_nome(),
+                )
+
+        gw = GeminiGateway(api_key="test", modo_mock=True)
+        interno = Agente(gw, PromptBuilder())
+        secao = Secao(
+            titulo="S",
+            conteudo_original="Texto.",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        cache_dir = os.path.join(tmp_dir, "revisoes")
+
+        agente = AgenteComCache(interno, cache_dir)
+        asyncio.run(agente.processar(secao, {"texto_entrada": "Texto."}))
+        # Espaços finais não mudam a chave; nova instância lê do disco
+        agente2 = AgenteComCache(interno, cache_dir)
+        revisao = asyncio.run(
+            agente2.processar(secao, {"texto_entrada": "Texto.  \n"})
+        )
+        assert revisao.texto_saida == "Revisado."
+        assert chamadas == ["Texto."]
+
+        asyncio.run(agente2.processar(secao, {"texto_entrada": "Outro."}))
+        assert chamadas == ["Texto.", "Outro."]
+
+    def test_template_alterado_invalida(self, tmp_dir):
+        chamadas = []
+
+        class Agente(AgenteRevisor):
+            async def processar(self, secao, configuracao):
+                chamadas.append(configuracao["texto_entrada"])
+                return Revisao(
+                    numero_iteracao=1,
+                    texto_entrada=secao.conteudo_original,
+                    agente=self.obter_nome(),
+                )
+
+        gw = GeminiGateway(api_key="test", modo_mock=True)
+        secao = Secao(
+            titulo="S",
+            conteudo_original="Texto.",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        cache_dir = os.path.join(tmp_dir, "revisoes")
+        config = {"texto_entrada": "Texto."}
+
+        asyncio.run(
+            AgenteComCache(
+                Agente(gw, PromptBuilder()), cache_dir
+            ).processar(secao, config)
+        )
+        builder = PromptBuilder(
+            {"revisao_gramatical": "Revise de novo: {texto}"}
+        )
+        asyncio.run(
+            AgenteComCache(
+                Agente(gw, builder), cache_dir
+            ).processar(secao, config)
+        )
+        assert chamadas == ["Texto.", "Texto."]
+
+    def test_memoria_limitada(self, tmp_dir, monkeypatch):
+        from src.infrastructure.ai import agente_cache
+
+        class Agente(AgenteRevisor):
+            async def processar(self, secao, configuracao):
+                return Revisao(
+                    numero_iteracao=1,
+                    texto_entrada=configuracao["texto_entrada"],
+                    agente=self.obter_nome(),
+                )
+
+        monkeypatch.setattr(agente_cache, "MAX_ENTRADAS_MEMORIA", 2)
+        gw = GeminiGateway(api_key="test", modo_mock=True)
+        agente = AgenteComCache(
+            Agente(gw, PromptBuilder()),
+            os.path.join(tmp_dir, "revisoes"),
+        )
+        secao = Secao(
+            titulo="S",
+            conteudo_original="a",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+        for texto in ("a", "b", "c"):
+            asyncio.run(
+                agente.processar(secao, {"texto_entrada": texto})
+            )
+        assert len(agente._memoria) == 2
+
 
 class TestMarkdownGenerator:
     """Testes para gerador Markdown."""
@@ -491,6 +1064,56 @@ class TestJsonConfigRepository:
         )
         assert repo2.obter_valor("teste") == "abc"
 
+    def test_recarrega_apos_edicao_externa(self, tmp_dir):
+        caminho = os.path.join(
+            tmp_dir, "config.json"
+        )
+        repo = JsonConfigRepository(
+            caminho_config=caminho
+        )
+        assert repo.carregar_configuracao()["timeout"] == 120
+
+        with open(caminho, encoding="utf-8") as f:
+            dados = json.load(f)
+        dados["timeout"] = 60
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(dados, f)
+        stat = os.stat(caminho)
+        os.utime(
+            caminho,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9),
+        )
+
+        assert repo.carregar_configuracao()["timeout"] == 60
+
+    def test_prompt_relido_so_apos_alteracao(self, tmp_dir):
+        prompts = os.path.join(tmp_dir, "prompts")
+        os.makedirs(prompts)
+        caminho = os.path.join(prompts, "revisao.json")
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"template": "v1"}, f)
+        repo = JsonConfigRepository(
+            os.path.join(tmp_dir, "config.json"), prompts
+        )
+
+        p1 = repo.carregar_prompt("revisao")
+        p1["template"] = "alterado"
+        assert repo.carregar_prompt("revisao") == {
+            "template": "v1"
+        }
+
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"template": "v2"}, f)
+        stat = os.stat(caminho)
+        os.utime(
+            caminho,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9),
+        )
+        assert repo.carregar_prompt("revisao") == {
+            "template": "v2"
+        }
+        assert repo.carregar_prompt("inexistente") is None
+
 
 class TestAppLogger:
     """Testes para logger da aplicação."""
@@ -530,3 +1153,31 @@ class TestAppLogger:
                 log_dir, "revisor_textos.log"
             )
         )
+
+    def test_log_batch(self, tmp_dir, caplog):
+        log = AppLogger(
+            nome="teste_lote",
+            diretorio_log=os.path.join(
+                tmp_dir, "logs"
+            ),
+        )
+        consumidos = []
+
+        def _registros():
+            for i in range(3):
+                consumidos.append(i)
+                yield f"linha {i}", {"indice": i}
+
+        # DEBUG abaixo do nível: lote descartado sem iterar
+        log.log_batch(logging.DEBUG, _registros())
+        assert consumidos == []
+
+        with caplog.at_level(logging.INFO, logger="teste_lote"):
+            log.log_batch(logging.INFO, _registros())
+        linhas = [
+            r for r in caplog.records if r.name == "teste_lote"
+        ]
+        assert [r.getMessage() for r in linhas] == [
+            "linha 0", "linha 1", "linha 2"
+        ]
+        assert linhas[2].indice == 2
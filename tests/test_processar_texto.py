@@ -0,0 +1,582 @@
+"""Testes do caso de uso ProcessarTexto."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.gerar_relatorio.gerar_relatorio_use_case import (  # noqa: E501
+    GerarRelatorioUseCase,
+)
+from src.application.use_cases.processar_texto.dto import (
+    ProcessarTextoOutputDTO,
+)
+from src.application.use_cases.processar_texto.processar_texto_use_case import (  # noqa: E501
+    ProcessarTextoUseCase,
+    _ContextoExecucao,
+)
+from src.core.entities.revisao import Revisao
+from src.core.exceptions.revisao_exceptions import (
+    ProcessamentoCanceladoException,
+)
+from src.core.entities.secao import Secao
+from src.core.entities.texto_estruturado import TextoEstruturado
+
+
+@pytest.fixture
+def texto_md(tmp_path):
+    caminho = tmp_path / "texto.md"
+    caminho.write_text("# Título\n\nConteúdo.", encoding="utf-8")
+    texto = TextoEstruturado(
+        caminho_arquivo=str(caminho),
+        nome_arquivo="texto.md",
+        tamanho_bytes=20,
+    )
+    for i in range(1, 4):
+        texto.adicionar_secao(
+            Secao(
+                titulo=f"Seção {i}",
+                conteudo_original=f"Conteúdo {i}.",
+                numero_pagina_inicio=1,
+                numero_pagina_fim=1,
+            )
+        )
+    return texto
+
+
+def _agente(nome, atraso):
+    agente = MagicMock()
+    agente.obter_nome.return_value = nome
+
+    async def processar(secao, config):
+        await asyncio.sleep(atraso)
+        return Revisao(
+            numero_iteracao=0,
+            texto_entrada=secao.conteudo_original,
+            agente=nome,
+        )
+
+    agente.processar = processar
+    return agente
+
+
+def _criar_use_case(agentes, callback=None):
+    config_repo = MagicMock()
+    config_repo.carregar_prompt.return_value = None
+    config_repo.carregar_configuracao.return_value = {}
+    return ProcessarTextoUseCase(
+        pdf_processor=MagicMock(),
+        agentes_revisores=agentes,
+        agente_validador=None,
+        agente_consistencia=None,
+        texto_repo=MagicMock(),
+        config_repo=config_repo,
+        geradores_relatorio={},
+        logger=MagicMock(),
+        callback_progresso=callback,
+    )
+
+
+def test_revisoes_concorrentes_preservam_ordem_das_fases(texto_md):
+    # A segunda fase responde mais rápido que a primeira
+    agentes = [_agente("lento", 0.02), _agente("rapido", 0.0)]
+    callback = MagicMock()
+    use_case = _criar_use_case(agentes, callback)
+
+    asyncio.run(
+        use_case._revisar_secoes(
+            texto_md, {"max_secoes_paralelas": 6}
+        )
+    )
+
+    for secao in texto_md.secoes:
+        assert [r.agente for r in secao.revisoes] == [
+            "lento",
+            "rapido",
+        ]
+    percentuais = [
+        c.args[0].percentual for c in callback.call_args_list
+    ]
+    assert percentuais == sorted(percentuais)
+    assert percentuais[-1] == 55
+
+
+def test_fila_progresso_cheia_nao_descarta():
+    async def _executar():
+        fila = asyncio.Queue(maxsize=2)
+        execucao = _ContextoExecucao(fila_progresso=fila)
+        for pct in (10, 20, 30):
+            execucao.notificar("etapa", pct, "msg")
+        execucao.notificar("etapa", 30, "━━━ FIM: Etapa")
+        assert fila.full()
+        recebidos = []
+
+        async def _consumir():
+            for _ in range(4):
+                dto = await fila.get()
+                recebidos.append((dto.percentual, dto.mensagem))
+
+        await asyncio.gather(_consumir(), execucao.concluir())
+        return recebidos
+
+    assert asyncio.run(_executar()) == [
+        (10, "msg"),
+        (20, "msg"),
+        (30, "msg"),
+        (30, "━━━ FIM: Etapa"),
+    ]
+
+
+def test_execucoes_simultaneas_nao_compartilham_progresso(texto_md):
+    use_case = _criar_use_case([_agente("revisor", 0.01)])
+    outro = TextoEstruturado(
+        caminho_arquivo=texto_md.caminho_arquivo,
+        nome_arquivo="outro.md",
+        tamanho_bytes=20,
+    )
+    outro.adicionar_secao(
+        Secao(
+            titulo="Outra",
+            conteudo_original="Outro conteúdo.",
+            numero_pagina_inicio=1,
+            numero_pagina_fim=1,
+        )
+    )
+    callbacks = [MagicMock(), MagicMock()]
+    cancelada = asyncio.Event()
+    cancelada.set()
+
+    async def _executar():
+        return await asyncio.gather(
+            use_case._revisar_secoes(
+                texto_md,
+                {},
+                execucao=_ContextoExecucao(callbacks[0]),
+            ),
+            use_case._revisar_secoes(
+                outro,
+                {},
+                execucao=_ContextoExecucao(
+                    callbacks[1], evento_cancelamento=cancelada
+                ),
+            ),
+            return_exceptions=True,
+        )
+
+    primeira, segunda = asyncio.run(_executar())
+
+    # Cancelar uma execução não afeta a outra
+    assert primeira is None
+    assert isinstance(segunda, ProcessamentoCanceladoException)
+    mensagens = [
+        c.args[0].mensagem for c in callbacks[0].call_args_list
+    ]
+    assert not any("Outra" in m for m in mensagens)
+    assert mensagens[-1].startswith("━━━ FIM")
+
+
+def test_relatorios_multiplos_formatos(texto_md, tmp_path):
+    geradores = {}
+    for formato in ("markdown", "html"):
+        gerador = MagicMock()
+        gerador.salvar.return_value = str(tmp_path / formato)
+        geradores[formato] = gerador
+    use_case = GerarRelatorioUseCase(
+        geradores=geradores, logger=MagicMock()
+    )
+
+    relatorios = asyncio.run(
+        use_case.executar_multi(
+            texto_md,
+            ["markdown", "pdf", "html"],
+            str(tmp_path / "saida"),
+        )
+    )
+
+    assert relatorios == {
+        "markdown": str(tmp_path / "markdown"),
+        "html": str(tmp_path / "html"),
+    }
+    assert (tmp_path / "saida").is_dir()
+
+
+def test_evento_cancelamento_interrompe_chamada_em_curso():
+    interrompida = []
+
+    async def chamada_lenta():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            interrompida.append(True)
+            raise
+
+    async def _executar():
+        evento = asyncio.Event()
+        execucao = _ContextoExecucao(evento_cancelamento=evento)
+        asyncio.get_running_loop().call_later(0.01, evento.set)
+        await execucao.aguardar(chamada_lenta())
+
+    with pytest.raises(ProcessamentoCanceladoException):
+        asyncio.run(asyncio.wait_for(_executar(), timeout=1))
+    assert interrompida == [True]
+
+
+def test_validacao_e_consistencia_simultaneas(texto_md):
+    ativas = []
+    pico = []
+
+    async def chamada(resultado):
+        ativas.append(1)
+        pico.append(len(ativas))
+        await asyncio.sleep(0.01)
+        ativas.pop()
+        return resultado
+
+    validador = MagicMock()
+    validador.processar = lambda secao, config: chamada(None)
+    use_case = _criar_use_case([])
+    use_case._agente_validador = validador
+    use_case._uc_consistencia = MagicMock()
+    use_case._uc_consistencia.executar = lambda texto: chamada(
+        {"resultado": "ok"}
+    )
+
+    asyncio.run(
+        use_case._validar_e_verificar(
+            texto_md, {"max_secoes_paralelas": 2}
+        )
+    )
+
+    assert max(pico) == 2
+    assert texto_md.analise_consistencia == "ok"
+
+
+def test_metricas_calculadas_sob_demanda():
+    calcular = MagicMock(return_value={"total_secoes": 3})
+    saida = ProcessarTextoOutputDTO(calcular_metricas=calcular)
+
+    calcular.assert_not_called()
+    assert saida.metricas == {"total_secoes": 3}
+    assert saida.metricas is saida.metricas
+    calcular.assert_called_once()
+    assert ProcessarTextoOutputDTO().metricas == {}
+
+
+class _AgenteLote:
+    """Agente com suporte a lote que omite a última seção."""
+
+    def __init__(self):
+        self.lotes = []
+        self.avulsas = []
+
+    def obter_nome(self):
+        return "revisor_lote"
+
+    async def processar_lote(self, secoes, config):
+        self.lotes.append([s.titulo for s in secoes])
+        revisoes = [
+            Revisao(numero_iteracao=0, texto_entrada=t, agente="revisor_lote")
+            for t in config["textos_entrada"]
+        ]
+        return revisoes[:-1] + [None]
+
+    async def processar(self, secao, config):
+        self.avulsas.append(secao.titulo)
+        return Revisao(
+            numero_iteracao=0,
+            texto_entrada=config["texto_entrada"],
+            agente="revisor_lote",
+        )
+
+
+def test_revisao_em_lote_agrupa_secoes(texto_md):
+    agente = _AgenteLote()
+    use_case = _criar_use_case([agente])
+
+    asyncio.run(
+        use_case._revisar_secoes(
+            texto_md, {"tokens_lote_revisao": 1000}
+        )
+    )
+
+    assert agente.lotes == [["Seção 1", "Seção 2", "Seção 3"]]
+    # Seção omitida na resposta é revisada individualmente
+    assert agente.avulsas == ["Seção 3"]
+    for secao in texto_md.secoes:
+        assert [r.numero_iteracao for r in secao.revisoes] == [1]
+        assert secao.revisoes[0].convergiu
+
+
+def test_lote_respeita_capacidade_declarada(texto_md):
+    from src.application.use_cases.revisar_secao.revisar_secao_use_case import (  # noqa: E501
+        RevisarSecaoUseCase,
+    )
+
+    class _Decorador(_AgenteLote):
+        """Sobrescreve processar_lote, mas o interno não agrupa."""
+
+        suporta_lote = False
+
+    agente = _Decorador()
+    uc = RevisarSecaoUseCase(agente, MagicMock(), MagicMock())
+    assert not uc.suporta_lote
+    assert RevisarSecaoUseCase(
+        _AgenteLote(), MagicMock(), MagicMock()
+    ).suporta_lote
+
+    use_case = _criar_use_case([agente])
+    asyncio.run(
+        use_case._revisar_secoes(
+            texto_md, {"tokens_lote_revisao": 1000}
+        )
+    )
+    assert agente.lotes == []
+
+
+def test_revisao_encerra_quando_texto_nao_muda(texto_md):
+    from src.application.use_cases.revisar_secao.revisar_secao_use_case import (  # noqa: E501
+        RevisarSecaoUseCase,
+    )
+    from src.core.entities.erro import Erro
+    from src.core.enums.tipo_erro import TipoErro
+
+    chamadas = []
+
+    async def processar(secao, config):
+        chamadas.append(config["texto_entrada"])
+        revisao = Revisao(
+            numero_iteracao=0,
+            texto_entrada=config["texto_entrada"],
+            texto_saida=config["texto_entrada"],
+            agente="revisor",
+        )
+        revisao.adicionar_erro(
+            Erro(
+                tipo=TipoErro.GRAMATICAL,
+                descricao="d",
+                trecho_original="t",
+                sugestao_correcao="s",
+            )
+        )
+        return revisao
+
+    agente = MagicMock()
+    agente.obter_nome.return_value = "revisor"
+    agente.processar = processar
+    config_repo = MagicMock()
+    config_repo.carregar_configuracao.return_value = {}
+    uc = RevisarSecaoUseCase(agente, config_repo, MagicMock())
+
+    saida = asyncio.run(uc.executar(texto_md.secoes[0], texto_md))
+
+    assert len(chamadas) == 1
+    assert saida.convergiu
+
+
+def test_titulos_repetidos_recebem_sufixo(texto_md):
+    from unittest.mock import AsyncMock
+
+    from src.core.interfaces.services.i_pdf_processor import (
+        SecaoDetectada,
+    )
+
+    texto_md.secoes.clear()
+    use_case = _criar_use_case([])
+    use_case._pdf_processor.extrair_texto = AsyncMock(return_value="x")
+
+    async def detectar(texto, numero_paginas):
+        for t in ("A", "A", "A (2)", "A", "B"):
+            yield SecaoDetectada(
+                titulo=t, conteudo="c", pagina_inicio=1, pagina_fim=1
+            )
+
+    use_case._pdf_processor.detectar_secoes_stream = detectar
+
+    async def _coletar():
+        return [s.titulo async for s in use_case._extrair_secoes(texto_md)]
+
+    assert asyncio.run(_coletar()) == [
+        "A", "A (2)", "A (2) (2)", "A (3)", "B",
+    ]
+
+
+def test_extracao_reaproveita_hash_do_documento(texto_md):
+    from unittest.mock import AsyncMock
+
+    texto_md.secoes.clear()
+    texto_md.numero_paginas = 1
+    texto_md.calcular_hash()
+    use_case = _criar_use_case([])
+    use_case._pdf_processor.extrair_texto = AsyncMock(return_value="x")
+
+    async def _coletar():
+        return [
+            s async for s in use_case._extrair_texto_completo(texto_md)
+        ]
+
+    asyncio.run(_coletar())
+    use_case._pdf_processor.extrair_texto.assert_awaited_once_with(
+        texto_md.caminho_arquivo,
+        hash_arquivo=texto_md.hash_arquivo,
+    )
+
+
+def test_validacao_comeca_antes_do_fim_das_revisoes(texto_md):
+    eventos = []
+    agente = MagicMock()
+    agente.obter_nome.return_value = "revisor"
+
+    async def processar(secao, config):
+        if secao.titulo == "Seção 3":
+            await asyncio.sleep(0.05)
+        eventos.append(f"revisada {secao.titulo}")
+        return Revisao(
+            numero_iteracao=0,
+            texto_entrada=secao.conteudo_original,
+            agente="revisor",
+        )
+
+    async def validar(secao, config):
+        eventos.append(f"validada {secao.titulo}")
+
+    async def verificar(texto):
+        eventos.append("consistencia")
+        return {"resultado": "ok"}
+
+    agente.processar = processar
+    callback = MagicMock()
+    use_case = _criar_use_case([agente], callback)
+    use_case._agente_validador = MagicMock()
+    use_case._agente_validador.processar = validar
+    use_case._uc_consistencia = MagicMock()
+    use_case._uc_consistencia.executar = verificar
+
+    asyncio.run(
+        use_case._revisar_e_validar(
+            texto_md, {}, "", use_case._iterar(texto_md.secoes)
+        )
+    )
+
+    fim_revisoes = eventos.index("revisada Seção 3")
+    assert eventos.index("validada Seção 1") < fim_revisoes
+    assert eventos.index("consistencia") > fim_revisoes
+    assert "validada Seção 3" in eventos
+    percentuais = [
+        c.args[0].percentual for c in callback.call_args_list
+    ]
+    assert percentuais == sorted(percentuais)
+    assert percentuais[-1] == 78
+
+
+def test_progresso_repetido_e_limitado():
+    callback = MagicMock()
+    execucao = _ContextoExecucao(callback_progresso=callback)
+
+    execucao.notificar("revisao", 20, "Seção 1")
+    execucao.notificar("revisao", 20, "Seção 2")
+    execucao.notificar("revisao", 20, "━━━ FIM: Revisão")
+    execucao.notificar("revisao", 30, "Seção 3")
+
+    # Nenhuma mensagem se perde; só a repintura é limitada
+    assert [
+        (c.args[0].mensagem, c.args[0].somente_log)
+        for c in callback.call_args_list
+    ] == [
+        ("Seção 1", False),
+        ("Seção 2", True),
+        ("━━━ FIM: Revisão", False),
+        ("Seção 3", False),
+    ]
+
+
+def test_resposta_truncada_repete_com_mais_tokens(texto_md):
+    from src.application.use_cases.revisar_secao.revisar_secao_use_case import (  # noqa: E501
+        RevisarSecaoUseCase,
+    )
+    from src.core.exceptions.agent_exceptions import (
+        InvalidResponseException,
+    )
+
+    limites = []
+
+    async def processar(secao, config):
+        limites.append(config["max_tokens"])
+        if config["max_tokens"] < 8192:
+            raise InvalidResponseException("JSON truncado")
+        return Revisao(
+            numero_iteracao=0,
+            texto_entrada=config["texto_entrada"],
+            agente="revisor",
+        )
+
+    agente = MagicMock()
+    agente.obter_nome.return_value = "revisor"
+    agente.processar = processar
+    config_repo = MagicMock()
+    config_repo.carregar_prompt.return_value = None
+    config_repo.carregar_configuracao.return_value = {}
+    uc = RevisarSecaoUseCase(agente, config_repo, MagicMock())
+
+    saida = asyncio.run(uc.executar(texto_md.secoes[0], texto_md))
+
+    assert limites == [4096, 8192]
+    assert saida.convergiu
+    assert [r.numero_iteracao for r in texto_md.secoes[0].revisoes] == [1]
+    agente._gateway.limpar_cache.assert_not_called()
+
+
+def test_consistencia_em_lote_preserva_ordem(texto_md):
+    from src.application.use_cases.verificar_consistencia.verificar_consistencia_use_case import (  # noqa: E501
+        VerificarConsistenciaUseCase,
+    )
+
+    ativas = []
+    pico = []
+    agente = MagicMock()
+
+    async def gerar_sintese(contexto):
+        ativas.append(1)
+        pico.append(len(ativas))
+        await asyncio.sleep(0.01)
+        ativas.pop()
+        return contexto["texto_nome"]
+
+    agente.gerar_sintese = gerar_sintese
+    outro = TextoEstruturado(
+        caminho_arquivo=texto_md.caminho_arquivo,
+        nome_arquivo="outro.md",
+        tamanho_bytes=20,
+    )
+    uc = VerificarConsistenciaUseCase(agente, MagicMock())
+
+    resultados = asyncio.run(uc.executar_lote([texto_md, outro]))
+
+    assert [r["resultado"] for r in resultados] == [
+        "texto.md",
+        "outro.md",
+    ]
+    assert max(pico) == 2
+
+
+def test_consistencia_reutiliza_analise_do_mesmo_conteudo(texto_md):
+    from src.application.use_cases.verificar_consistencia.verificar_consistencia_use_case import (  # noqa: E501
+        VerificarConsistenciaUseCase,
+    )
+
+    chamadas = []
+    agente = MagicMock()
+
+    async def gerar_sintese(contexto):
+        chamadas.append(contexto)
+        return "ok"
+
+    agente.gerar_sintese = gerar_sintese
+    uc = VerificarConsistenciaUseCase(agente, MagicMock())
+
+    asyncio.run(uc.executar(texto_md))
+    asyncio.run(uc.executar(texto_md))
+    assert len(chamadas) == 1
+
+    texto_md.secoes[0].conteudo_original = "Conteúdo alterado."
+    assert asyncio.run(uc.executar(texto_md))["resultado"] == "ok"
+    assert len(chamadas) == 2
@@ -115,3 +115,7 @@ class TestMetricasRevisao:
             tempo_processamento_seg=5.0,
         )
         assert m.erros_por_tipo["gramatical"] == 2
+        assert m.erros_por_tipo["omissao"] == 0
+        assert m.to_dict()["erros_por_tipo"] == {
+            "gramatical": 2, "tecnico": 1,
+        }